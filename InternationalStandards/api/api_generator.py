@@ -11,16 +11,26 @@ Author: Autonomous AI Development System
 
 import json
 import logging
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from pathlib import Path
 from dataclasses import dataclass, asdict
 import re
 import hashlib
+import itertools
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from decimal import Decimal
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode
 
 # Web framework imports
 try:
-    from flask import Flask, jsonify, request, abort, make_response
+    from flask import Flask, jsonify, request, abort, make_response, Response, stream_with_context
     from flask_cors import CORS
     from flask_limiter import Limiter
     from flask_limiter.util import get_remote_address
@@ -31,7 +41,9 @@ except ImportError:
 try:
     from fastapi import FastAPI, HTTPException, Depends, Query
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, StreamingResponse, Response as FastAPIResponse
+    from starlette.concurrency import run_in_threadpool
+    from starlette.routing import Match
     import uvicorn
     HAS_FASTAPI = True
 except ImportError:
@@ -42,6 +54,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from data.database_manager import DatabaseManager, DatabaseConfig
+from data.async_database_manager import AsyncDatabaseManager
 
 @dataclass
 class APIEndpoint:
@@ -66,9 +79,49 @@ class APIResponse:
     meta: Optional[Dict[str, Any]] = None
     errors: Optional[List[str]] = None
 
+class ResponseCache:
+    """LRU cache of serialized GET response bodies tagged with the data version
+    
+    An entry is served only while the data version it was rendered at is
+    still current and it is younger than its endpoint's cache_duration.
+    """
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (data_version, stored_at, body)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, data_version: str, ttl: int) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            version, stored_at, body = entry
+            if version != data_version or time.time() - stored_at > ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+    
+    def put(self, key: str, data_version: str, body: bytes):
+        with self._lock:
+            self._entries[key] = (data_version, time.time(), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
 class APIGenerator:
     """Automated API generator for standards data"""
     
+    RESPONSE_CACHE_MAX_ENTRIES = 512
+    
     def __init__(self, database_manager: DatabaseManager, 
                  framework: str = "flask", host: str = "0.0.0.0", port: int = 5000):
         """Initialize API generator
@@ -99,19 +152,32 @@ class APIGenerator:
         # Initialize web framework
         self.app = None
         self.limiter = None
+        self.async_db = None
+        self.response_cache = ResponseCache(self.RESPONSE_CACHE_MAX_ENTRIES)
         self._initialize_framework()
         
+        # Composite index for keyset pagination of standards
+        self.db.ensure_pagination_indexes()
+        
         # Generate standard endpoints
         self.endpoints = self._generate_standard_endpoints()
         self._register_endpoints()
         
+        # Response cache lifetime per route template, from each endpoint's cache_duration
+        self.cache_durations = {
+            self._route_template(endpoint.path): endpoint.cache_duration
+            for endpoint in self.endpoints if endpoint.method == "GET"
+        }
+        
         # API statistics
         self.api_stats = {
             'total_requests': 0,
             'successful_requests': 0,
             'failed_requests': 0,
             'avg_response_time': 0.0,
-            'endpoints_registered': len(self.endpoints)
+            'endpoints_registered': len(self.endpoints),
+            'response_cache_hits': 0,
+            'not_modified_responses': 0
         }
         
         self.logger.info(f"API Generator initialized with {framework} framework")
@@ -158,13 +224,52 @@ class APIGenerator:
                 duration = (datetime.now() - request.start_time).total_seconds()
                 self._update_response_stats(response.status_code, duration)
             return response
+        
+        # Conditional requests and response cache
+        @self.app.before_request
+        def serve_cached_response():
+            request.cache_context = None
+            if request.method != 'GET' or request.url_rule is None:
+                return None
+            
+            context = self._response_cache_context(request.url_rule.rule, request.path, request.query_string.decode('latin-1'))
+            if context is None:
+                return None
+            request.cache_context = context
+            
+            if self._is_not_modified(context, request.headers.get('If-None-Match'),
+                                     request.headers.get('If-Modified-Since')):
+                return Response(status=304, headers=self._validator_headers(context))
+            
+            body = self.response_cache.get(context['key'], context['version'], context['ttl'])
+            if body is not None:
+                self.api_stats['response_cache_hits'] += 1
+                request.cache_context = None
+                return Response(body, status=200, mimetype='application/json',
+                                headers=self._validator_headers(context))
+            return None
+        
+        @self.app.after_request
+        def store_cached_response(response):
+            context = getattr(request, 'cache_context', None)
+            if context and response.status_code == 200 and not response.is_streamed:
+                self.response_cache.put(context['key'], context['version'], response.get_data())
+                response.headers.extend(self._validator_headers(context))
+            return response
     
     def _initialize_fastapi(self):
         """Initialize FastAPI application"""
+        # Async driver keeps queries off the event loop; without one, handlers run in a thread pool
+        try:
+            self.async_db = AsyncDatabaseManager(self.db)
+        except ImportError as e:
+            self.logger.warning(f"Async database driver unavailable, using thread pool: {e}")
+        
         self.app = FastAPI(
             title=self.api_config['title'],
             version=self.api_config['version'],
-            description=self.api_config['description']
+            description=self.api_config['description'],
+            lifespan=self._fastapi_lifespan
         )
         
         # Add CORS middleware
@@ -176,6 +281,40 @@ class APIGenerator:
             allow_headers=["*"],
         )
         
+        # Conditional requests and response cache; added before logging so logging wraps it
+        @self.app.middleware("http")
+        async def serve_cached_response(request, call_next):
+            if request.method != 'GET':
+                return await call_next(request)
+            
+            route = next((r for r in self.app.router.routes
+                          if r.matches(request.scope)[0] == Match.FULL), None)
+            context = route and self._response_cache_context(
+                route.path, request.url.path, request.url.query
+            )
+            if not context:
+                return await call_next(request)
+            
+            if self._is_not_modified(context, request.headers.get('if-none-match'),
+                                     request.headers.get('if-modified-since')):
+                return FastAPIResponse(status_code=304, headers=self._validator_headers(context))
+            
+            body = self.response_cache.get(context['key'], context['version'], context['ttl'])
+            if body is not None:
+                self.api_stats['response_cache_hits'] += 1
+                return FastAPIResponse(body, media_type='application/json',
+                                       headers=self._validator_headers(context))
+            
+            response = await call_next(request)
+            if response.status_code != 200:
+                return response
+            
+            body = b''.join([chunk async for chunk in response.body_iterator])
+            self.response_cache.put(context['key'], context['version'], body)
+            headers = dict(response.headers)
+            headers.update(self._validator_headers(context))
+            return FastAPIResponse(body, status_code=200, headers=headers)
+        
         # Add request logging middleware
         @self.app.middleware("http")
         async def log_requests(request, call_next):
@@ -189,6 +328,76 @@ class APIGenerator:
             
             return response
     
+    @asynccontextmanager
+    async def _fastapi_lifespan(self, app):
+        """Close the async connection pool on shutdown"""
+        yield
+        if self.async_db:
+            await self.async_db.close()
+    
+    # ==============================================================================
+    # RESPONSE CACHING AND CONDITIONAL REQUESTS
+    # ==============================================================================
+    
+    @staticmethod
+    def _route_template(path: str) -> str:
+        """Normalize Flask (<int:id>) and FastAPI ({id}) route syntax to {id}"""
+        return re.sub(r'<(?:[^:<>]+:)?([^<>]+)>', r'{\1}', path)
+    
+    def _response_cache_context(self, route: str, path: str, query_string: str) -> Optional[Dict[str, Any]]:
+        """Cache key and validators for a GET request, or None if the route is not cacheable
+        
+        The data version only moves on writes seen by this process, so
+        validators also roll over every cache_duration seconds: a client
+        revalidating after another process wrote gets a fresh body within
+        one cache_duration.
+        """
+        ttl = self.cache_durations.get(self._route_template(route), 0)
+        if ttl <= 0:
+            return None
+        
+        query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+        key = f"{path}?{query}"
+        version, modified = self.db.get_data_version()
+        ttl_epoch = int(time.time() // ttl)
+        etag = hashlib.sha256(f"{version}|{ttl_epoch}|{key}".encode('utf-8')).hexdigest()[:24]
+        
+        return {
+            'key': key,
+            'ttl': ttl,
+            'version': version,
+            'etag': f'W/"{etag}"',
+            'last_modified': int(max(modified, ttl_epoch * ttl))
+        }
+    
+    def _is_not_modified(self, context: Dict[str, Any], if_none_match: Optional[str],
+                         if_modified_since: Optional[str]) -> bool:
+        """Evaluate If-None-Match (weak comparison) or, failing that, If-Modified-Since"""
+        if if_none_match:
+            opaque = lambda tag: tag.strip()[2:] if tag.strip().startswith('W/') else tag.strip()
+            tags = [opaque(tag) for tag in if_none_match.split(',')]
+            not_modified = '*' in tags or opaque(context['etag']) in tags
+        elif if_modified_since:
+            try:
+                not_modified = context['last_modified'] <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                not_modified = False
+        else:
+            not_modified = False
+        
+        if not_modified:
+            self.api_stats['not_modified_responses'] += 1
+        return not_modified
+    
+    @staticmethod
+    def _validator_headers(context: Dict[str, Any]) -> Dict[str, str]:
+        """ETag / Last-Modified headers; no-cache makes clients revalidate on every poll"""
+        return {
+            'ETag': context['etag'],
+            'Last-Modified': formatdate(context['last_modified'], usegmt=True),
+            'Cache-Control': 'no-cache'
+        }
+    
     def _generate_standard_endpoints(self) -> List[APIEndpoint]:
         """Generate standard API endpoints for the system
         
@@ -200,13 +409,13 @@ class APIGenerator:
             APIEndpoint(
                 path="/api/v1/info",
                 description="Get API information and statistics",
-                cache_duration=300
+                cache_duration=0  # live statistics
             ),
             
             APIEndpoint(
                 path="/api/v1/health",
                 description="Health check endpoint",
-                cache_duration=60
+                cache_duration=0  # must reflect the current database state
             ),
             
             # Discipline endpoints
@@ -238,7 +447,8 @@ class APIGenerator:
                     {"name": "education_level", "type": "string", "description": "Filter by education level"},
                     {"name": "min_confidence", "type": "float", "description": "Minimum confidence score"},
                     {"name": "limit", "type": "integer", "description": "Maximum number of results", "default": 100},
-                    {"name": "offset", "type": "integer", "description": "Result offset for pagination", "default": 0}
+                    {"name": "cursor", "type": "string", "description": "Opaque next_cursor from the previous page"},
+                    {"name": "offset", "type": "integer", "description": "Result offset (deprecated, use cursor)", "default": 0}
                 ],
                 cache_duration=1800
             ),
@@ -249,6 +459,19 @@ class APIGenerator:
                 cache_duration=3600
             ),
             
+            APIEndpoint(
+                path="/api/v1/disciplines/<int:discipline_id>/standards/export",
+                description="Stream all standards for a discipline as NDJSON",
+                parameters=[
+                    {"name": "format", "type": "string", "description": "ndjson or ndjson.gz", "default": "ndjson"},
+                    {"name": "standard_type", "type": "string", "description": "Filter by standard type"},
+                    {"name": "min_confidence", "type": "float", "description": "Minimum confidence score", "default": 0.0}
+                ],
+                response_format="ndjson",
+                cache_duration=0,
+                rate_limit="20/hour"
+            ),
+            
             APIEndpoint(
                 path="/api/v1/disciplines/<int:discipline_id>/standards",
                 description="Get standards for a specific discipline",
@@ -389,7 +612,16 @@ class APIGenerator:
         @self.app.route('/api/v1/standards', methods=['GET'])
         @self.limiter.limit("1000/hour")
         def get_standards():
-            return self._handle_request(self._get_standards_handler)
+            params = {
+                'discipline_id': request.args.get('discipline_id', type=int),
+                'standard_type': request.args.get('standard_type'),
+                'education_level': request.args.get('education_level'),
+                'min_confidence': request.args.get('min_confidence', 0.0, type=float),
+                'limit': request.args.get('limit', 100, type=int),
+                'offset': request.args.get('offset', 0, type=int),
+                'cursor': request.args.get('cursor')
+            }
+            return self._handle_request(self._get_standards_handler, **params)
         
         @self.app.route('/api/v1/standards/<int:standard_id>', methods=['GET'])
         @self.limiter.limit("1000/hour")
@@ -401,6 +633,28 @@ class APIGenerator:
         def get_discipline_standards(discipline_id):
             return self._handle_request(self._get_discipline_standards_handler, discipline_id)
         
+        @self.app.route('/api/v1/disciplines/<int:discipline_id>/standards/export', methods=['GET'])
+        @self.limiter.limit("20/hour")
+        def export_discipline_standards(discipline_id):
+            try:
+                chunks, media_type, filename = self._export_standards_handler(
+                    discipline_id,
+                    export_format=request.args.get('format', 'ndjson'),
+                    standard_type=request.args.get('standard_type'),
+                    min_confidence=request.args.get('min_confidence', 0.0, type=float)
+                )
+            except ValueError as e:
+                return self._create_error_response(str(e), 400)
+            except Exception as e:
+                self.logger.error(f"Export handler error: {e}")
+                return self._create_error_response(str(e), 500)
+            
+            return Response(
+                stream_with_context(chunks),
+                mimetype=media_type,
+                headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+            )
+        
         # Competency endpoints
         @self.app.route('/api/v1/competencies', methods=['GET'])
         @self.limiter.limit("1000/hour")
@@ -444,20 +698,20 @@ class APIGenerator:
         
         @self.app.get("/api/v1/health")
         async def health_check():
-            return await self._handle_async_request(self._health_check_handler)
+            return await self._handle_async_request(self._health_check_async_handler)
         
         # Discipline endpoints
         @self.app.get("/api/v1/disciplines")
         async def get_disciplines():
-            return await self._handle_async_request(self._get_disciplines_handler)
+            return await self._handle_async_request(self._get_disciplines_async_handler)
         
         @self.app.get("/api/v1/disciplines/{discipline_id}")
         async def get_discipline(discipline_id: int):
-            return await self._handle_async_request(self._get_discipline_handler, discipline_id)
+            return await self._handle_async_request(self._get_discipline_async_handler, discipline_id)
         
         @self.app.get("/api/v1/disciplines/{discipline_id}/summary")
         async def get_discipline_summary(discipline_id: int):
-            return await self._handle_async_request(self._get_discipline_summary_handler, discipline_id)
+            return await self._handle_async_request(self._get_discipline_summary_async_handler, discipline_id)
         
         # Standards endpoints  
         @self.app.get("/api/v1/standards")
@@ -467,7 +721,8 @@ class APIGenerator:
             education_level: Optional[str] = Query(None),
             min_confidence: float = Query(0.0),
             limit: int = Query(100),
-            offset: int = Query(0)
+            offset: int = Query(0),
+            cursor: Optional[str] = Query(None)
         ):
             params = {
                 'discipline_id': discipline_id,
@@ -475,9 +730,39 @@ class APIGenerator:
                 'education_level': education_level,
                 'min_confidence': min_confidence,
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'cursor': cursor
             }
-            return await self._handle_async_request(self._get_standards_handler, **params)
+            return await self._handle_async_request(self._get_standards_async_handler, **params)
+        
+        @self.app.get("/api/v1/disciplines/{discipline_id}/standards/export")
+        async def export_discipline_standards(
+            discipline_id: int,
+            format: str = Query("ndjson"),
+            standard_type: Optional[str] = Query(None),
+            min_confidence: float = Query(0.0)
+        ):
+            try:
+                # The first batch is fetched eagerly, so keep it off the event loop
+                chunks, media_type, filename = await run_in_threadpool(
+                    self._export_standards_handler,
+                    discipline_id,
+                    export_format=format,
+                    standard_type=standard_type,
+                    min_confidence=min_confidence
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error(f"Export handler error: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+            
+            # StreamingResponse iterates sync generators in a worker thread
+            return StreamingResponse(
+                chunks,
+                media_type=media_type,
+                headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+            )
         
         # Additional FastAPI endpoints would follow similar pattern...
     
@@ -500,16 +785,28 @@ class APIGenerator:
             self.api_stats['successful_requests'] += 1
             return jsonify(asdict(response))
             
+        except ValueError as e:
+            # Invalid client input such as a malformed cursor or date
+            self.api_stats['failed_requests'] += 1
+            return self._create_error_response(str(e), 400)
+            
         except Exception as e:
             self.api_stats['failed_requests'] += 1
             self.logger.error(f"Request handler error: {e}")
             return self._create_error_response(str(e), 500)
     
     async def _handle_async_request(self, handler, *args, **kwargs):
-        """Handle FastAPI request with standardized response format"""
+        """Handle FastAPI request with standardized response format
+        
+        Coroutine handlers are awaited; plain handlers run in the thread pool
+        so blocking database calls never stall the event loop.
+        """
         try:
             start_time = datetime.now()
-            result = handler(*args, **kwargs)
+            if asyncio.iscoroutinefunction(handler):
+                result = await handler(*args, **kwargs)
+            else:
+                result = await run_in_threadpool(handler, *args, **kwargs)
             
             response = APIResponse(
                 success=True,
@@ -524,6 +821,16 @@ class APIGenerator:
             self.api_stats['successful_requests'] += 1
             return asdict(response)
             
+        except ValueError as e:
+            # Invalid client input such as a malformed cursor or date
+            self.api_stats['failed_requests'] += 1
+            raise HTTPException(status_code=400, detail=str(e))
+            
+        except asyncio.TimeoutError:
+            self.api_stats['failed_requests'] += 1
+            self.logger.error(f"Async request handler timed out: {handler.__name__}")
+            raise HTTPException(status_code=504, detail="Database query timed out")
+            
         except Exception as e:
             self.api_stats['failed_requests'] += 1
             self.logger.error(f"Async request handler error: {e}")
@@ -539,7 +846,8 @@ class APIGenerator:
             **self.api_config,
             'statistics': self.api_stats,
             'endpoints_count': len(self.endpoints),
-            'database_stats': self.db.get_connection_stats()
+            'database_stats': self.db.get_connection_stats(),
+            'async_database_stats': self.async_db.get_connection_stats() if self.async_db else None
         }
     
     def _health_check_handler(self):
@@ -547,28 +855,61 @@ class APIGenerator:
         try:
             # Test database connection
             disciplines = self.db.get_all_disciplines()
-            db_healthy = len(disciplines) >= 0
-            
-            return {
-                'status': 'healthy' if db_healthy else 'unhealthy',
-                'timestamp': datetime.now().isoformat(),
-                'database_connection': 'ok' if db_healthy else 'failed',
-                'api_version': self.api_config['version']
-            }
+            return self._health_check_response(disciplines)
+        except Exception as e:
+            return self._health_check_response(None, e)
+    
+    async def _health_check_async_handler(self):
+        """Handle health check request on the async driver"""
+        try:
+            disciplines = await self._async_db_call('get_all_disciplines')
+            return self._health_check_response(disciplines)
         except Exception as e:
+            return self._health_check_response(None, e)
+    
+    def _health_check_response(self, disciplines: Optional[List[Dict[str, Any]]],
+                               error: Optional[Exception] = None):
+        """Build the health check payload"""
+        if error is not None:
             return {
                 'status': 'unhealthy',
                 'timestamp': datetime.now().isoformat(),
-                'error': str(e)
+                'error': str(error)
             }
+        
+        db_healthy = len(disciplines) >= 0
+        
+        return {
+            'status': 'healthy' if db_healthy else 'unhealthy',
+            'timestamp': datetime.now().isoformat(),
+            'database_connection': 'ok' if db_healthy else 'failed',
+            'api_version': self.api_config['version']
+        }
+    
+    async def _async_db_call(self, method: str, *args, **kwargs):
+        """Call a DatabaseManager read method without blocking the event loop"""
+        if self.async_db:
+            return await getattr(self.async_db, method)(*args, **kwargs)
+        return await run_in_threadpool(getattr(self.db, method), *args, **kwargs)
     
     def _get_disciplines_handler(self):
         """Handle get all disciplines request"""
         return self.db.get_all_disciplines()
     
+    async def _get_disciplines_async_handler(self):
+        """Handle get all disciplines request on the async driver"""
+        return await self._async_db_call('get_all_disciplines')
+    
     def _get_discipline_handler(self, discipline_id: int):
         """Handle get specific discipline request"""
-        disciplines = self.db.get_all_disciplines()
+        return self._find_discipline(self.db.get_all_disciplines(), discipline_id)
+    
+    async def _get_discipline_async_handler(self, discipline_id: int):
+        """Handle get specific discipline request on the async driver"""
+        return self._find_discipline(await self._async_db_call('get_all_disciplines'), discipline_id)
+    
+    @staticmethod
+    def _find_discipline(disciplines: List[Dict[str, Any]], discipline_id: int):
         discipline = next((d for d in disciplines if d['discipline_id'] == discipline_id), None)
         
         if not discipline:
@@ -580,45 +921,120 @@ class APIGenerator:
         """Handle discipline summary request"""
         return self.db.get_discipline_summary(discipline_id)
     
+    async def _get_discipline_summary_async_handler(self, discipline_id: int):
+        """Handle discipline summary request on the async driver"""
+        return await self._async_db_call('get_discipline_summary', discipline_id)
+    
     def _get_standards_handler(self, **params):
-        """Handle get standards request with filtering"""
-        discipline_id = params.get('discipline_id')
-        standard_type = params.get('standard_type')
-        education_level = params.get('education_level')
-        min_confidence = params.get('min_confidence', 0.0)
-        limit = params.get('limit', 100)
-        offset = params.get('offset', 0)
-        
-        if discipline_id:
-            standards = self.db.get_standards_by_discipline(
-                discipline_id=discipline_id,
-                standard_type=standard_type,
-                min_confidence=min_confidence,
-                limit=limit
-            )
-        else:
-            # Get standards across all disciplines (would need implementation)
-            standards = []
-        
-        # Apply offset for pagination
-        if offset > 0:
-            standards = standards[offset:]
+        """Handle get standards request with filtering and keyset pagination"""
+        query = self._standards_page_params(params)
+        return self._standards_page_response(self.db.get_standards_page(**query), query)
+    
+    async def _get_standards_async_handler(self, **params):
+        """Handle get standards request on the async driver"""
+        query = self._standards_page_params(params)
+        return self._standards_page_response(await self._async_db_call('get_standards_page', **query), query)
+    
+    @staticmethod
+    def _standards_page_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize request parameters into get_standards_page arguments"""
+        return {
+            'discipline_id': params.get('discipline_id'),
+            'standard_type': params.get('standard_type'),
+            'education_level': params.get('education_level'),
+            'min_confidence': params.get('min_confidence') or 0.0,
+            'limit': params.get('limit') or 100,
+            'cursor': params.get('cursor'),
+            'offset': params.get('offset') or 0
+        }
+    
+    @staticmethod
+    def _standards_page_response(page: Dict[str, Any], query: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a get_standards_page result into the standards response"""
+        standards = page['standards']
+        cursor = query['cursor']
         
         return {
             'standards': standards,
             'total_count': len(standards),
             'filters_applied': {
-                'discipline_id': discipline_id,
-                'standard_type': standard_type,
-                'education_level': education_level,
-                'min_confidence': min_confidence
+                'discipline_id': query['discipline_id'],
+                'standard_type': query['standard_type'],
+                'education_level': query['education_level'],
+                'min_confidence': query['min_confidence']
             },
             'pagination': {
-                'limit': limit,
-                'offset': offset
+                'limit': page['limit'],
+                'offset': query['offset'] if not cursor else None,
+                'cursor': cursor,
+                'next_cursor': page['next_cursor'],
+                'has_more': page['next_cursor'] is not None
             }
         }
     
+    EXPORT_FORMATS = {
+        'ndjson': 'application/x-ndjson',
+        'ndjson.gz': 'application/gzip'
+    }
+    
+    def _export_standards_handler(self, discipline_id: int, export_format: str = 'ndjson',
+                                  standard_type: Optional[str] = None,
+                                  min_confidence: float = 0.0):
+        """Handle streaming export of a discipline's standards
+        
+        The first batch is fetched before returning so query errors still
+        produce an error status instead of a truncated 200 stream.
+        
+        Returns:
+            (chunk iterator, media type, download filename)
+        """
+        if export_format not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{export_format}', "
+                             f"expected one of {sorted(self.EXPORT_FORMATS)}")
+        
+        batches = self.db.iter_standards_export(
+            discipline_id=discipline_id,
+            standard_type=standard_type,
+            min_confidence=min_confidence or 0.0
+        )
+        first_batch = next(batches, None)
+        if first_batch is not None:
+            batches = itertools.chain([first_batch], batches)
+        else:
+            batches = iter(())
+        
+        filename = f"discipline_{discipline_id}_standards.{export_format}"
+        chunks = self._iter_ndjson(batches, compress=export_format.endswith('.gz'))
+        return chunks, self.EXPORT_FORMATS[export_format], filename
+    
+    def _iter_ndjson(self, batches, compress: bool = False):
+        """Encode row batches as NDJSON bytes, one chunk per batch, optionally gzipped"""
+        compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 writes a gzip container
+        row_count = 0
+        
+        for batch in batches:
+            chunk = ''.join(json.dumps(row, default=self._json_default) + '\n' for row in batch).encode('utf-8')
+            row_count += len(batch)
+            if compressor:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield chunk
+        
+        if compressor:
+            yield compressor.flush()
+        
+        self.logger.info(f"Exported {row_count} rows as NDJSON{' (gzip)' if compress else ''}")
+    
+    @staticmethod
+    def _json_default(value):
+        """JSON encoder fallback for database values"""
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value)
+    
     def _get_standard_handler(self, standard_id: int):
         """Handle get specific standard request"""
         # Would need implementation in database_manager
@@ -772,7 +1188,7 @@ class APIGenerator:
     
     def _update_response_stats(self, status_code: int, duration: float):
         """Update API response statistics"""
-        if 200 <= status_code < 300:
+        if 200 <= status_code < 300 or status_code == 304:
             self.api_stats['successful_requests'] += 1
         else:
             self.api_stats['failed_requests'] += 1
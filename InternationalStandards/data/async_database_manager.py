@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Async Database Manager for International Standards Retrieval System
+
+Non-blocking counterpart of DatabaseManager for asyncio servers such as the
+FastAPI frontend. Queries run on asyncpg (PostgreSQL) or aiosqlite (SQLite)
+connection pools, so a slow query suspends its request instead of the event
+loop. SQL, the query result cache and statistics are shared with the
+DatabaseManager it wraps.
+
+Author: Autonomous AI Development System
+"""
+
+import re
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.database_manager import DatabaseManager, DatabaseConfig, SQLiteConnectionPool, QueryResultCache
+
+# Async database drivers
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
+
+try:
+    import aiosqlite
+    HAS_AIOSQLITE = True
+except ImportError:
+    HAS_AIOSQLITE = False
+
+class AsyncSQLiteConnectionPool:
+    """Bounded pool of tuned aiosqlite connections
+    
+    Async twin of SQLiteConnectionPool: connections are opened lazily up to
+    maxconn with the same PRAGMAs, and callers wait for a free connection
+    instead of opening more.
+    """
+    
+    def __init__(self, maxconn: int, database_path: str, config: DatabaseConfig):
+        """Initialize async SQLite connection pool
+        
+        Args:
+            maxconn: Maximum number of open connections
+            database_path: SQLite database file path
+            config: Database configuration with SQLite tuning parameters
+        """
+        self.database_path = database_path
+        self.config = config
+        self.maxconn = 1 if database_path == ":memory:" else max(1, maxconn)
+        
+        self._pool = []
+        self._opened = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+    
+    async def _connect(self):
+        """Open a new connection with pragmas applied"""
+        conn = await aiosqlite.connect(
+            self.database_path,
+            timeout=self.config.query_timeout,
+            cached_statements=self.config.sqlite_cached_statements
+        )
+        conn.row_factory = aiosqlite.Row
+        
+        for pragma in SQLiteConnectionPool.pragma_statements(self.database_path, self.config):
+            await conn.execute(pragma)
+        return conn
+    
+    async def acquire(self):
+        """Get an idle connection, waiting while all maxconn connections are in use"""
+        async with self._condition:
+            if self._closed:
+                raise RuntimeError("Async SQLite connection pool is closed")
+            
+            while not self._pool and self._opened >= self.maxconn:
+                await self._condition.wait()
+            
+            if self._pool:
+                return self._pool.pop()
+            
+            self._opened += 1
+        
+        try:
+            return await self._connect()
+        except BaseException:
+            async with self._condition:
+                self._opened -= 1
+                self._condition.notify()
+            raise
+    
+    async def release(self, conn, close: bool = False):
+        """Return a connection to the pool
+        
+        Args:
+            conn: Connection obtained from acquire
+            close: Close the connection instead of keeping it
+        """
+        if not close and conn.in_transaction:
+            try:
+                await conn.rollback()
+            except Exception:
+                close = True
+        
+        if close or self._closed:
+            # Interrupt first so close does not wait out a still-running statement
+            await conn.interrupt()
+            try:
+                await conn.close()
+            except Exception:
+                pass
+        
+        async with self._condition:
+            if close or self._closed:
+                self._opened -= 1
+            else:
+                self._pool.append(conn)
+            self._condition.notify()
+    
+    async def close(self):
+        """Close all idle connections and refuse new ones"""
+        async with self._condition:
+            self._closed = True
+            idle, self._pool = self._pool, []
+            self._opened -= len(idle)
+            self._condition.notify_all()
+        
+        for conn in idle:
+            await conn.close()
+    
+    def get_size(self) -> int:
+        return self._opened
+    
+    def get_idle_size(self) -> int:
+        return len(self._pool)
+
+class AsyncDatabaseManager:
+    """Asyncio database manager exposing DatabaseManager's read API
+    
+    Query builders, the query result cache and query statistics come from
+    the wrapped DatabaseManager, so cached results and write invalidations
+    are shared between the sync and async paths. The pool is created on
+    first use inside the running event loop.
+    """
+    
+    PLACEHOLDER_PATTERN = re.compile(r'%s|\?')
+    
+    def __init__(self, database_manager: DatabaseManager):
+        """Initialize async database manager
+        
+        Args:
+            database_manager: Sync manager whose configuration and caches are shared
+        """
+        self.db = database_manager
+        self.config = database_manager.config
+        self.logger = logging.getLogger(__name__)
+        
+        if self.config.database_type == "postgresql" and not HAS_ASYNCPG:
+            raise ImportError("asyncpg is required for async PostgreSQL access")
+        if self.config.database_type == "sqlite" and not HAS_AIOSQLITE:
+            raise ImportError("aiosqlite is required for async SQLite access")
+        
+        self.pool = None
+        self._pool_loop = None
+        self._pool_lock = None
+        
+        self.logger.info(f"AsyncDatabaseManager initialized with {self.config.database_type}")
+    
+    async def _get_pool(self):
+        """Create the connection pool for the running loop (pools cannot cross loops)"""
+        loop = asyncio.get_running_loop()
+        if self.pool is not None and self._pool_loop is loop:
+            return self.pool
+        
+        if self._pool_lock is None or self._pool_loop is not loop:
+            stale, self.pool = self.pool, None
+            self._pool_lock = asyncio.Lock()
+            self._pool_loop = loop
+            if stale is not None:
+                await self._discard_pool(stale)
+        
+        async with self._pool_lock:
+            if self.pool is None:
+                if self.config.database_type == "postgresql":
+                    self.pool = await asyncpg.create_pool(
+                        host=self.config.host,
+                        port=self.config.port,
+                        database=self.config.database,
+                        user=self.config.username,
+                        password=self.config.password,
+                        min_size=1,
+                        max_size=self.config.pool_size,
+                        command_timeout=self.config.query_timeout
+                    )
+                else:
+                    self.pool = AsyncSQLiteConnectionPool(
+                        maxconn=self.config.pool_size,
+                        database_path=self.db.sqlite_path,
+                        config=self.config
+                    )
+                self.logger.info(f"Async {self.config.database_type} connection pool initialized")
+        
+        return self.pool
+    
+    async def _discard_pool(self, pool):
+        """Best-effort shutdown of a pool left behind by a finished event loop"""
+        try:
+            if self.config.database_type == "postgresql":
+                pool.terminate()
+            else:
+                await pool.close()
+        except Exception as e:
+            self.logger.debug(f"Could not close stale async pool: {e}")
+    
+    def _adapt_query(self, query: str) -> str:
+        """Rewrite %s / ? placeholders into the async driver's paramstyle"""
+        if self.config.database_type == "postgresql":
+            counter = iter(range(1, query.count('%s') + query.count('?') + 1))
+            return self.PLACEHOLDER_PATTERN.sub(lambda match: f"${next(counter)}", query)
+        return query.replace('%s', '?')
+    
+    async def execute_query(self, query: str, params: Optional[Tuple] = None,
+                            fetch_results: bool = True, use_cache: bool = True,
+                            timeout: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """Execute database query without blocking the event loop
+        
+        Args:
+            query: SQL query string (%s or ? placeholders)
+            params: Query parameters
+            fetch_results: Whether to fetch and return results
+            use_cache: Whether a SELECT may be answered from (and stored in) the cache
+            timeout: Seconds allowed for pool wait plus execution
+                (defaults to config.async_query_timeout)
+        
+        Returns:
+            Query results or None
+        
+        Raises:
+            asyncio.TimeoutError: The query did not finish within timeout
+        """
+        start_time = datetime.now()
+        timeout = timeout or self.config.async_query_timeout
+        
+        cacheable = (use_cache and fetch_results and self.config.query_cache_enabled and
+                     QueryResultCache.is_cacheable(query))
+        if cacheable:
+            cache_key = QueryResultCache.make_key(query, params)
+            cached_results, tier = self.db.query_cache.get(cache_key)
+            if cached_results is not None:
+                execution_time = (datetime.now() - start_time).total_seconds()
+                self.db._update_query_stats(execution_time, cache_hit=True, cache_tier=tier)
+                return cached_results
+            tables = QueryResultCache.read_tables(query)
+            table_versions = self.db.query_cache.table_versions(tables)
+        
+        try:
+            results = await asyncio.wait_for(
+                self._run_query(self._adapt_query(query), tuple(params or ()), fetch_results),
+                timeout
+            )
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                self.logger.error(f"Async query timed out after {timeout}s")
+            else:
+                self.logger.error(f"Async query execution failed: {e}")
+            with self.db.stats_lock:
+                self.db.query_stats['failed_queries'] += 1
+            raise
+        
+        if cacheable:
+            self.db.query_cache.put(cache_key, tables, table_versions, results)
+        elif QueryResultCache.is_write(query):
+            self.db._invalidate_cache(QueryResultCache.write_tables(query) or None)
+        
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self.db._update_query_stats(execution_time, cache_hit=False, cache_tier='miss' if cacheable else None)
+        
+        return results
+    
+    async def _run_query(self, query: str, params: Tuple, fetch_results: bool):
+        """Run one statement on a pooled connection"""
+        pool = await self._get_pool()
+        
+        if self.config.database_type == "postgresql":
+            async with pool.acquire() as connection:
+                if fetch_results:
+                    return [dict(row) for row in await connection.fetch(query, *params)]
+                await connection.execute(query, *params)
+                return None
+        
+        connection = await pool.acquire()
+        discard = False
+        try:
+            async with connection.execute(query, params) as cursor:
+                results = [dict(row) for row in await cursor.fetchall()] if fetch_results else None
+            if self.config.auto_commit:
+                await connection.commit()
+            return results
+        except asyncio.CancelledError:
+            # The statement may still be running on the connection's thread
+            discard = True
+            raise
+        finally:
+            await pool.release(connection, close=discard)
+    
+    async def close(self):
+        """Close the connection pool"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+    
+    # ==============================================================================
+    # READ API (mirrors DatabaseManager)
+    # ==============================================================================
+    
+    async def get_all_disciplines(self) -> List[Dict[str, Any]]:
+        """Get all active disciplines"""
+        return await self.execute_query(self.db.ALL_DISCIPLINES_QUERY)
+    
+    async def get_standards_by_discipline(self, discipline_id: int,
+                                          standard_type: Optional[str] = None,
+                                          min_confidence: float = 0.0,
+                                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get standards for a discipline"""
+        query, params = self.db._standards_by_discipline_query(discipline_id, standard_type, min_confidence, limit)
+        return await self.execute_query(query, params)
+    
+    async def get_standards_page(self, discipline_id: Optional[int] = None,
+                                 standard_type: Optional[str] = None,
+                                 education_level: Optional[str] = None,
+                                 min_confidence: float = 0.0,
+                                 limit: int = 100,
+                                 cursor: Optional[str] = None,
+                                 offset: int = 0) -> Dict[str, Any]:
+        """Get one page of standards using keyset pagination"""
+        query, params, limit, filters = self.db._standards_page_query(
+            discipline_id, standard_type, education_level, min_confidence, limit, cursor, offset
+        )
+        rows = await self.execute_query(query, params) or []
+        return self.db._standards_page_result(rows, limit, filters)
+    
+    async def get_competencies_by_discipline(self, discipline_id: int,
+                                             competency_category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get competencies for a discipline"""
+        query, params = self.db._competencies_query(discipline_id, competency_category)
+        return await self.execute_query(query, params)
+    
+    async def get_discipline_summary(self, discipline_id: int) -> Dict[str, Any]:
+        """Get comprehensive summary for a discipline"""
+        result = await self.execute_query(self.db.DISCIPLINE_SUMMARY_VIEW_QUERY, (discipline_id,))
+        if result:
+            return result[0]
+        
+        # Fallback to direct calculation, running the counts concurrently
+        keys = list(self.db.DISCIPLINE_SUMMARY_QUERIES)
+        results = await asyncio.gather(*(
+            self.execute_query(self.db.DISCIPLINE_SUMMARY_QUERIES[key], (discipline_id,)) for key in keys
+        ))
+        summary = {'discipline_id': discipline_id}
+        summary.update((key, self.db._stat_value(result)) for key, result in zip(keys, results))
+        return summary
+    
+    async def get_quality_metrics(self, discipline_id: Optional[int] = None,
+                                  start_date: Optional[datetime] = None,
+                                  end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get quality metrics with optional filters"""
+        query, params = self.db._quality_metrics_query(discipline_id, start_date, end_date)
+        return await self.execute_query(query, params)
+    
+    async def get_system_performance_stats(self) -> Dict[str, Any]:
+        """Get overall system performance statistics"""
+        keys = list(self.db.SYSTEM_STATS_QUERIES)
+        results = await asyncio.gather(*(
+            self.execute_query(self.db.SYSTEM_STATS_QUERIES[key]) for key in keys
+        ))
+        stats = {key: self.db._stat_value(result) for key, result in zip(keys, results)}
+        
+        with self.db.stats_lock:
+            stats['query_performance'] = self.db.query_stats.copy()
+        
+        return stats
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get async connection pool statistics"""
+        stats = {
+            'database_type': self.config.database_type,
+            'connection_method': 'async_pool',
+            'pool_size': self.config.pool_size,
+            'query_timeout': self.config.async_query_timeout
+        }
+        if self.pool is not None:
+            stats['connections_open'] = self.pool.get_size()
+            stats['available_connections'] = self.pool.get_idle_size()
+        return stats
@@ -278,31 +278,29 @@ class DataIntegrationManager:
                     changeset_description, discipline_ids
                 )
             
-            # Insert standards in batch
+            # Insert standards with the dialect-aware bulk loader
             standard_ids = self.db_manager.bulk_insert_standards(standards)
             
-            # Track versions if enabled
+            # Track versions if enabled, as one bulk insert rather than a query per standard
             version_ids = []
             if self.version_manager and standard_ids:
-                for standard, standard_id in zip(standards, standard_ids):
-                    if standard_id:
-                        new_values = {
-                            'document_id': standard.document_id,
-                            'discipline_id': standard.discipline_id,
-                            'standard_text': standard.standard_text,
-                            'standard_type': standard.standard_type,
-                            'confidence_score': standard.confidence_score
-                        }
-                        
-                        version_id = self.version_manager.track_change(
-                            table_name='educational_standards',
-                            record_id=standard_id,
-                            change_type=ChangeType.INSERT,
-                            new_values=new_values,
-                            changed_by=changed_by,
-                            discipline_id=standard.discipline_id
-                        )
-                        version_ids.append(version_id)
+                changes = [
+                    (standard_id, {
+                        'document_id': standard.document_id,
+                        'discipline_id': standard.discipline_id,
+                        'standard_text': standard.standard_text,
+                        'standard_type': standard.standard_type,
+                        'confidence_score': standard.confidence_score
+                    }, standard.discipline_id)
+                    for standard, standard_id in zip(standards, standard_ids)
+                    if standard_id
+                ]
+                version_ids = self.version_manager.track_bulk_changes(
+                    table_name='educational_standards',
+                    changes=changes,
+                    change_type=ChangeType.INSERT,
+                    changed_by=changed_by
+                )
             
             # Commit changeset if created
             if changeset_id:
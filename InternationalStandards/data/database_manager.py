@@ -10,22 +10,27 @@ Author: Autonomous AI Development System
 """
 
 import os
+import re
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from collections import OrderedDict
 import hashlib
 import threading
 import pickle
 import time
+import io
+import base64
+import itertools
 from functools import lru_cache
 
 # Database connectivity
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor, Json
+    from psycopg2.extras import RealDictCursor, Json, execute_values
     from psycopg2.pool import ThreadedConnectionPool
     HAS_POSTGRESQL = True
 except ImportError:
@@ -58,6 +63,26 @@ class DatabaseConfig:
     sqlite_path: Optional[str] = None
     auto_commit: bool = True
     query_timeout: int = 300  # 5 minutes
+    # SQLite connection pooling and tuning
+    sqlite_pooling: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 268435456  # 256 MB
+    sqlite_cache_size: int = -65536  # negative = KiB, i.e. 64 MB per connection
+    sqlite_cached_statements: int = 256
+    # Query result cache
+    query_cache_enabled: bool = True
+    query_cache_max_entries: int = 1024
+    # Writes only invalidate the DatabaseManager that made them, so the TTL bounds
+    # how stale reads get after writes from other instances or processes
+    query_cache_ttl: int = 30  # seconds
+    query_cache_disk: bool = False  # persist every cached SELECT, not just persist_cache=True calls
+    # Rows per executemany / execute_values page / COPY batch in bulk_insert
+    bulk_insert_chunk_size: int = 5000
+    # Rows fetched per round trip by iter_query_batches (server-side cursor on PostgreSQL)
+    stream_batch_size: int = 1000
+    # Per-query deadline (pool wait included) for AsyncDatabaseManager
+    async_query_timeout: float = 30.0
 
 @dataclass
 class StandardRecord:
@@ -84,6 +109,341 @@ class CompetencyRecord:
     difficulty_level: int = 1
     metadata: Optional[Dict[str, Any]] = None
 
+class SQLiteConnectionPool:
+    """Bounded pool of tuned SQLite connections
+    
+    Mirrors the psycopg2 ThreadedConnectionPool interface (getconn, putconn,
+    closeall, maxconn) so DatabaseManager treats both backends the same way.
+    Connections are opened lazily up to maxconn and reused, so file open,
+    schema load and page cache warmup are paid once per connection rather
+    than once per query.
+    """
+    
+    def __init__(self, maxconn: int, database_path: str, config: DatabaseConfig):
+        """Initialize SQLite connection pool
+        
+        Args:
+            maxconn: Maximum number of open connections
+            database_path: SQLite database file path
+            config: Database configuration with SQLite tuning parameters
+        """
+        self.database_path = database_path
+        self.config = config
+        
+        # An in-memory database exists per connection, so it must be shared
+        self.maxconn = 1 if database_path == ":memory:" else max(1, maxconn)
+        
+        self._pool = []
+        self._opened = 0
+        self._closed = False
+        self._condition = threading.Condition()
+    
+    def _connect(self):
+        """Open a new connection with pragmas applied"""
+        conn = sqlite3.connect(
+            self.database_path,
+            timeout=self.config.query_timeout,
+            check_same_thread=False,
+            cached_statements=self.config.sqlite_cached_statements
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        
+        for pragma in self.pragma_statements(self.database_path, self.config):
+            conn.execute(pragma)
+        return conn
+    
+    @staticmethod
+    def pragma_statements(database_path: str, config: DatabaseConfig) -> List[str]:
+        """PRAGMAs applied to every pooled SQLite connection"""
+        pragmas = []
+        if database_path != ":memory:":
+            pragmas.append(f"PRAGMA journal_mode={config.sqlite_journal_mode}")
+        pragmas.extend([
+            f"PRAGMA synchronous={config.sqlite_synchronous}",
+            f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}",
+            f"PRAGMA cache_size={int(config.sqlite_cache_size)}",
+            "PRAGMA temp_store=MEMORY"
+        ])
+        return pragmas
+    
+    def getconn(self):
+        """Get an idle connection, opening one if the pool is not full
+        
+        Blocks up to query_timeout seconds when all connections are in use.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SQLite connection pool is closed")
+            
+            deadline = time.monotonic() + self.config.query_timeout
+            while not self._pool and self._opened >= self.maxconn:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise RuntimeError(f"SQLite connection pool exhausted ({self.maxconn} connections)")
+            
+            if self._pool:
+                return self._pool.pop()
+            
+            self._opened += 1
+        
+        try:
+            return self._connect()
+        except Exception:
+            with self._condition:
+                self._opened -= 1
+                self._condition.notify()
+            raise
+    
+    def putconn(self, conn, close: bool = False):
+        """Return a connection to the pool
+        
+        Args:
+            conn: Connection obtained from getconn
+            close: Close the connection instead of keeping it
+        """
+        # Never hand out a connection with a half-finished transaction
+        if not close and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                close = True
+        
+        with self._condition:
+            if close or self._closed:
+                conn.close()
+                self._opened -= 1
+            else:
+                self._pool.append(conn)
+            self._condition.notify()
+    
+    def closeall(self):
+        """Close all idle connections and refuse new ones"""
+        with self._condition:
+            self._closed = True
+            for conn in self._pool:
+                conn.close()
+            self._opened -= len(self._pool)
+            self._pool = []
+            self._condition.notify_all()
+    
+    def get_size(self) -> int:
+        return self._opened
+    
+    def get_idle_size(self) -> int:
+        return len(self._pool)
+
+class QueryResultCache:
+    """Read-through cache for SELECT results with table-level invalidation
+    
+    The memory tier is a bounded LRU; the disk tier pickles results under
+    cache_dir for queries that ask to be persisted. Each entry records the
+    tables its query reads, and a write to any of those tables drops the
+    entry from both tiers. Per-table versions stop a read that raced with a
+    write from caching a result that is already stale. Only writes made
+    through the owning DatabaseManager are seen, so ttl is what bounds
+    staleness after writes from other instances or processes.
+    """
+    
+    READ_TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+([A-Za-z_][\w.]*)', re.IGNORECASE)
+    WRITE_TABLE_PATTERN = re.compile(
+        r'^\s*(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?|'
+        r'(?:CREATE|DROP|ALTER)\s+(?:TABLE|(?:MATERIALIZED\s+)?VIEW)(?:\s+IF\s+(?:NOT\s+)?EXISTS)?|'
+        r'REFRESH\s+MATERIALIZED\s+VIEW(?:\s+CONCURRENTLY)?)\s+([A-Za-z_][\w.]*)',
+        re.IGNORECASE
+    )
+    VOLATILE_PATTERN = re.compile(
+        r'\b(?:RANDOM|NOW|CURRENT_TIMESTAMP|CURRENT_DATE|CURRENT_TIME|CLOCK_TIMESTAMP|NEXTVAL)\b|\bFOR\s+UPDATE\b',
+        re.IGNORECASE
+    )
+    DATA_CHANGE_PATTERN = re.compile(r'\b(?:INSERT|UPDATE|DELETE)\b', re.IGNORECASE)
+    NON_WRITE_PREFIXES = ('PRAGMA', 'EXPLAIN', 'SHOW', 'BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE', 'SET')
+    
+    def __init__(self, max_entries: int, ttl: int, cache_dir: Path, disk_enabled: bool = False):
+        """Initialize query result cache
+        
+        Args:
+            max_entries: Maximum entries in the memory tier
+            ttl: Entry lifetime in seconds for both tiers
+            cache_dir: Directory for the disk tier
+            disk_enabled: Persist every entry, not only those put with persist=True
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.disk_enabled = disk_enabled
+        
+        self._entries = OrderedDict()  # key -> (cached_time, tables, results)
+        self._table_keys = {}  # table -> keys of entries (either tier) that read it
+        self._disk_keys = set()
+        self._table_versions = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _leading_keyword(query: str) -> str:
+        """First SQL keyword of a statement, upper-cased"""
+        match = re.match(r'\s*(\w+)', query)
+        return match.group(1).upper() if match else ''
+    
+    @classmethod
+    def is_cacheable(cls, query: str) -> bool:
+        """Whether query is a deterministic read whose results can be cached"""
+        keyword = cls._leading_keyword(query)
+        if keyword not in ('SELECT', 'WITH'):
+            return False
+        if keyword == 'WITH' and cls.DATA_CHANGE_PATTERN.search(query):
+            return False
+        return not cls.VOLATILE_PATTERN.search(query)
+    
+    @classmethod
+    def is_write(cls, query: str) -> bool:
+        """Whether query may change table contents"""
+        keyword = cls._leading_keyword(query)
+        if keyword == 'SELECT':
+            return False
+        if keyword == 'WITH':
+            return bool(cls.DATA_CHANGE_PATTERN.search(query))
+        return keyword not in cls.NON_WRITE_PREFIXES
+    
+    @classmethod
+    def read_tables(cls, query: str) -> frozenset:
+        """Tables a read query depends on"""
+        return frozenset(name.lower() for name in cls.READ_TABLE_PATTERN.findall(query))
+    
+    @classmethod
+    def write_tables(cls, query: str) -> frozenset:
+        """Tables a write statement modifies; empty if they cannot be determined"""
+        return frozenset(name.lower() for name in cls.WRITE_TABLE_PATTERN.findall(query))
+    
+    @staticmethod
+    def make_key(query: str, params: Optional[Tuple]) -> str:
+        """Cache key from whitespace-normalized SQL and parameters"""
+        normalized = ' '.join(query.split())
+        return hashlib.sha256(f"{normalized}|{params!r}".encode('utf-8')).hexdigest()
+    
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"query_{key}.pkl"
+    
+    def table_versions(self, tables: frozenset) -> Tuple:
+        """Snapshot write versions of tables, taken before running a read"""
+        with self._lock:
+            return tuple(self._table_versions.get(table, 0) for table in sorted(tables))
+    
+    def get(self, key: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """Look up cached results
+        
+        Returns:
+            (results, tier) where tier is 'memory' or 'disk', or (None, None) on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                cached_time, _, results = entry
+                if now - cached_time < self.ttl:
+                    self._entries.move_to_end(key)
+                    return [dict(row) for row in results], 'memory'
+                self._drop_entry(key)
+        
+        disk_path = self._disk_path(key)
+        if not disk_path.exists():
+            return None, None
+        
+        try:
+            with open(disk_path, 'rb') as f:
+                cached_time, tables, results = pickle.load(f)
+        except Exception:
+            return None, None
+        
+        if now - cached_time >= self.ttl:
+            disk_path.unlink(missing_ok=True)
+            return None, None
+        
+        with self._lock:
+            self._store(key, cached_time, tables, results)
+            self._disk_keys.add(key)
+        return [dict(row) for row in results], 'disk'
+    
+    def put(self, key: str, tables: frozenset, versions: Tuple,
+            results: List[Dict[str, Any]], persist: bool = False):
+        """Cache results unless a write touched their tables since versions was taken"""
+        cached_time = time.time()
+        persist = persist or self.disk_enabled
+        
+        with self._lock:
+            current = tuple(self._table_versions.get(table, 0) for table in sorted(tables))
+            if current != versions:
+                return
+            self._store(key, cached_time, tables, results)
+            if persist:
+                self._disk_keys.add(key)
+        
+        if persist:
+            try:
+                with open(self._disk_path(key), 'wb') as f:
+                    pickle.dump((cached_time, tables, results), f)
+            except Exception:
+                with self._lock:
+                    self._disk_keys.discard(key)
+    
+    def _store(self, key: str, cached_time: float, tables: frozenset, results: List[Dict[str, Any]]):
+        """Insert a memory entry and evict least recently used ones (lock held)"""
+        self._entries[key] = (cached_time, tables, results)
+        self._entries.move_to_end(key)
+        for table in tables:
+            self._table_keys.setdefault(table, set()).add(key)
+        
+        while len(self._entries) > self.max_entries:
+            evicted_key, (_, evicted_tables, _) = self._entries.popitem(last=False)
+            # Disk entries keep their dependency tracking so they can still be invalidated
+            if evicted_key not in self._disk_keys:
+                self._untrack(evicted_key, evicted_tables)
+    
+    def _untrack(self, key: str, tables: frozenset):
+        for table in tables:
+            keys = self._table_keys.get(table)
+            if keys:
+                keys.discard(key)
+    
+    def _drop_entry(self, key: str):
+        """Remove an entry from both tiers (lock held)"""
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._untrack(key, entry[1])
+        if key in self._disk_keys:
+            self._disk_keys.discard(key)
+            self._disk_path(key).unlink(missing_ok=True)
+    
+    def invalidate(self, tables: Optional[frozenset] = None) -> int:
+        """Drop entries depending on tables, or everything if tables is None
+        
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if tables is None:
+                dropped = len(set(self._entries) | self._disk_keys)
+                for table in self._table_versions:
+                    self._table_versions[table] += 1
+                # Pickles from earlier runs are not tracked, so sweep the directory
+                for cache_file in self.cache_dir.glob("query_*.pkl"):
+                    cache_file.unlink(missing_ok=True)
+                self._entries.clear()
+                self._table_keys.clear()
+                self._disk_keys.clear()
+                return dropped
+            
+            keys = set()
+            for table in tables:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+                keys |= self._table_keys.pop(table, set())
+            
+            for key in keys:
+                self._drop_entry(key)
+            return len(keys)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
 class DatabaseManager:
     """Comprehensive database manager for standards data"""
     
@@ -103,17 +463,35 @@ class DatabaseManager:
         # Comprehensive caching system
         self.cache_dir = Path("cache/database")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.query_cache = {}
-        self.cache_lock = threading.Lock()
-        self.cache_ttl = 3600  # 1 hour
+        self.cache_ttl = config.query_cache_ttl
+        self.query_cache = QueryResultCache(
+            max_entries=config.query_cache_max_entries,
+            ttl=self.cache_ttl,
+            cache_dir=self.cache_dir,
+            disk_enabled=config.query_cache_disk
+        )
         
         # Statistics tracking
         self.query_stats = {
             'total_queries': 0,
             'cache_hits': 0,
+            'cache_misses': 0,
+            'disk_cache_hits': 0,
+            'cache_hit_rate': 0.0,
+            'cache_invalidations': 0,
             'avg_query_time': 0.0,
             'failed_queries': 0
         }
+        self.stats_lock = threading.Lock()
+        
+        # Parameter placeholder for queries that run on both backends
+        self.placeholder = '?' if config.database_type == "sqlite" else '%s'
+        
+        # Committed-data version behind HTTP validators; the epoch makes tokens unique per process
+        self.data_version = 0
+        self.data_version_time = time.time()
+        self.data_version_epoch = f"{int(self.data_version_time * 1000):x}"
+        self.data_version_lock = threading.Lock()
         
         # Initialize database connection
         self._initialize_connection()
@@ -156,18 +534,25 @@ class DatabaseManager:
         self.logger.info("PostgreSQL connection pool initialized")
     
     def _initialize_sqlite_connection(self):
-        """Initialize SQLite connection"""
+        """Initialize SQLite connection pool"""
         sqlite_path = self.config.sqlite_path or "data/international_standards.db"
         Path(sqlite_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # SQLite doesn't use connection pooling in the same way
         self.sqlite_path = sqlite_path
         
-        self.logger.info(f"SQLite database path set: {sqlite_path}")
+        if self.config.sqlite_pooling:
+            self.connection_pool = SQLiteConnectionPool(
+                maxconn=self.config.pool_size,
+                database_path=sqlite_path,
+                config=self.config
+            )
+            self.logger.info(f"SQLite connection pool initialized: {sqlite_path}")
+        else:
+            self.logger.info(f"SQLite database path set: {sqlite_path}")
     
     def get_connection(self):
         """Get database connection from pool"""
-        if self.config.database_type == "postgresql":
+        if self.connection_pool:
             return self.connection_pool.getconn()
         elif self.config.database_type == "sqlite":
             conn = sqlite3.connect(self.sqlite_path)
@@ -176,19 +561,25 @@ class DatabaseManager:
     
     def return_connection(self, connection):
         """Return connection to pool"""
-        if self.config.database_type == "postgresql":
+        if self.connection_pool:
             self.connection_pool.putconn(connection)
         elif self.config.database_type == "sqlite":
             connection.close()
     
     def execute_query(self, query: str, params: Optional[Tuple] = None, 
-                     fetch_results: bool = True) -> Optional[List[Dict[str, Any]]]:
+                     fetch_results: bool = True, use_cache: bool = True,
+                     persist_cache: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Execute database query with connection management
         
+        Deterministic SELECTs are served from the query result cache; any
+        other statement invalidates cached results for the tables it writes.
+        
         Args:
             query: SQL query string
             params: Query parameters
             fetch_results: Whether to fetch and return results
+            use_cache: Whether a SELECT may be answered from (and stored in) the cache
+            persist_cache: Also keep the result in the on-disk cache tier
             
         Returns:
             Query results or None
@@ -196,6 +587,18 @@ class DatabaseManager:
         start_time = datetime.now()
         connection = None
         
+        cacheable = (use_cache and fetch_results and self.config.query_cache_enabled and
+                     QueryResultCache.is_cacheable(query))
+        if cacheable:
+            cache_key = QueryResultCache.make_key(query, params)
+            cached_results, tier = self.query_cache.get(cache_key)
+            if cached_results is not None:
+                execution_time = (datetime.now() - start_time).total_seconds()
+                self._update_query_stats(execution_time, cache_hit=True, cache_tier=tier)
+                return cached_results
+            tables = QueryResultCache.read_tables(query)
+            table_versions = self.query_cache.table_versions(tables)
+        
         try:
             connection = self.get_connection()
             
@@ -218,15 +621,21 @@ class DatabaseManager:
             if self.config.auto_commit:
                 connection.commit()
             
+            if cacheable:
+                self.query_cache.put(cache_key, tables, table_versions, results, persist=persist_cache)
+            elif QueryResultCache.is_write(query):
+                self._invalidate_cache(QueryResultCache.write_tables(query) or None)
+            
             # Update statistics
             execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_query_stats(execution_time, cache_hit=False)
+            self._update_query_stats(execution_time, cache_hit=False, cache_tier='miss' if cacheable else None)
             
             return results
             
         except Exception as e:
             self.logger.error(f"Query execution failed: {e}")
-            self.query_stats['failed_queries'] += 1
+            with self.stats_lock:
+                self.query_stats['failed_queries'] += 1
             if connection:
                 connection.rollback()
             raise
@@ -235,20 +644,247 @@ class DatabaseManager:
             if connection:
                 self.return_connection(connection)
     
-    def _update_query_stats(self, execution_time: float, cache_hit: bool = False):
-        """Update query execution statistics"""
-        self.query_stats['total_queries'] += 1
+    def _update_query_stats(self, execution_time: float, cache_hit: bool = False,
+                            cache_tier: Optional[str] = None):
+        """Update query execution statistics
         
-        if cache_hit:
-            self.query_stats['cache_hits'] += 1
+        Args:
+            execution_time: Query time in seconds
+            cache_hit: Whether the result came from the query cache
+            cache_tier: 'memory' or 'disk' for hits, 'miss' for cacheable misses
+        """
+        with self.stats_lock:
+            self.query_stats['total_queries'] += 1
+            
+            if cache_hit:
+                self.query_stats['cache_hits'] += 1
+                if cache_tier == 'disk':
+                    self.query_stats['disk_cache_hits'] += 1
+            elif cache_tier == 'miss':
+                self.query_stats['cache_misses'] += 1
+            
+            lookups = self.query_stats['cache_hits'] + self.query_stats['cache_misses']
+            if lookups:
+                self.query_stats['cache_hit_rate'] = self.query_stats['cache_hits'] / lookups
+            
+            # Update average query time
+            current_avg = self.query_stats['avg_query_time']
+            total_queries = self.query_stats['total_queries']
+            
+            self.query_stats['avg_query_time'] = (
+                (current_avg * (total_queries - 1) + execution_time) / total_queries
+            )
+    
+    def _invalidate_cache(self, tables: Optional[frozenset] = None):
+        """Drop cached results that read tables (all results if tables is None)"""
+        dropped = self.query_cache.invalidate(tables)
+        if dropped:
+            with self.stats_lock:
+                self.query_stats['cache_invalidations'] += dropped
+            self.logger.debug(f"Invalidated {dropped} cached queries for {sorted(tables) if tables else 'all tables'}")
+    
+    def clear_query_cache(self):
+        """Drop every cached query result from memory and disk"""
+        self._invalidate_cache(None)
+    
+    def iter_query_batches(self, query: str, params: Optional[Tuple] = None,
+                           batch_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream query results in batches without materialising the full result
         
-        # Update average query time
-        current_avg = self.query_stats['avg_query_time']
-        total_queries = self.query_stats['total_queries']
+        PostgreSQL uses a named (server-side) cursor; SQLite steps its cursor
+        with fetchmany. The connection is held until the generator is
+        exhausted or closed, and results bypass the query cache.
         
-        self.query_stats['avg_query_time'] = (
-            (current_avg * (total_queries - 1) + execution_time) / total_queries
-        )
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Rows per batch (defaults to config.stream_batch_size)
+            
+        Yields:
+            Lists of up to batch_size row dictionaries
+        """
+        batch_size = batch_size or self.config.stream_batch_size
+        start_time = datetime.now()
+        connection = self.get_connection()
+        cursor = None
+        row_count = 0
+        
+        try:
+            if self.config.database_type == "postgresql":
+                cursor_name = f"stream_{threading.get_ident()}_{int(time.time() * 1000000)}"
+                cursor = connection.cursor(name=cursor_name, cursor_factory=RealDictCursor)
+                cursor.itersize = batch_size
+            else:
+                cursor = connection.cursor()
+            
+            cursor.execute(query, params or ())
+            
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                row_count += len(rows)
+                yield [dict(row) for row in rows]
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
+            self._update_query_stats(execution_time, cache_hit=False)
+            self.logger.debug(f"Streamed {row_count} rows in {execution_time:.2f}s")
+            
+        except Exception as e:
+            self.logger.error(f"Streaming query failed after {row_count} rows: {e}")
+            with self.stats_lock:
+                self.query_stats['failed_queries'] += 1
+            raise
+            
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            # End the read transaction that holds the server-side cursor
+            if self.config.database_type == "postgresql":
+                connection.rollback()
+            self.return_connection(connection)
+    
+    # ==============================================================================
+    # BULK LOADING
+    # ==============================================================================
+    
+    IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+    
+    def bulk_insert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    returning: Optional[str] = None,
+                    chunk_size: Optional[int] = None,
+                    conflict_columns: Optional[Sequence[str]] = None) -> List[int]:
+        """Insert many rows in one transaction using the fastest path per dialect
+        
+        PostgreSQL uses COPY FROM STDIN, or execute_values when IDs are needed
+        or rows are upserted. SQLite uses chunked executemany; IDs come from the
+        contiguous rowid range each chunk receives while the transaction holds
+        the write lock. Dict and list values are stored as JSON.
+        
+        Args:
+            table: Target table name
+            columns: Column names, in the order of each row's values
+            rows: Row value sequences (may be a generator; consumed in chunks)
+            returning: ID column to return, if any
+            chunk_size: Rows per batch (defaults to config.bulk_insert_chunk_size)
+            conflict_columns: Unique key to upsert on; conflicting rows are updated
+                in place (cannot be combined with returning)
+            
+        Returns:
+            Inserted IDs in row order if returning is set, otherwise an empty list
+        """
+        for identifier in [table, *columns, *(conflict_columns or [])] + ([returning] if returning else []):
+            if not self.IDENTIFIER_PATTERN.match(identifier):
+                raise ValueError(f"Invalid SQL identifier: {identifier!r}")
+        
+        if returning and conflict_columns:
+            raise ValueError("returning cannot be combined with conflict_columns")
+        
+        upsert_clause = ''
+        if conflict_columns:
+            updates = ', '.join(f"{column} = EXCLUDED.{column}"
+                                for column in columns if column not in conflict_columns)
+            upsert_clause = (f" ON CONFLICT ({', '.join(conflict_columns)}) "
+                             + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING"))
+        
+        chunk_size = chunk_size or self.config.bulk_insert_chunk_size
+        column_list = ', '.join(columns)
+        start_time = datetime.now()
+        row_iter = iter(rows)
+        ids = []
+        row_count = 0
+        connection = None
+        
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor()
+            
+            if self.config.database_type == "postgresql":
+                while True:
+                    chunk = list(itertools.islice(row_iter, chunk_size))
+                    if not chunk:
+                        break
+                    if returning:
+                        query = f"INSERT INTO {table} ({column_list}) VALUES %s RETURNING {returning}"
+                        values = [tuple(self._adapt_bulk_value(v, 'values') for v in row) for row in chunk]
+                        ids.extend(row[0] for row in execute_values(
+                            cursor, query, values, page_size=chunk_size, fetch=True))
+                    elif conflict_columns:
+                        # COPY cannot resolve conflicts
+                        query = f"INSERT INTO {table} ({column_list}) VALUES %s{upsert_clause}"
+                        values = [tuple(self._adapt_bulk_value(v, 'values') for v in row) for row in chunk]
+                        execute_values(cursor, query, values, page_size=chunk_size)
+                    else:
+                        buffer = io.StringIO()
+                        for row in chunk:
+                            buffer.write('\t'.join(self._adapt_bulk_value(v, 'copy') for v in row))
+                            buffer.write('\n')
+                        buffer.seek(0)
+                        cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN", buffer)
+                    row_count += len(chunk)
+            else:
+                placeholders = ', '.join('?' for _ in columns)
+                query = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders}){upsert_clause}"
+                # Hold the write lock for the whole load so rowids in a chunk are contiguous
+                cursor.execute("BEGIN IMMEDIATE")
+                while True:
+                    chunk = list(itertools.islice(row_iter, chunk_size))
+                    if not chunk:
+                        break
+                    cursor.executemany(query, [
+                        tuple(self._adapt_bulk_value(v, 'sqlite') for v in row) for row in chunk
+                    ])
+                    if returning:
+                        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                        ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+                    row_count += len(chunk)
+            
+            connection.commit()
+            self._invalidate_cache(frozenset([table.lower()]))
+            
+            execution_time = (datetime.now() - start_time).total_seconds()
+            self._update_query_stats(execution_time, cache_hit=False)
+            self.logger.info(f"Bulk inserted {row_count} rows into {table} in {execution_time:.2f}s "
+                             f"({row_count / max(execution_time, 1e-6):.0f} rows/s)")
+            return ids
+            
+        except Exception as e:
+            self.logger.error(f"Bulk insert into {table} failed after {row_count} rows: {e}")
+            with self.stats_lock:
+                self.query_stats['failed_queries'] += 1
+            if connection:
+                connection.rollback()
+            raise
+            
+        finally:
+            if connection:
+                self.return_connection(connection)
+    
+    @staticmethod
+    def _adapt_bulk_value(value: Any, target: str) -> Any:
+        """Adapt a Python value for a bulk load target ('values', 'copy' or 'sqlite')"""
+        if isinstance(value, (dict, list)):
+            if target == 'values':
+                return Json(value)
+            value = json.dumps(value, default=str)
+        
+        if target != 'copy':
+            if target == 'sqlite' and isinstance(value, datetime):
+                return value.isoformat(sep=' ')
+            return value
+        
+        # COPY text format: \N for NULL, backslash escapes for separators
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
     
     def _load_discipline_mappings(self) -> Dict[str, int]:
         """Load discipline name to ID mappings"""
@@ -315,21 +951,21 @@ class DatabaseManager:
         """
         return self.discipline_mappings.get(discipline_identifier)
     
-    def get_all_disciplines(self) -> List[Dict[str, Any]]:
-        """Get all active disciplines
-        
-        Returns:
-            List of discipline records
-        """
-        query = """
+    ALL_DISCIPLINES_QUERY = """
         SELECT discipline_id, discipline_name, display_name, openalex_id, 
                description, priority_level, created_at
         FROM disciplines 
         WHERE is_active = TRUE 
         ORDER BY priority_level, discipline_name
         """
+    
+    def get_all_disciplines(self) -> List[Dict[str, Any]]:
+        """Get all active disciplines
         
-        return self.execute_query(query)
+        Returns:
+            List of discipline records
+        """
+        return self.execute_query(self.ALL_DISCIPLINES_QUERY)
     
     def get_disciplines(self) -> List[Dict[str, Any]]:
         """Alias for get_all_disciplines for compatibility
@@ -612,30 +1248,19 @@ class DatabaseManager:
         if not standards:
             return []
         
-        # Build bulk insert query
-        values_template = "(%s, %s, %s, %s, %s, %s, %s, %s, %s)"
-        values_list = [values_template] * len(standards)
-        
-        query = f"""
-        INSERT INTO educational_standards 
-        (document_id, discipline_id, standard_text, standard_type, education_level,
-         cognitive_level, confidence_score, extraction_method, metadata)
-        VALUES {', '.join(values_list)}
-        RETURNING standard_id
-        """
-        
-        # Flatten parameters
-        params = []
-        for standard in standards:
-            params.extend([
-                standard.document_id, standard.discipline_id, standard.standard_text,
-                standard.standard_type, standard.education_level, standard.cognitive_level,
-                standard.confidence_score, standard.extraction_method,
-                Json(standard.metadata) if standard.metadata else None
-            ])
+        columns = [
+            'document_id', 'discipline_id', 'standard_text', 'standard_type', 'education_level',
+            'cognitive_level', 'confidence_score', 'extraction_method', 'metadata'
+        ]
+        rows = (
+            (standard.document_id, standard.discipline_id, standard.standard_text,
+             standard.standard_type, standard.education_level, standard.cognitive_level,
+             standard.confidence_score, standard.extraction_method,
+             standard.metadata or None)
+            for standard in standards
+        )
         
-        results = self.execute_query(query, tuple(params))
-        return [row['standard_id'] for row in results] if results else []
+        return self.bulk_insert('educational_standards', columns, rows, returning='standard_id')
     
     def get_standards_by_discipline(self, discipline_id: int, 
                                    standard_type: Optional[str] = None,
@@ -652,6 +1277,12 @@ class DatabaseManager:
         Returns:
             List of standard records
         """
+        query, params = self._standards_by_discipline_query(discipline_id, standard_type, min_confidence, limit)
+        return self.execute_query(query, params)
+    
+    def _standards_by_discipline_query(self, discipline_id: int, standard_type: Optional[str],
+                                       min_confidence: float, limit: Optional[int]) -> Tuple[str, Tuple]:
+        """Build the get_standards_by_discipline query and parameters"""
         query = """
         SELECT es.standard_id, es.standard_text, es.standard_type, es.education_level,
                es.cognitive_level, es.confidence_score, es.validation_score,
@@ -672,9 +1303,201 @@ class DatabaseManager:
         query += " ORDER BY es.validation_score DESC NULLS LAST, es.confidence_score DESC"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT %s"
+            params.append(int(limit))
         
-        return self.execute_query(query, tuple(params))
+        return query, tuple(params)
+    
+    # Keyset order: validation_score DESC NULLS LAST (as -1), confidence_score DESC, standard_id DESC
+    KEYSET_SORT_KEY = "COALESCE(es.validation_score, -1), es.confidence_score, es.standard_id"
+    KEYSET_INDEXES = {
+        'idx_standards_discipline_keyset': (
+            "CREATE INDEX IF NOT EXISTS idx_standards_discipline_keyset ON educational_standards "
+            "(discipline_id, (COALESCE(validation_score, -1)) DESC, confidence_score DESC, standard_id DESC)"
+        ),
+        'idx_standards_keyset': (
+            "CREATE INDEX IF NOT EXISTS idx_standards_keyset ON educational_standards "
+            "((COALESCE(validation_score, -1)) DESC, confidence_score DESC, standard_id DESC)"
+        )
+    }
+    MAX_PAGE_SIZE = 1000
+    
+    def ensure_pagination_indexes(self) -> bool:
+        """Create the composite indexes backing get_standards_page
+        
+        Returns:
+            True if the indexes exist
+        """
+        try:
+            for index_sql in self.KEYSET_INDEXES.values():
+                self.execute_query(index_sql, fetch_results=False)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not create pagination indexes: {e}")
+            return False
+    
+    def get_standards_page(self, discipline_id: Optional[int] = None,
+                           standard_type: Optional[str] = None,
+                           education_level: Optional[str] = None,
+                           min_confidence: float = 0.0,
+                           limit: int = 100,
+                           cursor: Optional[str] = None,
+                           offset: int = 0) -> Dict[str, Any]:
+        """Get one page of standards using keyset pagination
+        
+        Pages are ordered by validation score (NULLs last), confidence score
+        and standard ID, and each page seeks past the previous page's last
+        key, so page N costs the same as page 1. offset is kept for legacy
+        callers and is applied in SQL; it is ignored when a cursor is given.
+        
+        Args:
+            discipline_id: Filter by discipline ID (all disciplines if None)
+            standard_type: Filter by standard type
+            education_level: Filter by education level
+            min_confidence: Minimum confidence score
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            cursor: next_cursor from the previous page
+            offset: Rows to skip when no cursor is given
+            
+        Returns:
+            Dictionary with standards, next_cursor (None on the last page) and limit
+        """
+        query, params, limit, filters = self._standards_page_query(
+            discipline_id, standard_type, education_level, min_confidence, limit, cursor, offset
+        )
+        rows = self.execute_query(query, params) or []
+        return self._standards_page_result(rows, limit, filters)
+    
+    def _standards_page_query(self, discipline_id: Optional[int], standard_type: Optional[str],
+                              education_level: Optional[str], min_confidence: float,
+                              limit: int, cursor: Optional[str], offset: int) -> Tuple[str, Tuple, int, List[Any]]:
+        """Build the keyset page query
+        
+        Returns:
+            (query, params, capped limit, filters the cursor is bound to)
+        """
+        limit = max(1, min(int(limit), self.MAX_PAGE_SIZE))
+        filters = [discipline_id, standard_type, education_level, float(min_confidence)]
+        p = self.placeholder
+        
+        conditions = [f"es.confidence_score >= {p}"]
+        params = [min_confidence]
+        
+        if discipline_id is not None:
+            conditions.append(f"es.discipline_id = {p}")
+            params.append(discipline_id)
+        
+        if standard_type:
+            conditions.append(f"es.standard_type = {p}")
+            params.append(standard_type)
+        
+        if education_level:
+            conditions.append(f"es.education_level = {p}")
+            params.append(education_level)
+        
+        if cursor:
+            conditions.append(f"({self.KEYSET_SORT_KEY}) < ({p}, {p}, {p})")
+            params.extend(self._decode_keyset_cursor(cursor, filters))
+        
+        query = f"""
+        SELECT es.standard_id, es.standard_text, es.standard_type, es.education_level,
+               es.cognitive_level, es.confidence_score, es.validation_score,
+               es.is_validated, es.processed_timestamp, es.metadata,
+               rd.document_title, rd.document_url, ss.source_title
+        FROM educational_standards es
+        JOIN retrieved_documents rd ON es.document_id = rd.document_id
+        JOIN standards_sources ss ON rd.source_id = ss.source_id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY COALESCE(es.validation_score, -1) DESC, es.confidence_score DESC, es.standard_id DESC
+        LIMIT {p}
+        """
+        # One extra row tells whether another page exists
+        params.append(limit + 1)
+        
+        if offset and not cursor:
+            query += f" OFFSET {p}"
+            params.append(int(offset))
+        
+        return query, tuple(params), limit, filters
+    
+    def _standards_page_result(self, rows: List[Dict[str, Any]], limit: int,
+                               filters: List[Any]) -> Dict[str, Any]:
+        """Trim the look-ahead row and derive next_cursor from the page's last row"""
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            validation_score = last['validation_score']
+            next_cursor = self._encode_keyset_cursor([
+                float(validation_score) if validation_score is not None else -1.0,
+                float(last['confidence_score']),
+                last['standard_id']
+            ], filters)
+        
+        return {
+            'standards': rows,
+            'next_cursor': next_cursor,
+            'limit': limit
+        }
+    
+    def iter_standards_export(self, discipline_id: int,
+                              standard_type: Optional[str] = None,
+                              min_confidence: float = 0.0,
+                              batch_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream every standard of a discipline in standard_id order
+        
+        Args:
+            discipline_id: Discipline ID
+            standard_type: Filter by standard type
+            min_confidence: Minimum confidence score
+            batch_size: Rows per batch
+            
+        Yields:
+            Lists of standard records
+        """
+        p = self.placeholder
+        query = f"""
+        SELECT es.standard_id, es.discipline_id, es.document_id, es.standard_text, es.standard_type,
+               es.education_level, es.cognitive_level, es.confidence_score, es.validation_score,
+               es.is_validated, es.extraction_method, es.processed_timestamp, es.metadata
+        FROM educational_standards es
+        WHERE es.discipline_id = {p} AND es.confidence_score >= {p}
+        """
+        params = [discipline_id, min_confidence]
+        
+        if standard_type:
+            query += f" AND es.standard_type = {p}"
+            params.append(standard_type)
+        
+        query += " ORDER BY es.standard_id"
+        
+        return self.iter_query_batches(query, tuple(params), batch_size)
+    
+    @staticmethod
+    def _keyset_filter_hash(filters: List[Any]) -> str:
+        return hashlib.sha256(json.dumps(filters).encode('utf-8')).hexdigest()[:12]
+    
+    def _encode_keyset_cursor(self, sort_key: List[Any], filters: List[Any]) -> str:
+        """Encode a page's last sort key as an opaque URL-safe cursor bound to its filters"""
+        payload = json.dumps({'k': sort_key, 'f': self._keyset_filter_hash(filters)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    def _decode_keyset_cursor(self, cursor: str, filters: List[Any]) -> List[Any]:
+        """Decode a cursor into its sort key, rejecting malformed or mismatched cursors"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            validation_score, confidence_score, standard_id = payload['k']
+            cursor_filters = payload['f']
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+        
+        if cursor_filters != self._keyset_filter_hash(filters):
+            raise ValueError("Pagination cursor does not match the query filters")
+        
+        return [float(validation_score), float(confidence_score), int(standard_id)]
     
     # ==============================================================================
     # COMPETENCY MANAGEMENT
@@ -717,6 +1540,12 @@ class DatabaseManager:
         Returns:
             List of competency records
         """
+        query, params = self._competencies_query(discipline_id, competency_category)
+        return self.execute_query(query, params)
+    
+    def _competencies_query(self, discipline_id: int,
+                            competency_category: Optional[str]) -> Tuple[str, Tuple]:
+        """Build the get_competencies_by_discipline query and parameters"""
         query = """
         SELECT cm.competency_id, cm.competency_statement, cm.competency_category,
                cm.bloom_level, cm.subject_area, cm.difficulty_level,
@@ -734,7 +1563,7 @@ class DatabaseManager:
         
         query += " ORDER BY cm.difficulty_level, cm.competency_category"
         
-        return self.execute_query(query, tuple(params))
+        return query, tuple(params)
     
     # ==============================================================================
     # ANALYTICS AND REPORTING
@@ -750,12 +1579,7 @@ class DatabaseManager:
             Summary statistics dictionary
         """
         # Use materialized view for performance
-        query = """
-        SELECT * FROM mv_discipline_standards_summary 
-        WHERE discipline_id = %s
-        """
-        
-        result = self.execute_query(query, (discipline_id,))
+        result = self.execute_query(self.DISCIPLINE_SUMMARY_VIEW_QUERY, (discipline_id,))
         
         if result:
             return result[0]
@@ -763,31 +1587,37 @@ class DatabaseManager:
             # Fallback to direct calculation
             return self._calculate_discipline_summary(discipline_id)
     
+    DISCIPLINE_SUMMARY_VIEW_QUERY = """
+        SELECT * FROM mv_discipline_standards_summary 
+        WHERE discipline_id = %s
+        """
+    DISCIPLINE_SUMMARY_QUERIES = {
+        'standards_count': "SELECT COUNT(*) as count FROM educational_standards WHERE discipline_id = %s",
+        'validated_standards': "SELECT COUNT(*) as count FROM educational_standards WHERE discipline_id = %s AND is_validated = TRUE",
+        'documents_count': "SELECT COUNT(DISTINCT rd.document_id) as count FROM retrieved_documents rd JOIN educational_standards es ON rd.document_id = es.document_id WHERE es.discipline_id = %s",
+        'sources_count': "SELECT COUNT(DISTINCT ss.source_id) as count FROM standards_sources ss JOIN retrieved_documents rd ON ss.source_id = rd.source_id JOIN educational_standards es ON rd.document_id = es.document_id WHERE es.discipline_id = %s",
+        'avg_quality': "SELECT AVG(validation_score) as avg_score FROM educational_standards WHERE discipline_id = %s AND validation_score IS NOT NULL"
+    }
+    
     def _calculate_discipline_summary(self, discipline_id: int) -> Dict[str, Any]:
         """Calculate discipline summary directly (fallback)"""
-        
-        queries = {
-            'standards_count': "SELECT COUNT(*) as count FROM educational_standards WHERE discipline_id = %s",
-            'validated_standards': "SELECT COUNT(*) as count FROM educational_standards WHERE discipline_id = %s AND is_validated = TRUE",
-            'documents_count': "SELECT COUNT(DISTINCT rd.document_id) as count FROM retrieved_documents rd JOIN educational_standards es ON rd.document_id = es.document_id WHERE es.discipline_id = %s",
-            'sources_count': "SELECT COUNT(DISTINCT ss.source_id) as count FROM standards_sources ss JOIN retrieved_documents rd ON ss.source_id = rd.source_id JOIN educational_standards es ON rd.document_id = es.document_id WHERE es.discipline_id = %s",
-            'avg_quality': "SELECT AVG(validation_score) as avg_score FROM educational_standards WHERE discipline_id = %s AND validation_score IS NOT NULL"
-        }
-        
         summary = {'discipline_id': discipline_id}
         
-        for key, query in queries.items():
-            result = self.execute_query(query, (discipline_id,))
-            if result:
-                if key == 'avg_quality':
-                    summary[key] = float(result[0]['avg_score'] or 0.0)
-                else:
-                    summary[key] = result[0]['count']
-            else:
-                summary[key] = 0
+        for key, query in self.DISCIPLINE_SUMMARY_QUERIES.items():
+            summary[key] = self._stat_value(self.execute_query(query, (discipline_id,)))
         
         return summary
     
+    @staticmethod
+    def _stat_value(result: Optional[List[Dict[str, Any]]]) -> Union[int, float]:
+        """Extract a COUNT (as is) or AVG (as float) from a single-row statistics query"""
+        if not result:
+            return 0
+        row = result[0]
+        if 'count' in row:
+            return row['count']
+        return float(next(iter(row.values())) or 0.0)
+    
     def get_quality_metrics(self, discipline_id: Optional[int] = None,
                            start_date: Optional[datetime] = None,
                            end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -801,6 +1631,12 @@ class DatabaseManager:
         Returns:
             List of quality metric records
         """
+        query, params = self._quality_metrics_query(discipline_id, start_date, end_date)
+        return self.execute_query(query, params)
+    
+    def _quality_metrics_query(self, discipline_id: Optional[int], start_date: Optional[datetime],
+                               end_date: Optional[datetime]) -> Tuple[str, Tuple]:
+        """Build the get_quality_metrics query and parameters"""
         query = """
         SELECT dqm.*, d.discipline_name, d.display_name
         FROM discipline_quality_metrics dqm
@@ -824,7 +1660,58 @@ class DatabaseManager:
         
         query += " ORDER BY dqm.measurement_date DESC, d.discipline_name"
         
-        return self.execute_query(query, tuple(params))
+        return query, tuple(params)
+    
+    # Columns of standard_quality_scores, in the order save_quality_scores expects
+    QUALITY_SCORE_COLUMNS = [
+        'standard_id', 'discipline_id', 'text_hash', 'profile_version', 'overall_score',
+        'quality_level', 'confidence', 'dimension_scores', 'detailed_feedback',
+        'improvement_suggestions', 'assessment_method', 'assessment_timestamp'
+    ]
+    
+    # IDs per IN list when bulk-fetching quality scores (SQLite caps bound parameters)
+    QUALITY_SCORE_FETCH_CHUNK = 500
+    
+    def save_quality_scores(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Insert or replace persisted per-standard quality scores
+        
+        Args:
+            rows: Value sequences in QUALITY_SCORE_COLUMNS order; dict and list values are stored as JSON
+        """
+        self.bulk_insert('standard_quality_scores', self.QUALITY_SCORE_COLUMNS, rows,
+                         conflict_columns=['standard_id'])
+    
+    def get_quality_scores(self, standard_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Bulk-fetch persisted quality scores
+        
+        Args:
+            standard_ids: Standard IDs to look up
+            
+        Returns:
+            Stored score rows keyed by standard ID; IDs never scored are absent
+        """
+        standard_ids = list(dict.fromkeys(standard_ids))
+        columns = ', '.join(self.QUALITY_SCORE_COLUMNS)
+        scores = {}
+        
+        for start in range(0, len(standard_ids), self.QUALITY_SCORE_FETCH_CHUNK):
+            chunk = standard_ids[start:start + self.QUALITY_SCORE_FETCH_CHUNK]
+            placeholders = ', '.join(self.placeholder for _ in chunk)
+            query = f"SELECT {columns} FROM standard_quality_scores WHERE standard_id IN ({placeholders})"
+            for row in self.execute_query(query, tuple(chunk), use_cache=False) or []:
+                scores[row['standard_id']] = row
+        
+        return scores
+    
+    SYSTEM_STATS_QUERIES = {
+        'total_disciplines': "SELECT COUNT(*) as count FROM disciplines WHERE is_active = TRUE",
+        'total_standards': "SELECT COUNT(*) as count FROM educational_standards",
+        'total_validated': "SELECT COUNT(*) as count FROM educational_standards WHERE is_validated = TRUE",
+        'total_documents': "SELECT COUNT(*) as count FROM retrieved_documents",
+        'total_sources': "SELECT COUNT(*) as count FROM standards_sources WHERE is_active = TRUE",
+        'avg_quality_score': "SELECT AVG(validation_score) as avg FROM educational_standards WHERE validation_score IS NOT NULL",
+        'processing_efficiency': "SELECT AVG(success_rate) as avg FROM agent_sessions WHERE status = 'completed'"
+    }
     
     def get_system_performance_stats(self) -> Dict[str, Any]:
         """Get overall system performance statistics
@@ -832,29 +1719,13 @@ class DatabaseManager:
         Returns:
             System performance dictionary
         """
-        stats_queries = {
-            'total_disciplines': "SELECT COUNT(*) as count FROM disciplines WHERE is_active = TRUE",
-            'total_standards': "SELECT COUNT(*) as count FROM educational_standards",
-            'total_validated': "SELECT COUNT(*) as count FROM educational_standards WHERE is_validated = TRUE",
-            'total_documents': "SELECT COUNT(*) as count FROM retrieved_documents",
-            'total_sources': "SELECT COUNT(*) as count FROM standards_sources WHERE is_active = TRUE",
-            'avg_quality_score': "SELECT AVG(validation_score) as avg FROM educational_standards WHERE validation_score IS NOT NULL",
-            'processing_efficiency': "SELECT AVG(success_rate) as avg FROM agent_sessions WHERE status = 'completed'"
-        }
-        
         stats = {}
-        for key, query in stats_queries.items():
-            result = self.execute_query(query)
-            if result:
-                if 'avg' in result[0]:
-                    stats[key] = float(result[0]['avg'] or 0.0)
-                else:
-                    stats[key] = result[0]['count']
-            else:
-                stats[key] = 0
+        for key, query in self.SYSTEM_STATS_QUERIES.items():
+            stats[key] = self._stat_value(self.execute_query(query))
         
         # Add query performance stats
-        stats['query_performance'] = self.query_stats.copy()
+        with self.stats_lock:
+            stats['query_performance'] = self.query_stats.copy()
         
         return stats
     
@@ -933,34 +1804,7 @@ class DatabaseManager:
         Returns:
             List of all standards
         """
-        cache_key = "all_standards"
-        
         try:
-            # Check memory cache first
-            with self.cache_lock:
-                if cache_key in self.query_cache:
-                    cached_time, cached_data = self.query_cache[cache_key]
-                    if time.time() - cached_time < self.cache_ttl:
-                        self.logger.debug("Returning cached standards data")
-                        return cached_data
-            
-            # Check file cache
-            cache_file = self.cache_dir / f"{cache_key}.pkl"
-            if cache_file.exists():
-                cache_age = time.time() - cache_file.stat().st_mtime
-                if cache_age < self.cache_ttl:
-                    try:
-                        with open(cache_file, 'rb') as f:
-                            cached_data = pickle.load(f)
-                            # Update memory cache
-                            with self.cache_lock:
-                                self.query_cache[cache_key] = (time.time(), cached_data)
-                            self.logger.debug("Returning file cached standards data")
-                            return cached_data
-                    except Exception as e:
-                        self.logger.warning(f"Error reading cache file: {e}")
-            
-            # Query database if no valid cache
             query = """
             SELECT 
                 id, title, discipline, organization, 
@@ -970,24 +1814,12 @@ class DatabaseManager:
             ORDER BY last_updated DESC
             """
             
-            results = self.execute_query(query)
+            # Persisted so the full listing survives restarts; writes to standards invalidate it
+            results = self.execute_query(query, persist_cache=True)
             
             if results:
-                standards_data = results
-                
-                # Cache the results
-                with self.cache_lock:
-                    self.query_cache[cache_key] = (time.time(), standards_data)
-                
-                # Save to file cache
-                try:
-                    with open(cache_file, 'wb') as f:
-                        pickle.dump(standards_data, f)
-                except Exception as e:
-                    self.logger.warning(f"Error saving to cache file: {e}")
-                
-                self.logger.info(f"Retrieved and cached {len(standards_data)} standards")
-                return standards_data
+                self.logger.info(f"Retrieved {len(results)} standards")
+                return results
             else:
                 self.logger.error(f"No standards found or query failed")
                 return []
@@ -1002,11 +1834,21 @@ class DatabaseManager:
         Returns:
             Connection statistics dictionary
         """
-        if self.config.database_type == "postgresql" and self.connection_pool:
+        if self.connection_pool:
+            if isinstance(self.connection_pool, SQLiteConnectionPool):
+                # Connections open lazily, so idle slots may not exist yet
+                opened = self.connection_pool.get_size()
+                idle = self.connection_pool.get_idle_size()
+            else:
+                idle = len(self.connection_pool._pool)
+                opened = idle + len(self.connection_pool._used)
             return {
+                'database_type': self.config.database_type,
+                'connection_method': 'pool',
                 'pool_size': self.connection_pool.maxconn,
-                'connections_in_use': self.connection_pool.maxconn - len(self.connection_pool._pool),
-                'available_connections': len(self.connection_pool._pool)
+                'connections_open': opened,
+                'connections_in_use': opened - idle,
+                'available_connections': idle
             }
         else:
             return {
@@ -1014,6 +1856,47 @@ class DatabaseManager:
                 'connection_method': 'direct'
             }
     
+    def bump_data_version(self) -> int:
+        """Record that committed data changed, rolling over ETags and Last-Modified
+        
+        Returns:
+            The new data version
+        """
+        with self.data_version_lock:
+            self.data_version += 1
+            self.data_version_time = time.time()
+            return self.data_version
+    
+    def get_data_version(self) -> Tuple[str, float]:
+        """Get the current data version
+        
+        The version is local to this instance; writes from other processes
+        or made outside a changeset do not move it.
+        
+        Returns:
+            (version token, Unix time of the last change)
+        """
+        with self.data_version_lock:
+            return f"{self.data_version_epoch}.{self.data_version}", self.data_version_time
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get query result cache statistics
+        
+        Returns:
+            Cache statistics dictionary
+        """
+        with self.stats_lock:
+            return {
+                'enabled': self.config.query_cache_enabled,
+                'entries': len(self.query_cache),
+                'max_entries': self.query_cache.max_entries,
+                'hits': self.query_stats['cache_hits'],
+                'disk_hits': self.query_stats['disk_cache_hits'],
+                'misses': self.query_stats['cache_misses'],
+                'hit_rate': self.query_stats['cache_hit_rate'],
+                'invalidations': self.query_stats['cache_invalidations']
+            }
+    
     def __del__(self):
         """Cleanup database connections"""
         if hasattr(self, 'connection_pool') and self.connection_pool:
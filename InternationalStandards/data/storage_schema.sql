@@ -160,6 +160,23 @@ CREATE TABLE discipline_quality_metrics (
     UNIQUE(discipline_id, measurement_date)
 );
 
+-- Latest automated quality assessment per standard, with the inputs it was
+-- computed from so unchanged standards are not rescored
+CREATE TABLE standard_quality_scores (
+    standard_id INTEGER PRIMARY KEY REFERENCES educational_standards(standard_id),
+    discipline_id INTEGER NOT NULL REFERENCES disciplines(discipline_id),
+    text_hash VARCHAR(64) NOT NULL, -- SHA-256 of the standard text and assessment context
+    profile_version VARCHAR(64) NOT NULL, -- Hash of the discipline quality profile and scoring rules
+    overall_score DOUBLE PRECISION NOT NULL,
+    quality_level VARCHAR(20) NOT NULL,
+    confidence DOUBLE PRECISION,
+    dimension_scores JSONB,
+    detailed_feedback JSONB,
+    improvement_suggestions JSONB,
+    assessment_method VARCHAR(50),
+    assessment_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ==============================================================================
 -- SYSTEM PROCESSING AND AGENT TRACKING
 -- ==============================================================================
@@ -345,6 +362,9 @@ CREATE INDEX idx_standards_type ON educational_standards(standard_type);
 CREATE INDEX idx_standards_level ON educational_standards(education_level);
 CREATE INDEX idx_standards_validated ON educational_standards(is_validated);
 CREATE INDEX idx_standards_quality ON educational_standards(validation_score DESC);
+-- Keyset pagination order used by DatabaseManager.get_standards_page
+CREATE INDEX idx_standards_discipline_keyset ON educational_standards(discipline_id, (COALESCE(validation_score, -1)) DESC, confidence_score DESC, standard_id DESC);
+CREATE INDEX idx_standards_keyset ON educational_standards((COALESCE(validation_score, -1)) DESC, confidence_score DESC, standard_id DESC);
 
 CREATE INDEX idx_competencies_standard ON competency_mappings(standard_id);
 CREATE INDEX idx_competencies_discipline ON competency_mappings(discipline_id);
@@ -354,6 +374,7 @@ CREATE INDEX idx_validation_target ON validation_results(target_type, target_id)
 CREATE INDEX idx_validation_discipline ON validation_results(discipline_id);
 CREATE INDEX idx_validation_quality ON validation_results(overall_quality_score DESC);
 CREATE INDEX idx_validation_timestamp ON validation_results(validation_timestamp DESC);
+CREATE INDEX idx_quality_scores_discipline ON standard_quality_scores(discipline_id, profile_version);
 
 CREATE INDEX idx_agent_sessions_type ON agent_sessions(agent_type);
 CREATE INDEX idx_agent_sessions_discipline ON agent_sessions(discipline_id);
@@ -222,6 +222,50 @@ class VersionControlManager:
             self.logger.error(f"Error tracking change: {e}")
             raise
     
+    def track_bulk_changes(self, table_name: str,
+                           changes: List[Tuple[int, Dict[str, Any], Optional[int]]],
+                           change_type: ChangeType = ChangeType.INSERT,
+                           changed_by: str = "system",
+                           change_reason: Optional[str] = None) -> List[int]:
+        """Track many changes of one type with a single bulk insert
+        
+        Args:
+            table_name: Table being modified
+            changes: (record_id, new_values, discipline_id) tuples
+            change_type: Type of change for every record
+            changed_by: Who made the changes
+            change_reason: Reason for the changes
+            
+        Returns:
+            Version IDs in the order of changes
+        """
+        if not changes:
+            return []
+        
+        change_timestamp = datetime.now()
+        columns = [
+            'table_name', 'record_id', 'discipline_id', 'change_type', 'changed_fields',
+            'old_values', 'new_values', 'change_timestamp', 'changed_by', 'change_reason',
+            'version_hash', 'is_active_version'
+        ]
+        rows = (
+            (table_name, record_id, discipline_id, change_type.value,
+             json.dumps(self._determine_changed_fields(table_name, None, new_values)),
+             None, json.dumps(new_values, default=str), change_timestamp, changed_by, change_reason,
+             self._generate_version_hash(table_name, record_id, new_values, change_type), True)
+            for record_id, new_values, discipline_id in changes
+        )
+        
+        try:
+            version_ids = self.db.bulk_insert('data_versions', columns, rows, returning='version_id')
+            self.version_stats['total_versions'] += len(version_ids)
+            self.logger.debug(f"Bulk change tracked: {table_name} - {len(version_ids)} {change_type.value} records")
+            return version_ids
+            
+        except Exception as e:
+            self.logger.error(f"Error tracking bulk changes: {e}")
+            raise
+    
     def _determine_changed_fields(self, table_name: str, 
                                  old_values: Optional[Dict[str, Any]], 
                                  new_values: Dict[str, Any]) -> List[str]:
@@ -335,6 +379,9 @@ class VersionControlManager:
                 del self.active_changesets[changeset_id]
                 self.version_stats['active_changesets'] -= 1
             
+            # Invalidate HTTP caches keyed on the data version
+            self.db.bump_data_version()
+            
             self.logger.info(f"Committed changeset: {changeset_id}")
             return True
             
@@ -375,6 +422,7 @@ class VersionControlManager:
                     self.version_stats['active_changesets'] -= 1
                 
                 self.version_stats['rollbacks_performed'] += 1
+                self.db.bump_data_version()
                 self.logger.info(f"Rolled back changeset: {changeset_id}")
                 return True
             
@@ -10,13 +10,15 @@ Author: Autonomous AI Development System
 """
 
 import time
+import math
+import random
 import psutil
 import threading
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import statistics
 import json
@@ -87,9 +89,244 @@ class OptimizationRecommendation:
     generated_timestamp: datetime
     applied: bool = False
 
+@dataclass
+class MetricRollup:
+    """Pre-aggregated values of one metric series over a fixed time bucket"""
+    bucket_start: float  # Epoch seconds
+    count: int = 0
+    total: float = 0.0
+    total_squares: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    samples: List[float] = field(default_factory=list)  # Reservoir sample for percentiles
+    
+    def add(self, value: float, sample_size: int, rng: random.Random):
+        """Fold one value into the bucket"""
+        self.count += 1
+        self.total += value
+        self.total_squares += value * value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        
+        if len(self.samples) < sample_size:
+            self.samples.append(value)
+        else:
+            slot = rng.randrange(self.count)
+            if slot < sample_size:
+                self.samples[slot] = value
+
+class MetricTimeSeriesStore:
+    """Bounded time-series storage for performance metrics
+    
+    Raw metrics live in fixed-size ring buffers (one overall, one per
+    component) for short look-back windows such as alert checks. Every metric
+    is also folded into 1-minute and 1-hour rollups per (component, metric
+    type) series, kept in ring buffers of their own, so summaries over long
+    windows read a bounded number of buckets instead of every sample. Memory
+    stays flat however long the monitor runs.
+    """
+    
+    # Bucket width in seconds per rollup resolution
+    RESOLUTIONS = {'minute': 60, 'hour': 3600}
+    
+    # Windows up to this long are summarized from minute rollups, longer ones from hour rollups
+    MINUTE_SUMMARY_WINDOW = timedelta(hours=3)
+    
+    def __init__(self, raw_capacity: int = 10000, component_capacity: int = 1000,
+                 minute_retention: int = 1440, hour_retention: int = 720,
+                 sample_size: int = 128):
+        """Initialize metric store
+        
+        Args:
+            raw_capacity: Raw metrics kept across all components
+            component_capacity: Raw metrics kept per component
+            minute_retention: 1-minute rollups kept per series (default one day)
+            hour_retention: 1-hour rollups kept per series (default 30 days)
+            sample_size: Values sampled per rollup for percentile estimates
+        """
+        self.raw_metrics = deque(maxlen=raw_capacity)
+        self.component_capacity = component_capacity
+        self.component_metrics = {}
+        self.retention = {'minute': minute_retention, 'hour': hour_retention}
+        self.sample_size = sample_size
+        self.series = {}
+        self.rng = random.Random()
+        self.lock = threading.Lock()
+    
+    def add(self, metric: PerformanceMetric):
+        """Store a metric and update its rollups"""
+        timestamp = metric.timestamp.timestamp()
+        key = (metric.component, metric.metric_type)
+        
+        with self.lock:
+            self.raw_metrics.append(metric)
+            
+            if metric.component not in self.component_metrics:
+                self.component_metrics[metric.component] = deque(maxlen=self.component_capacity)
+            self.component_metrics[metric.component].append(metric)
+            
+            if key not in self.series:
+                self.series[key] = {
+                    resolution: deque(maxlen=self.retention[resolution])
+                    for resolution in self.RESOLUTIONS
+                }
+            
+            for resolution, width in self.RESOLUTIONS.items():
+                bucket = self._get_bucket(self.series[key][resolution], timestamp - timestamp % width)
+                if bucket:
+                    bucket.add(metric.value, self.sample_size, self.rng)
+    
+    @staticmethod
+    def _get_bucket(buckets: deque, bucket_start: float) -> Optional[MetricRollup]:
+        """Find or create the rollup for a bucket, keeping buckets in time order"""
+        if not buckets or buckets[-1].bucket_start < bucket_start:
+            buckets.append(MetricRollup(bucket_start))
+            return buckets[-1]
+        
+        # Late metric: walk back from the newest bucket
+        index = len(buckets) - 1
+        while index >= 0 and buckets[index].bucket_start > bucket_start:
+            index -= 1
+        
+        if index >= 0 and buckets[index].bucket_start == bucket_start:
+            return buckets[index]
+        
+        # A new bucket would evict the oldest one, so rollups drop metrics older than it
+        if len(buckets) == buckets.maxlen:
+            return None
+        
+        buckets.insert(index + 1, MetricRollup(bucket_start))
+        return buckets[index + 1]
+    
+    def components(self) -> List[str]:
+        """Components that have reported metrics"""
+        with self.lock:
+            return list(self.component_metrics)
+    
+    def recent(self, seconds: float, component: Optional[str] = None,
+               now: Optional[datetime] = None) -> List[PerformanceMetric]:
+        """Raw metrics from the last few seconds, in arrival order
+        
+        Reads backwards from the newest metric and stops at the first one
+        older than the cutoff, so the cost depends on the size of the window,
+        not of the buffer. Collectors add metrics as they are taken, so
+        arrival order is time order.
+        """
+        cutoff = (now or datetime.now()) - timedelta(seconds=seconds)
+        recent_metrics = []
+        
+        with self.lock:
+            source = self.raw_metrics if component is None else self.component_metrics.get(component, ())
+            for metric in reversed(source):
+                if metric.timestamp < cutoff:
+                    break
+                recent_metrics.append(metric)
+        
+        recent_metrics.reverse()
+        return recent_metrics
+    
+    def get_rollups(self, component: str, metric_type: PerformanceMetricType,
+                    resolution: str = 'minute', since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Rollups for one series
+        
+        Args:
+            component: Component name
+            metric_type: Metric type
+            resolution: 'minute' or 'hour'
+            since: Only buckets overlapping this time onwards
+            
+        Returns:
+            One dict per bucket with bucket_start, count, min, max, avg and p95
+        """
+        width = self.RESOLUTIONS[resolution]
+        start = since.timestamp() - width if since else -math.inf
+        
+        with self.lock:
+            buckets = [bucket for bucket in self.series.get((component, metric_type), {}).get(resolution, ())
+                       if bucket.bucket_start > start]
+            return [
+                {
+                    'bucket_start': datetime.fromtimestamp(bucket.bucket_start),
+                    'count': bucket.count,
+                    'min': bucket.minimum,
+                    'max': bucket.maximum,
+                    'avg': bucket.total / bucket.count,
+                    'p95': self._percentile([bucket], 0.95)
+                }
+                for bucket in buckets
+            ]
+    
+    def summarize(self, since: datetime, now: Optional[datetime] = None,
+                  group_by: Optional[Callable[[Tuple[str, PerformanceMetricType]], Any]] = None) -> Dict[Any, Dict[str, Any]]:
+        """Aggregate series over a window from their rollups
+        
+        Args:
+            since: Window start; rounded down to the rollup bucket it falls in
+            now: Window end (defaults to the current time)
+            group_by: Maps a (component, metric type) key to the group it is
+                merged into; by default every series is summarized separately
+            
+        Returns:
+            count, average, min, max, std_dev and p95 per group
+        """
+        window = (now or datetime.now()) - since
+        resolution = 'minute' if window <= self.MINUTE_SUMMARY_WINDOW else 'hour'
+        start = since.timestamp() - self.RESOLUTIONS[resolution]
+        
+        buckets_by_group = defaultdict(list)
+        with self.lock:
+            for key, rollups in self.series.items():
+                group = group_by(key) if group_by else key
+                for bucket in reversed(rollups[resolution]):
+                    if bucket.bucket_start <= start:
+                        break
+                    buckets_by_group[group].append(bucket)
+            
+            return {group: self.combine(buckets) for group, buckets in buckets_by_group.items()}
+    
+    @classmethod
+    def combine(cls, buckets: List[MetricRollup]) -> Dict[str, Any]:
+        """Merge rollups into count, average, min, max, std_dev and p95"""
+        count = sum(bucket.count for bucket in buckets)
+        total = sum(bucket.total for bucket in buckets)
+        total_squares = sum(bucket.total_squares for bucket in buckets)
+        variance = (total_squares - total * total / count) / (count - 1) if count > 1 else 0.0
+        
+        return {
+            'count': count,
+            'average': total / count,
+            'min': min(bucket.minimum for bucket in buckets),
+            'max': max(bucket.maximum for bucket in buckets),
+            'std_dev': math.sqrt(max(0.0, variance)),
+            'p95': cls._percentile(buckets, 0.95)
+        }
+    
+    @staticmethod
+    def _percentile(buckets: List[MetricRollup], fraction: float) -> float:
+        """Nearest-rank percentile over bucket samples, weighting each sample by what it stands for"""
+        weighted = sorted(
+            (value, bucket.count / len(bucket.samples))
+            for bucket in buckets if bucket.samples
+            for value in bucket.samples
+        )
+        if not weighted:
+            return 0.0
+        
+        target = fraction * sum(weight for _, weight in weighted)
+        cumulative = 0.0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target - 1e-9:
+                return value
+        
+        return weighted[-1][0]
+
 class PerformanceMonitor:
     """Comprehensive performance monitoring system"""
     
+    # Alerts kept in memory; older ones are dropped first
+    MAX_ALERTS = 1000
+    
     def __init__(self, database_manager: DatabaseManager, 
                  monitoring_interval: int = 30):
         """Initialize performance monitor
@@ -107,9 +344,8 @@ class PerformanceMonitor:
         self.monitoring_thread = None
         
         # Performance data storage
-        self.metrics_buffer = deque(maxlen=10000)  # Keep last 10k metrics
-        self.metrics_by_component = defaultdict(deque)
-        self.alerts = []
+        self.metric_store = MetricTimeSeriesStore()
+        self.alerts = deque(maxlen=self.MAX_ALERTS)
         self.recommendations = []
         
         # Performance thresholds
@@ -361,24 +597,13 @@ class PerformanceMonitor:
     
     def _add_metric(self, metric: PerformanceMetric):
         """Add metric to storage and update statistics"""
-        self.metrics_buffer.append(metric)
-        self.metrics_by_component[metric.component].append(metric)
+        self.metric_store.add(metric)
         self.monitoring_stats['total_metrics_collected'] += 1
-        
-        # Keep component buffers manageable
-        if len(self.metrics_by_component[metric.component]) > 1000:
-            self.metrics_by_component[metric.component] = deque(
-                list(self.metrics_by_component[metric.component])[-500:],
-                maxlen=1000
-            )
     
     def _check_alerts(self):
         """Check metrics against thresholds and generate alerts"""
-        current_time = datetime.now()
-        
         # Check recent metrics for threshold violations
-        recent_metrics = [m for m in self.metrics_buffer 
-                         if (current_time - m.timestamp).total_seconds() < 300]  # Last 5 minutes
+        recent_metrics = self.metric_store.recent(300)  # Last 5 minutes
         
         for metric in recent_metrics:
             self._check_metric_thresholds(metric)
@@ -522,9 +747,7 @@ class PerformanceMonitor:
         current_time = datetime.now()
         
         # Get recent system metrics
-        recent_metrics = [m for m in self.metrics_buffer 
-                         if (current_time - m.timestamp).total_seconds() < 1800 and  # Last 30 minutes
-                         m.component == "system"]
+        recent_metrics = self.metric_store.recent(1800, component="system", now=current_time)  # Last 30 minutes
         
         if not recent_metrics:
             return recommendations
@@ -569,10 +792,8 @@ class PerformanceMonitor:
         current_time = datetime.now()
         
         # Get recent database metrics
-        db_metrics = [m for m in self.metrics_buffer 
-                     if (current_time - m.timestamp).total_seconds() < 1800 and  # Last 30 minutes
-                     m.component == "database" and
-                     m.metric_type == PerformanceMetricType.DATABASE_PERFORMANCE]
+        db_metrics = [m for m in self.metric_store.recent(1800, component="database", now=current_time)  # Last 30 minutes
+                     if m.metric_type == PerformanceMetricType.DATABASE_PERFORMANCE]
         
         if not db_metrics:
             return recommendations
@@ -613,12 +834,11 @@ class PerformanceMonitor:
         current_time = datetime.now()
         
         # Analyze component efficiency
-        for component, metrics in self.metrics_by_component.items():
+        for component in self.metric_store.components():
             if component in ["system", "database"]:
                 continue
             
-            recent_metrics = [m for m in metrics 
-                             if (current_time - m.timestamp).total_seconds() < 1800]
+            recent_metrics = self.metric_store.recent(1800, component=component, now=current_time)
             
             if not recent_metrics:
                 continue
@@ -649,40 +869,29 @@ class PerformanceMonitor:
         self.logger.info(f"Registered performance tracker for {component_name}")
     
     def get_performance_summary(self, hours: int = 24) -> Dict[str, Any]:
-        """Get performance summary for specified time period"""
+        """Get performance summary for specified time period
+        
+        Built from the metric store's rollups, so the window start is rounded
+        down to a minute (windows up to 3 hours) or an hour boundary.
+        """
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_metrics = [m for m in self.metrics_buffer if m.timestamp >= cutoff_time]
+        series_summaries = self.metric_store.summarize(cutoff_time)
         
-        if not recent_metrics:
+        if not series_summaries:
             return {'message': 'No metrics available for the specified period'}
         
-        # Group metrics by type and component
-        metrics_by_type = defaultdict(list)
-        metrics_by_component = defaultdict(list)
-        
-        for metric in recent_metrics:
-            metrics_by_type[metric.metric_type].append(metric)
-            metrics_by_component[metric.component].append(metric)
-        
         # Calculate summaries
-        type_summaries = {}
-        for metric_type, metrics in metrics_by_type.items():
-            values = [m.value for m in metrics]
-            type_summaries[metric_type.value] = {
-                'count': len(values),
-                'average': statistics.mean(values),
-                'min': min(values),
-                'max': max(values),
-                'std_dev': statistics.stdev(values) if len(values) > 1 else 0
-            }
+        type_summaries = {
+            metric_type.value: summary
+            for metric_type, summary in self.metric_store.summarize(
+                cutoff_time, group_by=lambda key: key[1]).items()
+        }
         
         component_summaries = {}
-        for component, metrics in metrics_by_component.items():
-            values = [m.value for m in metrics]
-            component_summaries[component] = {
-                'count': len(values),
-                'metric_types': len(set(m.metric_type for m in metrics))
-            }
+        for (component, metric_type), summary in series_summaries.items():
+            component_summary = component_summaries.setdefault(component, {'count': 0, 'metric_types': 0})
+            component_summary['count'] += summary['count']
+            component_summary['metric_types'] += 1
         
         # Recent alerts
         recent_alerts = [a for a in self.alerts if a.timestamp >= cutoff_time]
@@ -696,7 +905,7 @@ class PerformanceMonitor:
         
         return {
             'period_hours': hours,
-            'total_metrics': len(recent_metrics),
+            'total_metrics': sum(summary['count'] for summary in series_summaries.values()),
             'metrics_by_type': type_summaries,
             'metrics_by_component': component_summaries,
             'alerts': alert_summary,
@@ -742,8 +951,7 @@ class PerformanceMonitor:
     def get_system_health_score(self) -> Dict[str, Any]:
         """Calculate overall system health score"""
         current_time = datetime.now()
-        recent_metrics = [m for m in self.metrics_buffer 
-                         if (current_time - m.timestamp).total_seconds() < 300]  # Last 5 minutes
+        recent_metrics = self.metric_store.recent(300, now=current_time)  # Last 5 minutes
         
         if not recent_metrics:
             return {'health_score': 0.5, 'status': 'unknown', 'message': 'Insufficient data'}
@@ -9,15 +9,17 @@ machine learning techniques for autonomous quality scoring.
 Author: Autonomous AI Development System
 """
 
+import os
 import re
 import json
 import logging
 import statistics
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterable, Set
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
 import threading
 import hashlib
 
@@ -76,6 +78,90 @@ class QualityMetrics:
     detailed_feedback: Dict[str, Any]
     improvement_suggestions: List[str]
 
+class KeywordMatcher:
+    """Compiled matcher that finds any of a fixed set of terms in one pass
+    
+    The terms are folded into a single trie-shaped alternation anchored at word
+    starts, so scanning a text costs one regex pass however many terms there
+    are. A term matches at the start of a word: inflected forms ('analyzes',
+    'applying') still count, but terms buried inside other words ('know' in
+    'acknowledge', 'rate' in 'demonstrate') do not.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        """Initialize keyword matcher
+        
+        Args:
+            terms: Terms to match; matching is case-insensitive
+        """
+        self.terms = sorted({term.lower() for term in terms if term})
+        
+        # The regex reports the longest term at each word start; a match of
+        # 'understand' also implies the shorter term 'under'
+        self.implied_terms = {}
+        for term in self.terms:
+            prefixes = [other for other in self.terms if other != term and term.startswith(other)]
+            if prefixes:
+                self.implied_terms[term] = prefixes
+        
+        # Word starts inside multi-word terms, where another term may begin
+        self.inner_word_starts = {}
+        for term in self.terms:
+            offsets = [match.start() for match in re.finditer(r'(?<!\w)\w', term)][1:]
+            if offsets:
+                self.inner_word_starts[term] = offsets
+        
+        if self.terms:
+            self.pattern = re.compile(r'(?<!\w)(' + self._trie_pattern(self.terms) + ')')
+        else:
+            self.pattern = None
+    
+    @staticmethod
+    def _trie_pattern(terms: List[str]) -> str:
+        """Build a regex alternation that shares common prefixes between terms"""
+        trie = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        
+        def build(node: Dict[str, Dict]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional branch so the longest term wins at each position
+            return '(?:' + body + ')?' if '' in node else body
+        
+        return build(trie)
+    
+    def find(self, lower_text: str) -> Set[str]:
+        """Return the set of terms present in already-lowercased text"""
+        if self.pattern is None:
+            return set()
+        
+        found = set(self.pattern.findall(lower_text))
+        
+        # A multi-word match consumes the words after its first one; rescan
+        # from each of them so terms starting there are not missed
+        if not found.isdisjoint(self.inner_word_starts):
+            positions = [match.start() + offset
+                         for match in self.pattern.finditer(lower_text)
+                         for offset in self.inner_word_starts.get(match.group(1), [])]
+            while positions:
+                position = positions.pop()
+                match = self.pattern.match(lower_text, position)
+                if match:
+                    found.add(match.group(1))
+                    positions.extend(position + offset
+                                     for offset in self.inner_word_starts.get(match.group(1), []))
+        
+        for term in found.intersection(self.implied_terms):
+            found.update(self.implied_terms[term])
+        
+        return found
+
 @dataclass
 class DisciplineQualityProfile:
     """Quality profile for a discipline"""
@@ -85,10 +171,64 @@ class DisciplineQualityProfile:
     weighting_factors: Dict[QualityDimension, float]
     assessment_criteria: Dict[str, Any]
     specialized_rules: List[Dict[str, Any]]
+    term_matcher: Optional[KeywordMatcher] = None
+    profile_version: str = ''
 
 class QualityScoringEngine:
     """Comprehensive quality scoring engine for educational standards"""
     
+    # Bump whenever the dimension rules change so persisted scores are recomputed
+    SCORING_VERSION = "1"
+    
+    # Standards scored per unit of work in batch_assess_standards
+    BATCH_CHUNK_SIZE = 500
+    
+    # Batches at least this large are spread over a process pool
+    PARALLEL_BATCH_THRESHOLD = 4000
+    
+    # Batch score spreads this close to a confidence threshold are recomputed with statistics.stdev
+    CONFIDENCE_STD_TOLERANCE = 1e-9
+    
+    # Quality levels indexed by np.digitize over the level boundaries
+    QUALITY_LEVEL_BOUNDARIES = [0.3, 0.5, 0.7, 0.9]
+    QUALITY_LEVELS_BY_BIN = [QualityLevel.VERY_POOR, QualityLevel.POOR, QualityLevel.ACCEPTABLE,
+                             QualityLevel.GOOD, QualityLevel.EXCELLENT]
+    
+    # Fixed term lists used by the dimension assessments; every profile's
+    # KeywordMatcher includes them alongside its discipline-specific terms
+    ASSESSMENT_TERMS = {
+        'content_area': ['topic', 'concept', 'skill', 'knowledge', 'theory'],
+        'context': ['when', 'where', 'how', 'under', 'during', 'through', 'using'],
+        'outcome': ['will be able to', 'can', 'demonstrate', 'show', 'exhibit'],
+        'examples': ['such as', 'for example', 'including', 'like'],
+        'descriptive': ['specific', 'detailed', 'precise', 'exact', 'particular'],
+        'measurable': ['measure', 'assess', 'evaluate', 'test', 'score', 'rate', 'compare'],
+        'observable_verbs': [
+            'demonstrate', 'show', 'perform', 'create', 'produce', 'write', 'solve', 
+            'calculate', 'identify', 'classify', 'compare', 'analyze', 'evaluate'
+        ],
+        'assessment': ['criterion', 'criteria', 'rubric', 'benchmark', 'standard', 'level', 'proficiency'],
+        'non_observable_verbs': ['understand', 'know', 'appreciate', 'value', 'believe', 'think'],
+        'conditions': ['when', 'given', 'provided', 'under conditions'],
+        'contemporary': ['current', 'modern', 'contemporary', 'recent', 'today', 'now'],
+        'application': ['apply', 'use', 'implement', 'practice', 'real-world', 'practical'],
+        'evidence': ['research', 'evidence', 'study', 'data', 'findings', 'proven', 'validated'],
+        'scaffolding': ['build', 'develop', 'progress', 'sequence', 'prerequisite'],
+        'stem_processes': ['solve', 'calculate', 'analyze', 'model'],
+        'stem_concepts': ['formula', 'equation', 'theorem', 'principle'],
+        'language_skills': ['read', 'write', 'analyze', 'interpret'],
+        'literary_concepts': ['text', 'author', 'theme', 'character']
+    }
+    
+    BLOOM_LEVELS = {
+        'remember': ['remember', 'recall', 'recognize', 'identify'],
+        'understand': ['understand', 'explain', 'interpret', 'summarize'],
+        'apply': ['apply', 'use', 'implement', 'execute'],
+        'analyze': ['analyze', 'examine', 'compare', 'categorize'],
+        'evaluate': ['evaluate', 'judge', 'critique', 'assess'],
+        'create': ['create', 'design', 'compose', 'develop']
+    }
+    
     def __init__(self, database_manager: DatabaseManager):
         """Initialize quality scoring engine
         
@@ -108,6 +248,7 @@ class QualityScoringEngine:
             'total_assessments': 0,
             'successful_assessments': 0,
             'avg_assessment_time': 0.0,
+            'reused_assessments': 0,
             'quality_distribution': {level.value: 0 for level in QualityLevel}
         }
         
@@ -120,6 +261,18 @@ class QualityScoringEngine:
         
         self.logger.info("Quality scoring engine initialized")
     
+    def __getstate__(self):
+        """Drop the database manager and lock when shipping the engine to batch workers"""
+        state = self.__dict__.copy()
+        state['db'] = None
+        state['assessment_lock'] = None
+        return state
+    
+    def __setstate__(self, state):
+        """Restore a worker copy of the engine with a fresh lock"""
+        self.__dict__.update(state)
+        self.assessment_lock = threading.Lock()
+    
     def _initialize_text_analysis(self):
         """Initialize text analysis components"""
         try:
@@ -194,14 +347,51 @@ class QualityScoringEngine:
         # Specialized rules for discipline
         specialized_rules = self._get_discipline_specialized_rules(discipline_name)
         
-        return DisciplineQualityProfile(
+        # One matcher for every term any dimension looks for in this discipline
+        term_matcher = self._build_term_matcher(discipline_name, assessment_criteria)
+        
+        profile = DisciplineQualityProfile(
             discipline_id=discipline_id,
             discipline_name=discipline_name,
             quality_thresholds=thresholds,
             weighting_factors=weights,
             assessment_criteria=assessment_criteria,
-            specialized_rules=specialized_rules
+            specialized_rules=specialized_rules,
+            term_matcher=term_matcher
         )
+        profile.profile_version = self._compute_profile_version(profile)
+        
+        return profile
+    
+    def _compute_profile_version(self, profile: DisciplineQualityProfile) -> str:
+        """Hash everything a profile's scores depend on, for persisted score invalidation"""
+        version_data = {
+            'scoring_version': self.SCORING_VERSION,
+            'discipline_name': profile.discipline_name,
+            'quality_thresholds': {dim.value: value for dim, value in profile.quality_thresholds.items()},
+            'weighting_factors': {dim.value: value for dim, value in profile.weighting_factors.items()},
+            'assessment_criteria': profile.assessment_criteria,
+            'specialized_rules': profile.specialized_rules,
+            'terms': profile.term_matcher.terms if profile.term_matcher else []
+        }
+        
+        return hashlib.sha256(json.dumps(version_data, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def _build_term_matcher(self, discipline_name: str, assessment_criteria: Dict[str, Any]) -> KeywordMatcher:
+        """Compile the fixed assessment terms and a discipline's own terms into one matcher"""
+        terms = []
+        for group in self.ASSESSMENT_TERMS.values():
+            terms.extend(group)
+        for verbs in self.BLOOM_LEVELS.values():
+            terms.extend(verbs)
+        
+        terms.extend(assessment_criteria.get('preferred_action_verbs', []))
+        terms.extend(assessment_criteria.get('prohibited_terms', []))
+        for indicator in assessment_criteria.get('measurability_indicators', []):
+            terms.extend(indicator.split('_'))
+        terms.extend(self._get_discipline_keywords(discipline_name.lower()))
+        
+        return KeywordMatcher(terms)
     
     def _customize_discipline_criteria(self, discipline_name: str, 
                                      base_thresholds: Dict[QualityDimension, float],
@@ -341,56 +531,50 @@ class QualityScoringEngine:
         assessment_start = datetime.now()
         
         try:
-            with self.assessment_lock:
-                # Get discipline profile
-                discipline_profile = self.discipline_profiles.get(discipline_id)
-                if not discipline_profile:
-                    raise ValueError(f"No quality profile found for discipline {discipline_id}")
-                
-                # Assess each quality dimension
-                dimension_scores = {}
-                detailed_feedback = {}
-                
-                for dimension in QualityDimension:
-                    score, feedback = self._assess_dimension(
-                        standard_text, dimension, discipline_profile, additional_context
-                    )
-                    dimension_scores[dimension] = score
-                    detailed_feedback[dimension.value] = feedback
-                
-                # Calculate overall score using weighted average
-                overall_score = self._calculate_overall_score(dimension_scores, discipline_profile)
-                
-                # Determine quality level
-                quality_level = self._determine_quality_level(overall_score)
-                
-                # Calculate confidence in assessment
-                confidence = self._calculate_assessment_confidence(dimension_scores, standard_text)
-                
-                # Generate improvement suggestions
-                improvement_suggestions = self._generate_improvement_suggestions(
-                    dimension_scores, discipline_profile, standard_text
-                )
-                
-                # Create quality metrics
-                quality_metrics = QualityMetrics(
-                    standard_id=standard_id,
-                    discipline_id=discipline_id,
-                    overall_score=overall_score,
-                    dimension_scores=dimension_scores,
-                    quality_level=quality_level,
-                    confidence=confidence,
-                    assessment_timestamp=datetime.now(),
-                    assessment_method="automated_comprehensive",
-                    detailed_feedback=detailed_feedback,
-                    improvement_suggestions=improvement_suggestions
-                )
-                
-                # Update statistics
-                assessment_time = (datetime.now() - assessment_start).total_seconds()
-                self._update_scoring_stats(assessment_time, quality_level, True)
-                
-                return quality_metrics
+            # Get discipline profile
+            discipline_profile = self.discipline_profiles.get(discipline_id)
+            if not discipline_profile:
+                raise ValueError(f"No quality profile found for discipline {discipline_id}")
+            
+            # Assess each quality dimension from a single tokenization of the text
+            features = self._extract_text_features(standard_text, discipline_profile)
+            dimension_scores, detailed_feedback = self._assess_dimensions(
+                features, discipline_profile, additional_context
+            )
+            
+            # Calculate overall score using weighted average
+            overall_score = self._calculate_overall_score(dimension_scores, discipline_profile)
+            
+            # Determine quality level
+            quality_level = self._determine_quality_level(overall_score)
+            
+            # Calculate confidence in assessment
+            confidence = self._calculate_assessment_confidence(dimension_scores, features['word_count'])
+            
+            # Generate improvement suggestions
+            improvement_suggestions = self._generate_improvement_suggestions(
+                dimension_scores, discipline_profile, standard_text
+            )
+            
+            # Create quality metrics
+            quality_metrics = QualityMetrics(
+                standard_id=standard_id,
+                discipline_id=discipline_id,
+                overall_score=overall_score,
+                dimension_scores=dimension_scores,
+                quality_level=quality_level,
+                confidence=confidence,
+                assessment_timestamp=datetime.now(),
+                assessment_method="automated_comprehensive",
+                detailed_feedback=detailed_feedback,
+                improvement_suggestions=improvement_suggestions
+            )
+            
+            # Update statistics
+            assessment_time = (datetime.now() - assessment_start).total_seconds()
+            self._update_scoring_stats(assessment_time, quality_level, True)
+            
+            return quality_metrics
         
         except Exception as e:
             self.logger.error(f"Error assessing standard quality: {e}")
@@ -398,43 +582,84 @@ class QualityScoringEngine:
             self._update_scoring_stats(assessment_time, None, False)
             raise
     
-    def _assess_dimension(self, standard_text: str, 
+    def _assess_dimensions(self, features: Dict[str, Any],
+                          discipline_profile: DisciplineQualityProfile,
+                          additional_context: Optional[Dict[str, Any]]) -> Tuple[Dict[QualityDimension, float], Dict[str, Any]]:
+        """Assess every quality dimension for one tokenized standard"""
+        dimension_scores = {}
+        detailed_feedback = {}
+        
+        for dimension in QualityDimension:
+            score, feedback = self._assess_dimension(
+                features, dimension, discipline_profile, additional_context
+            )
+            dimension_scores[dimension] = score
+            detailed_feedback[dimension.value] = feedback
+        
+        return dimension_scores, detailed_feedback
+    
+    def _assess_dimension(self, features: Dict[str, Any], 
                          dimension: QualityDimension,
                          discipline_profile: DisciplineQualityProfile,
                          additional_context: Optional[Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
         """Assess a specific quality dimension"""
         
         if dimension == QualityDimension.CLARITY:
-            return self._assess_clarity(standard_text, discipline_profile)
+            return self._assess_clarity(features, discipline_profile)
         elif dimension == QualityDimension.COMPLETENESS:
-            return self._assess_completeness(standard_text, discipline_profile)
+            return self._assess_completeness(features, discipline_profile)
         elif dimension == QualityDimension.SPECIFICITY:
-            return self._assess_specificity(standard_text, discipline_profile)
+            return self._assess_specificity(features, discipline_profile)
         elif dimension == QualityDimension.MEASURABILITY:
-            return self._assess_measurability(standard_text, discipline_profile)
+            return self._assess_measurability(features, discipline_profile)
         elif dimension == QualityDimension.RELEVANCE:
-            return self._assess_relevance(standard_text, discipline_profile, additional_context)
+            return self._assess_relevance(features, discipline_profile, additional_context)
         elif dimension == QualityDimension.AUTHORITY:
-            return self._assess_authority(standard_text, discipline_profile, additional_context)
+            return self._assess_authority(features, discipline_profile, additional_context)
         elif dimension == QualityDimension.CONSISTENCY:
-            return self._assess_consistency(standard_text, discipline_profile)
+            return self._assess_consistency(features, discipline_profile)
         elif dimension == QualityDimension.PEDAGOGICAL_SOUNDNESS:
-            return self._assess_pedagogical_soundness(standard_text, discipline_profile)
+            return self._assess_pedagogical_soundness(features, discipline_profile)
         elif dimension == QualityDimension.DISCIPLINE_ALIGNMENT:
-            return self._assess_discipline_alignment(standard_text, discipline_profile)
+            return self._assess_discipline_alignment(features, discipline_profile)
         elif dimension == QualityDimension.COGNITIVE_APPROPRIATENESS:
-            return self._assess_cognitive_appropriateness(standard_text, discipline_profile)
+            return self._assess_cognitive_appropriateness(features, discipline_profile)
         else:
             return 0.5, {'error': f'Unknown dimension: {dimension}'}
     
-    def _assess_clarity(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _extract_text_features(self, text: str, profile: DisciplineQualityProfile) -> Dict[str, Any]:
+        """Tokenize a standard once for all dimension assessments
+        
+        Returns:
+            Lowercased text, word lists, sentence statistics and the profile terms
+            found in the text, shared by the _assess_* methods
+        """
+        if profile.term_matcher is None:
+            profile.term_matcher = self._build_term_matcher(profile.discipline_name, profile.assessment_criteria)
+        
+        lower = text.lower()
+        words = text.split()
+        sentences = [s for s in re.split(r'[.!?]+', text) if s.strip()]
+        
+        return {
+            'text': text,
+            'lower': lower,
+            'words': words,
+            'lower_words': lower.split(),
+            'terms': profile.term_matcher.find(lower),
+            'word_count': len(words),
+            'sentence_count': len(sentences),
+            'avg_sentence_length': sum(len(s.split()) for s in sentences) / max(1, len(sentences))
+        }
+    
+    def _assess_clarity(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess clarity of the standard"""
         feedback = {'dimension': 'clarity', 'factors': []}
         score = 0.5  # Base score
+        terms = features['terms']
         
         # Check sentence length (shorter sentences are clearer)
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences if s.strip()) / max(1, len([s for s in sentences if s.strip()]))
+        avg_sentence_length = features['avg_sentence_length']
         
         if avg_sentence_length <= 15:
             score += 0.2
@@ -445,8 +670,8 @@ class QualityScoringEngine:
             feedback['factors'].append('sentences_too_long')
         
         # Check for jargon and complex terms
-        complex_words = len([word for word in text.split() if len(word) > 10])
-        total_words = len(text.split())
+        complex_words = len([word for word in features['words'] if len(word) > 10])
+        total_words = features['word_count']
         complex_ratio = complex_words / max(1, total_words)
         
         if complex_ratio < 0.1:
@@ -459,7 +684,7 @@ class QualityScoringEngine:
         
         # Check for clear action verbs
         action_verbs = profile.assessment_criteria.get('preferred_action_verbs', [])
-        found_action_verbs = [verb for verb in action_verbs if verb.lower() in text.lower()]
+        found_action_verbs = [verb for verb in action_verbs if verb.lower() in terms]
         
         if found_action_verbs:
             score += 0.2
@@ -467,7 +692,7 @@ class QualityScoringEngine:
         
         # Check for vague terms
         vague_terms = profile.assessment_criteria.get('prohibited_terms', [])
-        found_vague_terms = [term for term in vague_terms if term.lower() in text.lower()]
+        found_vague_terms = [term for term in vague_terms if term.lower() in terms]
         
         if found_vague_terms:
             score -= 0.2
@@ -477,10 +702,11 @@ class QualityScoringEngine:
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_completeness(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_completeness(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess completeness of the standard"""
         feedback = {'dimension': 'completeness', 'factors': []}
         score = 0.3  # Base score
+        terms = features['terms']
         
         # Check for required components
         required_components = profile.assessment_criteria.get('required_components', [])
@@ -488,7 +714,7 @@ class QualityScoringEngine:
         # Action verb component
         if 'action_verb' in required_components:
             action_verbs = profile.assessment_criteria.get('preferred_action_verbs', [])
-            if any(verb.lower() in text.lower() for verb in action_verbs):
+            if any(verb.lower() in terms for verb in action_verbs):
                 score += 0.2
                 feedback['factors'].append('has_action_verb')
             else:
@@ -497,7 +723,7 @@ class QualityScoringEngine:
         # Content area component
         if 'content_area' in required_components:
             # Simple heuristic: check if standard mentions specific content
-            if any(word in text.lower() for word in ['topic', 'concept', 'skill', 'knowledge', 'theory']):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['content_area']):
                 score += 0.2
                 feedback['factors'].append('has_content_area')
             else:
@@ -505,15 +731,14 @@ class QualityScoringEngine:
         
         # Context component
         if 'context' in required_components:
-            context_indicators = ['when', 'where', 'how', 'under', 'during', 'through', 'using']
-            if any(indicator in text.lower() for indicator in context_indicators):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['context']):
                 score += 0.2
                 feedback['factors'].append('has_context')
             else:
                 feedback['factors'].append('missing_context')
         
         # Check word count adequacy
-        word_count = len(text.split())
+        word_count = features['word_count']
         min_words = profile.assessment_criteria.get('min_word_count', 10)
         max_words = profile.assessment_criteria.get('max_word_count', 500)
         
@@ -524,37 +749,37 @@ class QualityScoringEngine:
             feedback['factors'].append(f'inappropriate_length: {word_count} words')
         
         # Check for learning outcome specification
-        outcome_indicators = ['will be able to', 'can', 'demonstrate', 'show', 'exhibit']
-        if any(indicator in text.lower() for indicator in outcome_indicators):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['outcome']):
             score += 0.2
             feedback['factors'].append('specifies_outcome')
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_specificity(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_specificity(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess specificity of the standard"""
         feedback = {'dimension': 'specificity', 'factors': []}
         score = 0.4  # Base score
+        lower = features['lower']
+        terms = features['terms']
         
         # Check for specific quantities, numbers, or criteria
-        if re.search(r'\d+', text):
+        if re.search(r'\d+', lower):
             score += 0.2
             feedback['factors'].append('contains_specific_numbers')
         
         # Check for specific examples or instances
-        if any(word in text.lower() for word in ['such as', 'for example', 'including', 'like']):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['examples']):
             score += 0.15
             feedback['factors'].append('provides_examples')
         
         # Check for detailed descriptions
-        descriptive_words = ['specific', 'detailed', 'precise', 'exact', 'particular']
-        if any(word in text.lower() for word in descriptive_words):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['descriptive']):
             score += 0.1
             feedback['factors'].append('uses_descriptive_language')
         
         # Check for concrete vs abstract language
-        concrete_indicators = len(re.findall(r'\b(process|method|technique|procedure|step|stage)\b', text.lower()))
-        abstract_indicators = len(re.findall(r'\b(understand|know|appreciate|value|believe)\b', text.lower()))
+        concrete_indicators = len(re.findall(r'\b(process|method|technique|procedure|step|stage)\b', lower))
+        abstract_indicators = len(re.findall(r'\b(understand|know|appreciate|value|believe)\b', lower))
         
         if concrete_indicators > abstract_indicators:
             score += 0.2
@@ -564,24 +789,20 @@ class QualityScoringEngine:
             feedback['factors'].append('abstract_language_dominant')
         
         # Check for measurable criteria
-        measurable_terms = ['measure', 'assess', 'evaluate', 'test', 'score', 'rate', 'compare']
-        if any(term in text.lower() for term in measurable_terms):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['measurable']):
             score += 0.15
             feedback['factors'].append('includes_measurable_criteria')
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_measurability(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_measurability(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess measurability of the standard"""
         feedback = {'dimension': 'measurability', 'factors': []}
         score = 0.3  # Base score
+        terms = features['terms']
         
         # Check for observable action verbs
-        observable_verbs = [
-            'demonstrate', 'show', 'perform', 'create', 'produce', 'write', 'solve', 
-            'calculate', 'identify', 'classify', 'compare', 'analyze', 'evaluate'
-        ]
-        found_observable = [verb for verb in observable_verbs if verb in text.lower()]
+        found_observable = [verb for verb in self.ASSESSMENT_TERMS['observable_verbs'] if verb in terms]
         
         if found_observable:
             score += 0.3
@@ -589,38 +810,37 @@ class QualityScoringEngine:
         
         # Check for quantifiable outcomes
         quantifiable_indicators = profile.assessment_criteria.get('measurability_indicators', [])
-        found_quantifiable = [ind for ind in quantifiable_indicators if any(word in text.lower() for word in ind.split('_'))]
+        found_quantifiable = [ind for ind in quantifiable_indicators if any(word in terms for word in ind.split('_'))]
         
         if found_quantifiable:
             score += 0.2
             feedback['factors'].append(f'quantifiable_outcomes: {found_quantifiable}')
         
         # Check for assessment criteria
-        assessment_terms = ['criterion', 'criteria', 'rubric', 'benchmark', 'standard', 'level', 'proficiency']
-        if any(term in text.lower() for term in assessment_terms):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['assessment']):
             score += 0.2
             feedback['factors'].append('includes_assessment_criteria')
         
         # Penalize non-observable verbs
-        non_observable = ['understand', 'know', 'appreciate', 'value', 'believe', 'think']
-        found_non_observable = [verb for verb in non_observable if verb in text.lower()]
+        found_non_observable = [verb for verb in self.ASSESSMENT_TERMS['non_observable_verbs'] if verb in terms]
         
         if found_non_observable:
             score -= 0.2
             feedback['factors'].append(f'non_observable_verbs: {found_non_observable}')
         
         # Check for conditions and constraints
-        if any(word in text.lower() for word in ['when', 'given', 'provided', 'under conditions']):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['conditions']):
             score += 0.1
             feedback['factors'].append('specifies_conditions')
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_relevance(self, text: str, profile: DisciplineQualityProfile, 
+    def _assess_relevance(self, features: Dict[str, Any], profile: DisciplineQualityProfile, 
                          context: Optional[Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
         """Assess relevance of the standard to the discipline"""
         feedback = {'dimension': 'relevance', 'factors': []}
         score = 0.5  # Base score
+        terms = features['terms']
         
         # Check for discipline-specific terminology
         discipline_name = profile.discipline_name.lower()
@@ -628,8 +848,8 @@ class QualityScoringEngine:
         # Create discipline-specific keyword lists
         discipline_keywords = self._get_discipline_keywords(discipline_name)
         
-        found_keywords = [kw for kw in discipline_keywords if kw.lower() in text.lower()]
-        keyword_ratio = len(found_keywords) / max(1, len(text.split()))
+        found_keywords = [kw for kw in discipline_keywords if kw.lower() in terms]
+        keyword_ratio = len(found_keywords) / max(1, features['word_count'])
         
         if keyword_ratio > 0.1:
             score += 0.3
@@ -644,14 +864,12 @@ class QualityScoringEngine:
             feedback['factors'].append('low_discipline_relevance')
         
         # Check for contemporary relevance
-        contemporary_terms = ['current', 'modern', 'contemporary', 'recent', 'today', 'now']
-        if any(term in text.lower() for term in contemporary_terms):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['contemporary']):
             score += 0.1
             feedback['factors'].append('contemporary_relevance')
         
         # Check for real-world application
-        application_terms = ['apply', 'use', 'implement', 'practice', 'real-world', 'practical']
-        if any(term in text.lower() for term in application_terms):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['application']):
             score += 0.1
             feedback['factors'].append('real_world_application')
         
@@ -674,7 +892,7 @@ class QualityScoringEngine:
         
         return keyword_map.get(discipline_name, [])
     
-    def _assess_authority(self, text: str, profile: DisciplineQualityProfile, 
+    def _assess_authority(self, features: Dict[str, Any], profile: DisciplineQualityProfile, 
                          context: Optional[Dict[str, Any]]) -> Tuple[float, Dict[str, Any]]:
         """Assess authority and credibility of the standard"""
         feedback = {'dimension': 'authority', 'factors': []}
@@ -698,20 +916,19 @@ class QualityScoringEngine:
                 feedback['factors'].append('high_source_authority')
         
         # Check for evidence-based language
-        evidence_terms = ['research', 'evidence', 'study', 'data', 'findings', 'proven', 'validated']
-        if any(term in text.lower() for term in evidence_terms):
+        if not features['terms'].isdisjoint(self.ASSESSMENT_TERMS['evidence']):
             score += 0.1
             feedback['factors'].append('evidence_based_language')
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_consistency(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_consistency(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess internal consistency of the standard"""
         feedback = {'dimension': 'consistency', 'factors': []}
         score = 0.7  # Base score assuming reasonable consistency
         
         # Check for consistent terminology
-        words = text.lower().split()
+        words = features['lower_words']
         word_variants = {}
         
         # Simple consistency check for key terms
@@ -733,24 +950,16 @@ class QualityScoringEngine:
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_pedagogical_soundness(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_pedagogical_soundness(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess pedagogical soundness of the standard"""
         feedback = {'dimension': 'pedagogical_soundness', 'factors': []}
         score = 0.5  # Base score
+        terms = features['terms']
         
         # Check for appropriate cognitive level
-        bloom_levels = {
-            'remember': ['remember', 'recall', 'recognize', 'identify'],
-            'understand': ['understand', 'explain', 'interpret', 'summarize'],
-            'apply': ['apply', 'use', 'implement', 'execute'],
-            'analyze': ['analyze', 'examine', 'compare', 'categorize'],
-            'evaluate': ['evaluate', 'judge', 'critique', 'assess'],
-            'create': ['create', 'design', 'compose', 'develop']
-        }
-        
         found_levels = []
-        for level, verbs in bloom_levels.items():
-            if any(verb in text.lower() for verb in verbs):
+        for level, verbs in self.BLOOM_LEVELS.items():
+            if not terms.isdisjoint(verbs):
                 found_levels.append(level)
         
         if found_levels:
@@ -766,17 +975,17 @@ class QualityScoringEngine:
                 feedback['factors'].append(f'basic_cognitive_level: {found_levels}')
         
         # Check for scaffolding indicators
-        scaffolding_terms = ['build', 'develop', 'progress', 'sequence', 'prerequisite']
-        if any(term in text.lower() for term in scaffolding_terms):
+        if not terms.isdisjoint(self.ASSESSMENT_TERMS['scaffolding']):
             score += 0.1
             feedback['factors'].append('includes_scaffolding')
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_discipline_alignment(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_discipline_alignment(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess alignment with discipline standards"""
         feedback = {'dimension': 'discipline_alignment', 'factors': []}
         score = 0.6  # Base score
+        terms = features['terms']
         
         # This would typically involve comparison with established discipline frameworks
         # For now, we'll use discipline-specific criteria
@@ -786,16 +995,16 @@ class QualityScoringEngine:
         
         if discipline_name in ['mathematics', 'physics', 'chemistry']:
             # STEM alignment criteria
-            if any(term in text.lower() for term in ['solve', 'calculate', 'analyze', 'model']):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['stem_processes']):
                 alignment_score += 0.2
-            if any(term in text.lower() for term in ['formula', 'equation', 'theorem', 'principle']):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['stem_concepts']):
                 alignment_score += 0.2
         
         elif discipline_name in ['literature', 'english', 'writing']:
             # Language arts alignment
-            if any(term in text.lower() for term in ['read', 'write', 'analyze', 'interpret']):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['language_skills']):
                 alignment_score += 0.2
-            if any(term in text.lower() for term in ['text', 'author', 'theme', 'character']):
+            if not terms.isdisjoint(self.ASSESSMENT_TERMS['literary_concepts']):
                 alignment_score += 0.2
         
         score += alignment_score
@@ -804,13 +1013,13 @@ class QualityScoringEngine:
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _assess_cognitive_appropriateness(self, text: str, profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
+    def _assess_cognitive_appropriateness(self, features: Dict[str, Any], profile: DisciplineQualityProfile) -> Tuple[float, Dict[str, Any]]:
         """Assess cognitive appropriateness of the standard"""
         feedback = {'dimension': 'cognitive_appropriateness', 'factors': []}
         score = 0.6  # Base score
         
         # Check complexity level
-        sentence_complexity = self._calculate_text_complexity(text)
+        sentence_complexity = self._calculate_text_complexity(features)
         
         if 0.3 <= sentence_complexity <= 0.7:  # Appropriate complexity range
             score += 0.2
@@ -823,8 +1032,8 @@ class QualityScoringEngine:
         
         # Check for age-appropriate language
         # This is a simplified check - would need more sophisticated analysis
-        academic_terms = len([word for word in text.split() if len(word) > 8])
-        total_words = len(text.split())
+        academic_terms = len([word for word in features['words'] if len(word) > 8])
+        total_words = features['word_count']
         academic_ratio = academic_terms / max(1, total_words)
         
         if academic_ratio < 0.3:
@@ -835,14 +1044,10 @@ class QualityScoringEngine:
         
         return min(1.0, max(0.0, score)), feedback
     
-    def _calculate_text_complexity(self, text: str) -> float:
+    def _calculate_text_complexity(self, features: Dict[str, Any]) -> float:
         """Calculate text complexity score"""
-        sentences = re.split(r'[.!?]+', text)
-        if not sentences:
-            return 0.0
-        
-        total_words = len(text.split())
-        total_sentences = len([s for s in sentences if s.strip()])
+        total_words = features['word_count']
+        total_sentences = features['sentence_count']
         
         if total_sentences == 0:
             return 0.0
@@ -850,7 +1055,7 @@ class QualityScoringEngine:
         avg_sentence_length = total_words / total_sentences
         
         # Simple complexity based on sentence length and word length
-        long_words = len([word for word in text.split() if len(word) > 6])
+        long_words = len([word for word in features['words'] if len(word) > 6])
         complexity = (avg_sentence_length / 20.0) + (long_words / total_words)
         
         return min(1.0, complexity)
@@ -882,13 +1087,12 @@ class QualityScoringEngine:
             return QualityLevel.VERY_POOR
     
     def _calculate_assessment_confidence(self, dimension_scores: Dict[QualityDimension, float],
-                                       text: str) -> float:
+                                       word_count: int) -> float:
         """Calculate confidence in the quality assessment"""
         # Base confidence
         confidence = 0.7
         
         # Higher confidence with more text to analyze
-        word_count = len(text.split())
         if word_count >= 50:
             confidence += 0.1
         elif word_count >= 20:
@@ -943,45 +1147,319 @@ class QualityScoringEngine:
     def _update_scoring_stats(self, assessment_time: float, 
                              quality_level: Optional[QualityLevel], success: bool):
         """Update scoring statistics"""
-        self.scoring_stats['total_assessments'] += 1
-        
-        if success:
-            self.scoring_stats['successful_assessments'] += 1
-            if quality_level:
-                self.scoring_stats['quality_distribution'][quality_level.value] += 1
-        
-        # Update average assessment time
-        total = self.scoring_stats['total_assessments']
-        current_avg = self.scoring_stats['avg_assessment_time']
-        self.scoring_stats['avg_assessment_time'] = (
-            (current_avg * (total - 1) + assessment_time) / total
-        )
+        with self.assessment_lock:
+            self.scoring_stats['total_assessments'] += 1
+            
+            if success:
+                self.scoring_stats['successful_assessments'] += 1
+                if quality_level:
+                    self.scoring_stats['quality_distribution'][quality_level.value] += 1
+            
+            # Update average assessment time
+            total = self.scoring_stats['total_assessments']
+            current_avg = self.scoring_stats['avg_assessment_time']
+            self.scoring_stats['avg_assessment_time'] = (
+                (current_avg * (total - 1) + assessment_time) / total
+            )
     
     def get_scoring_statistics(self) -> Dict[str, Any]:
         """Get quality scoring statistics"""
-        return self.scoring_stats.copy()
+        with self.assessment_lock:
+            stats = self.scoring_stats.copy()
+            stats['quality_distribution'] = dict(stats['quality_distribution'])
+            return stats
     
-    def batch_assess_standards(self, standards: List[Dict[str, Any]]) -> List[QualityMetrics]:
+    def batch_assess_standards(self, standards: List[Dict[str, Any]],
+                               max_workers: Optional[int] = None) -> List[QualityMetrics]:
         """Assess quality for multiple standards
         
+        Each standard is tokenized once and the batch is scored in chunks of
+        BATCH_CHUNK_SIZE. Overall scores, confidences and quality levels for a
+        chunk are computed together over NumPy arrays when NumPy is available.
+        Batches of at least PARALLEL_BATCH_THRESHOLD standards are spread over
+        a process pool.
+        
         Args:
             standards: List of standard dictionaries with required fields
+            max_workers: Worker processes for large batches; 1 keeps scoring in-process
             
         Returns:
-            List of quality metrics
+            List of quality metrics in input order; standards that fail are logged and skipped
         """
+        chunks = [standards[i:i + self.BATCH_CHUNK_SIZE]
+                  for i in range(0, len(standards), self.BATCH_CHUNK_SIZE)]
+        
+        workers = max_workers or os.cpu_count() or 1
+        
+        chunk_results = None
+        if len(standards) >= self.PARALLEL_BATCH_THRESHOLD and len(chunks) > 1 and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunk_results = list(executor.map(self._assess_chunk, chunks))
+            except Exception as e:
+                self.logger.warning(f"Process pool unavailable, scoring batch in-process: {e}")
+        
+        if chunk_results is None:
+            chunk_results = [self._assess_chunk(chunk) for chunk in chunks]
+        
         results = []
+        for metrics, errors, elapsed in chunk_results:
+            assessment_time = elapsed / max(1, len(metrics) + len(errors))
+            
+            for quality_metrics in metrics:
+                self._update_scoring_stats(assessment_time, quality_metrics.quality_level, True)
+            
+            for standard_id, error in errors:
+                self.logger.error(f"Error assessing standard {standard_id}: {error}")
+                self._update_scoring_stats(assessment_time, None, False)
+            
+            results.extend(metrics)
+        
+        return results
+    
+    def assess_standards_incremental(self, standards: List[Dict[str, Any]],
+                                     force: bool = False,
+                                     max_workers: Optional[int] = None) -> List[QualityMetrics]:
+        """Assess standards, reusing persisted scores for those that have not changed
+        
+        A stored score is reused when the standard's text and context hash and its
+        discipline profile version both match what the score was computed from.
+        Everything else is scored with batch_assess_standards and persisted.
+        
+        Args:
+            standards: List of standard dictionaries with required fields
+            force: Rescore every standard regardless of stored scores
+            max_workers: Worker processes for large rescoring batches
+            
+        Returns:
+            List of quality metrics in input order; standards that fail are logged and skipped
+        """
+        input_hashes = {
+            standard['standard_id']: self._assessment_input_hash(standard['standard_text'], standard.get('context'))
+            for standard in standards
+        }
+        
+        stored = {}
+        if not force:
+            try:
+                stored = self.db.get_quality_scores(input_hashes.keys())
+            except Exception as e:
+                self.logger.warning(f"Could not load stored quality scores, rescoring all: {e}")
+        
+        metrics_by_id = {}
+        to_score = []
+        for standard in standards:
+            row = stored.get(standard['standard_id'])
+            profile = self.discipline_profiles.get(standard['discipline_id'])
+            if (row and profile and row['discipline_id'] == standard['discipline_id'] and
+                    row['text_hash'] == input_hashes[standard['standard_id']] and
+                    row['profile_version'] == profile.profile_version):
+                metrics_by_id[standard['standard_id']] = self._metrics_from_stored_score(row)
+            else:
+                to_score.append(standard)
+        
+        with self.assessment_lock:
+            self.scoring_stats['reused_assessments'] += len(metrics_by_id)
+        
+        if to_score:
+            scored = self.batch_assess_standards(to_score, max_workers=max_workers)
+            self.save_quality_scores(scored, input_hashes)
+            for quality_metrics in scored:
+                metrics_by_id[quality_metrics.standard_id] = quality_metrics
+        
+        self.logger.info(f"Incremental assessment: reused {len(standards) - len(to_score)}, "
+                         f"rescored {len(to_score)} standards")
+        
+        return [metrics_by_id[standard['standard_id']] for standard in standards
+                if standard['standard_id'] in metrics_by_id]
+    
+    def save_quality_scores(self, metrics: List[QualityMetrics], input_hashes: Dict[int, str]):
+        """Persist quality metrics with the inputs they were computed from
+        
+        Args:
+            metrics: Quality metrics to store
+            input_hashes: Standard ID to _assessment_input_hash of the text and context scored
+        """
+        rows = []
+        for quality_metrics in metrics:
+            profile = self.discipline_profiles.get(quality_metrics.discipline_id)
+            rows.append((
+                quality_metrics.standard_id,
+                quality_metrics.discipline_id,
+                input_hashes[quality_metrics.standard_id],
+                profile.profile_version if profile else '',
+                quality_metrics.overall_score,
+                quality_metrics.quality_level.value,
+                quality_metrics.confidence,
+                {dim.value: score for dim, score in quality_metrics.dimension_scores.items()},
+                quality_metrics.detailed_feedback,
+                quality_metrics.improvement_suggestions,
+                quality_metrics.assessment_method,
+                quality_metrics.assessment_timestamp
+            ))
+        
+        try:
+            self.db.save_quality_scores(rows)
+        except Exception as e:
+            self.logger.warning(f"Could not persist quality scores: {e}")
+    
+    def get_cached_quality_scores(self, standard_ids: List[int],
+                                  include_stale: bool = False) -> Dict[int, QualityMetrics]:
+        """Bulk-fetch persisted quality metrics without scoring anything
+        
+        Args:
+            standard_ids: Standard IDs to look up
+            include_stale: Also return scores computed under an outdated discipline profile
+            
+        Returns:
+            Quality metrics keyed by standard ID; standards without a usable stored score are absent
+        """
+        cached = {}
+        for standard_id, row in self.db.get_quality_scores(standard_ids).items():
+            profile = self.discipline_profiles.get(row['discipline_id'])
+            if include_stale or (profile and row['profile_version'] == profile.profile_version):
+                cached[standard_id] = self._metrics_from_stored_score(row)
+        
+        return cached
+    
+    @staticmethod
+    def _assessment_input_hash(standard_text: str, additional_context: Optional[Dict[str, Any]]) -> str:
+        """Hash the text and context an assessment depends on"""
+        context = json.dumps(additional_context, sort_keys=True, default=str) if additional_context else ''
+        return hashlib.sha256(f"{standard_text}\x00{context}".encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _metrics_from_stored_score(row: Dict[str, Any]) -> QualityMetrics:
+        """Rebuild QualityMetrics from a standard_quality_scores row"""
+        def from_json(value):
+            return json.loads(value) if isinstance(value, str) else value
+        
+        timestamp = row['assessment_timestamp']
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        
+        # JSONB does not keep key order; restore the QualityDimension order
+        stored_scores = from_json(row['dimension_scores']) or {}
+        
+        return QualityMetrics(
+            standard_id=row['standard_id'],
+            discipline_id=row['discipline_id'],
+            overall_score=row['overall_score'],
+            dimension_scores={dim: stored_scores[dim.value] for dim in QualityDimension
+                              if dim.value in stored_scores},
+            quality_level=QualityLevel(row['quality_level']),
+            confidence=row['confidence'],
+            assessment_timestamp=timestamp,
+            assessment_method=row['assessment_method'],
+            detailed_feedback=from_json(row['detailed_feedback']) or {},
+            improvement_suggestions=from_json(row['improvement_suggestions']) or []
+        )
+    
+    def _assess_chunk(self, standards: List[Dict[str, Any]]) -> Tuple[List[QualityMetrics], List[Tuple[Any, str]], float]:
+        """Score one chunk of a batch; runs in a worker process for large batches
+        
+        Returns:
+            Quality metrics, (standard_id, error) pairs for failed standards, and elapsed seconds
+        """
+        chunk_start = datetime.now()
+        assessed = []
+        errors = []
         
         for standard in standards:
             try:
-                metrics = self.assess_standard_quality(
-                    standard_id=standard['standard_id'],
-                    standard_text=standard['standard_text'],
-                    discipline_id=standard['discipline_id'],
-                    additional_context=standard.get('context')
+                discipline_profile = self.discipline_profiles.get(standard['discipline_id'])
+                if not discipline_profile:
+                    raise ValueError(f"No quality profile found for discipline {standard['discipline_id']}")
+                
+                features = self._extract_text_features(standard['standard_text'], discipline_profile)
+                dimension_scores, detailed_feedback = self._assess_dimensions(
+                    features, discipline_profile, standard.get('context')
                 )
-                results.append(metrics)
+                assessed.append((standard, discipline_profile, features['word_count'],
+                                 dimension_scores, detailed_feedback))
             except Exception as e:
-                self.logger.error(f"Error assessing standard {standard.get('standard_id')}: {e}")
+                errors.append((standard.get('standard_id'), str(e)))
+        
+        metrics = []
+        if assessed:
+            overall_scores, confidences, quality_levels = self._aggregate_batch_scores(
+                [item[3] for item in assessed],
+                [item[1] for item in assessed],
+                [item[2] for item in assessed]
+            )
+            assessment_timestamp = datetime.now()
+            
+            for (standard, discipline_profile, _, dimension_scores, detailed_feedback), \
+                    overall_score, confidence, quality_level in zip(assessed, overall_scores,
+                                                                    confidences, quality_levels):
+                metrics.append(QualityMetrics(
+                    standard_id=standard['standard_id'],
+                    discipline_id=standard['discipline_id'],
+                    overall_score=overall_score,
+                    dimension_scores=dimension_scores,
+                    quality_level=quality_level,
+                    confidence=confidence,
+                    assessment_timestamp=assessment_timestamp,
+                    assessment_method="automated_comprehensive",
+                    detailed_feedback=detailed_feedback,
+                    improvement_suggestions=self._generate_improvement_suggestions(
+                        dimension_scores, discipline_profile, standard['standard_text']
+                    )
+                ))
+        
+        return metrics, errors, (datetime.now() - chunk_start).total_seconds()
+    
+    def _aggregate_batch_scores(self, dimension_scores: List[Dict[QualityDimension, float]],
+                                profiles: List[DisciplineQualityProfile],
+                                word_counts: List[int]) -> Tuple[List[float], List[float], List[QualityLevel]]:
+        """Compute overall scores, confidences and quality levels for a chunk
         
-        return results
\ No newline at end of file
+        Vectorized equivalent of _calculate_overall_score, _calculate_assessment_confidence
+        and _determine_quality_level; falls back to them when NumPy is unavailable.
+        """
+        if not HAS_NUMPY:
+            overall_scores = [self._calculate_overall_score(scores, profile)
+                              for scores, profile in zip(dimension_scores, profiles)]
+            confidences = [self._calculate_assessment_confidence(scores, word_count)
+                           for scores, word_count in zip(dimension_scores, word_counts)]
+            quality_levels = [self._determine_quality_level(score) for score in overall_scores]
+            return overall_scores, confidences, quality_levels
+        
+        dimensions = list(QualityDimension)
+        weight_rows = {}
+        for profile in profiles:
+            if profile.discipline_id not in weight_rows:
+                weight_rows[profile.discipline_id] = [
+                    profile.weighting_factors.get(dimension, 0.1) for dimension in dimensions
+                ]
+        
+        scores = np.array([[row[dimension] for dimension in dimensions] for row in dimension_scores])
+        weights = np.array([weight_rows[profile.discipline_id] for profile in profiles])
+        words = np.array(word_counts)
+        
+        # Weighted average across dimensions, accumulated in dimension order so that
+        # scores on a level boundary round exactly as in _calculate_overall_score
+        total_score = np.zeros(len(scores))
+        total_weight = np.zeros(len(scores))
+        for column in range(len(dimensions)):
+            total_score += scores[:, column] * weights[:, column]
+            total_weight += weights[:, column]
+        overall = total_score / np.maximum(total_weight, 0.001)
+        
+        # Confidence from text length and score consistency across dimensions. np.std and
+        # statistics.stdev can round to opposite sides of a threshold, so rows that land
+        # next to one are recomputed exactly as in _calculate_assessment_confidence
+        score_std = scores.std(axis=1, ddof=1) if len(dimensions) > 1 else np.zeros(len(scores))
+        near_threshold = np.flatnonzero(np.minimum(np.abs(score_std - 0.2), np.abs(score_std - 0.4))
+                                        < self.CONFIDENCE_STD_TOLERANCE)
+        for row in near_threshold:
+            score_std[row] = statistics.stdev(dimension_scores[row].values())
+        confidence = (0.7
+                      + np.where(words >= 50, 0.1, np.where(words >= 20, 0.05, 0.0))
+                      + np.where(score_std < 0.2, 0.1, np.where(score_std > 0.4, -0.1, 0.0)))
+        confidence = np.clip(confidence, 0.0, 1.0)
+        
+        level_bins = np.digitize(overall, self.QUALITY_LEVEL_BOUNDARIES)
+        quality_levels = [self.QUALITY_LEVELS_BY_BIN[level_bin] for level_bin in level_bins]
+        
+        return overall.tolist(), confidence.tolist(), quality_levels
@@ -172,7 +172,18 @@ class AutomatedTestFramework:
                 "test_discovery_agent_unit",
                 "test_retrieval_agent_unit",
                 "test_processing_agent_unit",
-                "test_validation_agent_unit"
+                "test_validation_agent_unit",
+                "test_database_manager_unit",
+                "test_query_cache_unit",
+                "test_bulk_insert_unit",
+                "test_keyset_pagination_unit",
+                "test_streaming_query_unit",
+                "test_async_database_manager_unit",
+                "test_response_cache_unit",
+                "test_quality_scoring_batch_unit",
+                "test_keyword_matcher_unit",
+                "test_incremental_quality_scoring_unit",
+                "test_performance_time_series_unit"
             ],
             dependencies=[],
             timeout=180,
@@ -9,8 +9,10 @@ Author: Autonomous AI Development System
 """
 
 import unittest
+import asyncio
 import tempfile
 import json
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
@@ -27,6 +29,12 @@ from core.agents.discovery_agent import DiscoveryAgent
 from core.agents.retrieval_agent import RetrievalAgent
 from core.agents.processing_agent import ProcessingAgent
 from core.agents.validation_agent import ValidationAgent
+from data.database_manager import DatabaseManager, DatabaseConfig, StandardRecord
+from data.async_database_manager import AsyncDatabaseManager, HAS_AIOSQLITE
+from api.api_generator import APIGenerator, HAS_FLASK
+from quality.quality_scoring import QualityScoringEngine, KeywordMatcher, QualityDimension
+from monitoring.performance_monitor import (PerformanceMonitor, PerformanceMetric,
+                                            PerformanceMetricType, MetricTimeSeriesStore)
 
 def test_config_manager_unit() -> dict:
     """Test ConfigManager unit functionality"""
@@ -654,6 +662,917 @@ def test_validation_agent_unit() -> dict:
     
     return results
 
+def test_database_manager_unit() -> dict:
+    """Test DatabaseManager unit functionality with SQLite"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                pool_size=2
+            )
+            db = DatabaseManager(config)
+            
+            # Test 1: Connections are pooled and reused
+            first = db.get_connection()
+            db.return_connection(first)
+            second = db.get_connection()
+            db.return_connection(second)
+            assert first is second
+            results['assertions_passed'] += 1
+            
+            # Test 2: Pragmas applied to pooled connections
+            journal_mode = db.execute_query("PRAGMA journal_mode")[0]['journal_mode']
+            assert journal_mode.lower() == 'wal'
+            cache_size = db.execute_query("PRAGMA cache_size")[0]['cache_size']
+            assert cache_size == config.sqlite_cache_size
+            results['assertions_passed'] += 1
+            
+            # Test 3: Writes on one pooled connection are visible to the next query
+            db.execute_query("CREATE TABLE items (item_id INTEGER PRIMARY KEY, name TEXT)", fetch_results=False)
+            db.execute_query("INSERT INTO items (name) VALUES (?)", ('algebra',), fetch_results=False)
+            rows = db.execute_query("SELECT name FROM items")
+            assert rows == [{'name': 'algebra'}]
+            results['assertions_passed'] += 1
+            
+            # Test 4: Pool never opens more than pool_size connections
+            held = [db.get_connection(), db.get_connection()]
+            assert len({id(conn) for conn in held}) == 2
+            assert db.get_connection_stats()['connections_in_use'] == 2
+            for conn in held:
+                db.return_connection(conn)
+            stats = db.get_connection_stats()
+            assert stats['pool_size'] == 2
+            assert stats['available_connections'] == 2
+            assert stats['connections_in_use'] == 0
+            results['assertions_passed'] += 1
+            
+            # Test 5: An idle pool that has not opened every slot reports none in use
+            lazy_db = DatabaseManager(DatabaseConfig(
+                database_type="sqlite", sqlite_path=str(Path(temp_dir) / 'lazy.db'), pool_size=4
+            ))
+            lazy_db.execute_query("SELECT 1 AS one", use_cache=False)
+            lazy_stats = lazy_db.get_connection_stats()
+            assert lazy_stats['connections_open'] == 1 and lazy_stats['connections_in_use'] == 0
+            lazy_db.connection_pool.closeall()
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['database_manager_tests'] = 'All DatabaseManager unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 5
+    
+    return results
+
+def test_query_cache_unit() -> dict:
+    """Test DatabaseManager query result cache and invalidation"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db')
+            )
+            db = DatabaseManager(config)
+            db.cache_dir = Path(temp_dir)
+            db.query_cache.cache_dir = Path(temp_dir)
+            
+            db.execute_query("CREATE TABLE educational_standards (standard_id INTEGER PRIMARY KEY, standard_text TEXT)", fetch_results=False)
+            db.execute_query("CREATE TABLE disciplines (discipline_id INTEGER PRIMARY KEY, discipline_name TEXT)", fetch_results=False)
+            db.execute_query("INSERT INTO educational_standards (standard_text) VALUES ('Solve linear equations')", fetch_results=False)
+            db.execute_query("INSERT INTO disciplines (discipline_name) VALUES ('Mathematics')", fetch_results=False)
+            
+            standards_query = "SELECT standard_text FROM educational_standards ORDER BY standard_id"
+            disciplines_query = "SELECT discipline_name FROM disciplines"
+            
+            # Test 1: Repeated SELECTs are served from the cache
+            first = db.execute_query(standards_query)
+            second = db.execute_query("SELECT standard_text\n  FROM educational_standards ORDER BY standard_id")
+            assert first == second == [{'standard_text': 'Solve linear equations'}]
+            assert db.query_stats['cache_hits'] == 1
+            assert db.query_stats['cache_misses'] == 1
+            results['assertions_passed'] += 1
+            
+            # Test 2: Cached results are copies callers can mutate safely
+            second[0]['standard_text'] = 'mutated'
+            assert db.execute_query(standards_query)[0]['standard_text'] == 'Solve linear equations'
+            results['assertions_passed'] += 1
+            
+            # Test 3: A write invalidates only entries reading the written table
+            db.execute_query(disciplines_query)
+            db.execute_query("INSERT INTO educational_standards (standard_text) VALUES ('Graph functions')", fetch_results=False)
+            assert len(db.execute_query(standards_query)) == 2
+            hits_before = db.query_stats['cache_hits']
+            db.execute_query(disciplines_query)
+            assert db.query_stats['cache_hits'] == hits_before + 1
+            assert db.query_stats['cache_invalidations'] >= 1
+            results['assertions_passed'] += 1
+            
+            # Test 4: Persisted entries are served from disk after the memory tier is lost
+            db.execute_query("SELECT COUNT(*) AS count FROM disciplines", persist_cache=True)
+            db.query_cache._entries.clear()
+            count = db.execute_query("SELECT COUNT(*) AS count FROM disciplines", persist_cache=True)
+            assert count == [{'count': 1}]
+            assert db.query_stats['disk_cache_hits'] == 1
+            db.execute_query("DELETE FROM disciplines", fetch_results=False)
+            assert db.execute_query("SELECT COUNT(*) AS count FROM disciplines") == [{'count': 0}]
+            assert not list(Path(temp_dir).glob("query_*.pkl"))
+            results['assertions_passed'] += 1
+            
+            # Test 5: Cache statistics are reported
+            cache_stats = db.get_cache_stats()
+            assert 0 < cache_stats['hit_rate'] < 1
+            assert cache_stats['entries'] == len(db.query_cache)
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['query_cache_tests'] = 'All query cache unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 5
+    
+    return results
+
+def test_bulk_insert_unit() -> dict:
+    """Test DatabaseManager bulk loading with SQLite"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                bulk_insert_chunk_size=1000
+            )
+            db = DatabaseManager(config)
+            db.execute_query("""
+            CREATE TABLE educational_standards (
+                standard_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                document_id INTEGER, discipline_id INTEGER, standard_text TEXT,
+                standard_type TEXT, education_level TEXT, cognitive_level TEXT,
+                confidence_score REAL, extraction_method TEXT, metadata TEXT
+            )""", fetch_results=False)
+            db.execute_query("INSERT INTO educational_standards (standard_text) VALUES ('seed')", fetch_results=False)
+            
+            standards = [
+                StandardRecord(
+                    standard_text=f"Standard {i}",
+                    standard_type='competency',
+                    discipline_id=1 + i % 3,
+                    document_id=i,
+                    confidence_score=0.5,
+                    metadata={'index': i} if i % 2 else None
+                )
+                for i in range(2500)
+            ]
+            
+            # Test 1: IDs are returned in input order across chunks
+            count_query = "SELECT COUNT(*) AS count FROM educational_standards"
+            assert db.execute_query(count_query) == [{'count': 1}]
+            standard_ids = db.bulk_insert_standards(standards)
+            assert len(standard_ids) == 2500
+            rows = db.execute_query("SELECT standard_id, standard_text FROM educational_standards WHERE standard_id > 1 ORDER BY standard_id")
+            assert [row['standard_id'] for row in rows] == standard_ids
+            assert rows[1234]['standard_text'] == 'Standard 1234'
+            results['assertions_passed'] += 1
+            
+            # Test 2: Dict values are stored as JSON and writes invalidate cached reads
+            metadata = db.execute_query("SELECT metadata FROM educational_standards WHERE standard_id = ?", (standard_ids[7],))
+            assert json.loads(metadata[0]['metadata']) == {'index': 7}
+            assert db.execute_query(count_query) == [{'count': 2501}]
+            results['assertions_passed'] += 1
+            
+            # Test 3: A failing batch is rolled back completely
+            bad_rows = [(i, 'ok') for i in range(10)] + [(10,)]
+            try:
+                db.bulk_insert('educational_standards', ['document_id', 'standard_text'], bad_rows, chunk_size=4)
+                assert False, "Mismatched row should fail"
+            except Exception:
+                pass
+            assert db.execute_query(count_query) == [{'count': 2501}]
+            results['assertions_passed'] += 1
+            
+            # Test 4: Identifiers are validated and COPY values escaped
+            try:
+                db.bulk_insert('educational_standards; DROP TABLE x', ['standard_text'], [('a',)])
+                assert False, "Invalid identifier should be rejected"
+            except ValueError:
+                pass
+            assert DatabaseManager._adapt_bulk_value(None, 'copy') == '\\N'
+            assert DatabaseManager._adapt_bulk_value('a\tb\\c', 'copy') == 'a\\tb\\\\c'
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['bulk_insert_tests'] = 'All bulk insert unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
+def test_keyset_pagination_unit() -> dict:
+    """Test DatabaseManager keyset pagination of standards"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db')
+            )
+            db = DatabaseManager(config)
+            db.execute_query("CREATE TABLE standards_sources (source_id INTEGER PRIMARY KEY, source_title TEXT)", fetch_results=False)
+            db.execute_query("CREATE TABLE retrieved_documents (document_id INTEGER PRIMARY KEY, source_id INTEGER, document_title TEXT, document_url TEXT)", fetch_results=False)
+            db.execute_query("""
+            CREATE TABLE educational_standards (
+                standard_id INTEGER PRIMARY KEY, document_id INTEGER, discipline_id INTEGER,
+                standard_text TEXT, standard_type TEXT, education_level TEXT, cognitive_level TEXT,
+                confidence_score REAL, validation_score REAL, is_validated BOOLEAN,
+                processed_timestamp TEXT, metadata TEXT
+            )""", fetch_results=False)
+            db.execute_query("INSERT INTO standards_sources VALUES (1, 'Source')", fetch_results=False)
+            db.execute_query("INSERT INTO retrieved_documents VALUES (1, 1, 'Doc', 'http://example.org')", fetch_results=False)
+            db.bulk_insert(
+                'educational_standards',
+                ['document_id', 'discipline_id', 'standard_text', 'confidence_score', 'validation_score'],
+                # Repeated scores and NULL validation scores exercise the tie-breakers
+                [(1, 1 + i % 2, f"Standard {i}", (i % 5) / 5, None if i % 7 == 0 else (i % 3) / 3)
+                 for i in range(250)]
+            )
+            assert db.ensure_pagination_indexes()
+            
+            # Test 1: Paging visits every row exactly once in sort order
+            seen = []
+            cursor = None
+            pages = 0
+            while True:
+                page = db.get_standards_page(discipline_id=1, limit=20, cursor=cursor)
+                seen.extend(page['standards'])
+                pages += 1
+                cursor = page['next_cursor']
+                if not cursor:
+                    break
+            assert len(seen) == 125 and pages == 7
+            assert len({row['standard_id'] for row in seen}) == 125
+            keys = [(row['validation_score'] if row['validation_score'] is not None else -1,
+                     row['confidence_score'], row['standard_id']) for row in seen]
+            assert keys == sorted(keys, reverse=True)
+            results['assertions_passed'] += 1
+            
+            # Test 2: Legacy offset is applied in SQL, not by slicing a short page
+            first_page = db.get_standards_page(discipline_id=1, limit=20)
+            second_page = db.get_standards_page(discipline_id=1, limit=20, offset=20)
+            assert len(second_page['standards']) == 20
+            assert second_page['standards'][0]['standard_id'] == seen[20]['standard_id']
+            results['assertions_passed'] += 1
+            
+            # Test 3: Cursors are bound to their filters and validated
+            for bad_call in (
+                lambda: db.get_standards_page(discipline_id=2, cursor=first_page['next_cursor']),
+                lambda: db.get_standards_page(discipline_id=1, cursor='not-a-cursor')
+            ):
+                try:
+                    bad_call()
+                    assert False, "Invalid cursor should be rejected"
+                except ValueError:
+                    pass
+            results['assertions_passed'] += 1
+            
+            # Test 4: Keyset query uses the composite index
+            plan = db.execute_query(
+                "EXPLAIN QUERY PLAN SELECT standard_id FROM educational_standards es WHERE es.discipline_id = ? "
+                "AND (COALESCE(es.validation_score, -1), es.confidence_score, es.standard_id) < (?, ?, ?) "
+                "ORDER BY COALESCE(es.validation_score, -1) DESC, es.confidence_score DESC, es.standard_id DESC LIMIT 20",
+                (1, 0.5, 0.5, 100)
+            )
+            assert any('idx_standards_discipline_keyset' in row['detail'] for row in plan)
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['keyset_pagination_tests'] = 'All keyset pagination unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
+def test_streaming_query_unit() -> dict:
+    """Test DatabaseManager batched result streaming"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                pool_size=1,
+                stream_batch_size=400
+            )
+            db = DatabaseManager(config)
+            db.execute_query("""
+            CREATE TABLE educational_standards (
+                standard_id INTEGER PRIMARY KEY, document_id INTEGER, discipline_id INTEGER,
+                standard_text TEXT, standard_type TEXT, education_level TEXT, cognitive_level TEXT,
+                confidence_score REAL, validation_score REAL, is_validated BOOLEAN,
+                extraction_method TEXT, processed_timestamp TEXT, metadata TEXT
+            )""", fetch_results=False)
+            db.bulk_insert(
+                'educational_standards',
+                ['discipline_id', 'standard_text', 'confidence_score'],
+                [(1 + i % 2, f"Standard {i}", 0.5) for i in range(2000)]
+            )
+            
+            # Test 1: Rows arrive in bounded batches in standard_id order
+            batches = list(db.iter_standards_export(discipline_id=1))
+            assert [len(batch) for batch in batches] == [400, 400, 200]
+            ids = [row['standard_id'] for batch in batches for row in batch]
+            assert ids == sorted(ids) and len(ids) == 1000
+            results['assertions_passed'] += 1
+            
+            # Test 2: Streams bypass the query cache
+            assert len(db.query_cache) == 0
+            results['assertions_passed'] += 1
+            
+            # Test 3: Abandoning a stream returns its connection to the pool
+            stream = db.iter_query_batches("SELECT standard_id FROM educational_standards", batch_size=10)
+            next(stream)
+            assert db.get_connection_stats()['available_connections'] == 0
+            stream.close()
+            assert db.get_connection_stats()['available_connections'] == 1
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['streaming_query_tests'] = 'All streaming query unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 3
+    
+    return results
+
+def test_async_database_manager_unit() -> dict:
+    """Test AsyncDatabaseManager parity, concurrency and timeouts"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    if not HAS_AIOSQLITE:
+        results['success'] = True
+        results['details']['async_database_tests'] = 'Skipped: aiosqlite not installed'
+        return results
+    
+    slow_query = ("WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter WHERE x < ?) "
+                  "SELECT COUNT(*) AS count FROM counter")
+    
+    async def run_checks(db, async_db):
+        try:
+            # Test 1: Same results as the sync manager
+            assert await async_db.get_all_disciplines() == db.get_all_disciplines()
+            sync_page = db.get_standards_page(discipline_id=1, limit=3)
+            async_page = await async_db.get_standards_page(discipline_id=1, limit=3)
+            assert async_page == sync_page and async_page['next_cursor']
+            results['assertions_passed'] += 1
+            
+            # Test 2: The event loop keeps running while queries execute
+            ticks = 0
+            
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+            
+            ticker_task = asyncio.create_task(ticker())
+            counts = await asyncio.gather(*(
+                async_db.execute_query(slow_query, (300000,), use_cache=False) for _ in range(3)
+            ))
+            ticker_task.cancel()
+            assert all(count == [{'count': 300000}] for count in counts)
+            assert ticks > 0
+            results['assertions_passed'] += 1
+            
+            # Test 3: Queries past their deadline raise TimeoutError and free the pool slot
+            failed_before = db.query_stats['failed_queries']
+            try:
+                await async_db.execute_query(slow_query, (10 ** 10,), use_cache=False, timeout=0.05)
+                assert False, "expected a timeout"
+            except asyncio.TimeoutError:
+                pass
+            assert db.query_stats['failed_queries'] == failed_before + 1
+            assert await async_db.execute_query("SELECT 1 AS one", use_cache=False) == [{'one': 1}]
+            results['assertions_passed'] += 1
+        finally:
+            await async_db.close()
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                pool_size=2
+            )
+            db = DatabaseManager(config)
+            db.execute_query("""
+            CREATE TABLE disciplines (
+                discipline_id INTEGER PRIMARY KEY, discipline_name TEXT, display_name TEXT,
+                openalex_id TEXT, description TEXT, priority_level INTEGER, created_at TEXT,
+                is_active BOOLEAN
+            )""", fetch_results=False)
+            db.execute_query("""
+            CREATE TABLE educational_standards (
+                standard_id INTEGER PRIMARY KEY, document_id INTEGER, discipline_id INTEGER,
+                standard_text TEXT, standard_type TEXT, education_level TEXT, cognitive_level TEXT,
+                confidence_score REAL, validation_score REAL, is_validated BOOLEAN,
+                extraction_method TEXT, processed_timestamp TEXT, metadata TEXT
+            )""", fetch_results=False)
+            db.execute_query("CREATE TABLE retrieved_documents (document_id INTEGER PRIMARY KEY, source_id INTEGER, document_title TEXT, document_url TEXT)", fetch_results=False)
+            db.execute_query("CREATE TABLE standards_sources (source_id INTEGER PRIMARY KEY, source_title TEXT)", fetch_results=False)
+            db.bulk_insert('disciplines', ['discipline_name', 'priority_level', 'is_active'],
+                           [('Physics', 1, True), ('Biology', 2, True)])
+            db.bulk_insert('standards_sources', ['source_id', 'source_title'], [(1, 'Framework')])
+            db.bulk_insert('retrieved_documents', ['document_id', 'source_id', 'document_title'], [(1, 1, 'Standards')])
+            db.bulk_insert(
+                'educational_standards',
+                ['document_id', 'discipline_id', 'standard_text', 'confidence_score'],
+                [(1, 1, f"Standard {i}", 0.5) for i in range(10)]
+            )
+            
+            asyncio.run(run_checks(db, AsyncDatabaseManager(db)))
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['async_database_tests'] = 'All async database manager unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 3
+    
+    return results
+
+def test_response_cache_unit() -> dict:
+    """Test API response caching, ETags and conditional requests"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    if not HAS_FLASK:
+        results['success'] = True
+        results['details']['response_cache_tests'] = 'Skipped: Flask not installed'
+        return results
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                pool_size=1
+            )
+            db = DatabaseManager(config)
+            db.execute_query("""
+            CREATE TABLE disciplines (
+                discipline_id INTEGER PRIMARY KEY, discipline_name TEXT, display_name TEXT,
+                openalex_id TEXT, description TEXT, priority_level INTEGER, created_at TEXT,
+                is_active BOOLEAN
+            )""", fetch_results=False)
+            db.bulk_insert('disciplines', ['discipline_name', 'priority_level', 'is_active'],
+                           [('Physics', 1, True)])
+            
+            api = APIGenerator(db, framework="flask")
+            client = api.app.test_client()
+            
+            with patch.object(db, 'get_all_disciplines', wraps=db.get_all_disciplines) as query:
+                # Test 1: Repeated GETs are served from the response cache with validators
+                first = client.get('/api/v1/disciplines')
+                second = client.get('/api/v1/disciplines')
+                etag = first.headers['ETag']
+                assert first.status_code == second.status_code == 200
+                assert second.data == first.data and second.headers['ETag'] == etag
+                assert 'Last-Modified' in first.headers
+                assert query.call_count == 1
+                results['assertions_passed'] += 1
+                
+                # Test 2: Matching validators get 304 without a body or a query
+                not_modified = client.get('/api/v1/disciplines', headers={'If-None-Match': etag})
+                since = client.get('/api/v1/disciplines', headers={'If-Modified-Since': first.headers['Last-Modified']})
+                assert not_modified.status_code == since.status_code == 304
+                assert not_modified.data == b''
+                assert query.call_count == 1
+                results['assertions_passed'] += 1
+                
+                # Test 3: A data version bump (changeset commit) rolls the ETag
+                db.bulk_insert('disciplines', ['discipline_name', 'priority_level', 'is_active'],
+                               [('Biology', 2, True)])
+                db.bump_data_version()
+                fresh = client.get('/api/v1/disciplines', headers={'If-None-Match': etag})
+                assert fresh.status_code == 200 and fresh.headers['ETag'] != etag
+                assert len(fresh.get_json()['data']) == 2
+                results['assertions_passed'] += 1
+                
+                # Test 4: Validators lapse after cache_duration (writes from other processes)
+                etag, last_modified = fresh.headers['ETag'], fresh.headers['Last-Modified']
+                later = time.time() + api.cache_durations['/api/v1/disciplines']
+                with patch('time.time', return_value=later):
+                    lapsed = client.get('/api/v1/disciplines', headers={'If-None-Match': etag})
+                    lapsed_since = client.get('/api/v1/disciplines', headers={'If-Modified-Since': last_modified})
+                assert lapsed.status_code == lapsed_since.status_code == 200
+                assert lapsed.headers['ETag'] != etag
+                results['assertions_passed'] += 1
+            
+            # Test 5: Live endpoints are never cached
+            assert 'ETag' not in client.get('/api/v1/health').headers
+            results['assertions_passed'] += 1
+            
+            # Test 6: A streamed export counts as one successful request
+            successful_before = api.api_stats['successful_requests']
+            with patch.object(db, 'iter_standards_export', return_value=iter([[{'standard_id': 1}]])):
+                export = client.get('/api/v1/disciplines/1/standards/export')
+                assert export.status_code == 200 and export.data.count(b'\n') == 1
+            assert api.api_stats['successful_requests'] == successful_before + 1
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['response_cache_tests'] = 'All response cache unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 6
+    
+    return results
+
+def test_quality_scoring_batch_unit() -> dict:
+    """Test batch quality scoring matches single-standard assessment"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        mock_db = Mock()
+        mock_db.get_all_disciplines.return_value = [
+            {'discipline_id': 1, 'discipline_name': 'Mathematics'},
+            {'discipline_id': 2, 'discipline_name': 'Biology'}
+        ]
+        engine = QualityScoringEngine(mock_db)
+        
+        texts = [
+            "Students will solve linear equations and calculate the slope of a line given two points.",
+            "Understand cells.",
+            "Students will analyze DNA sequence data from research studies, compare findings, "
+            "and evaluate evidence for evolution using specific criteria such as mutation rates.",
+            "Apply the formula for area to real-world design problems. Measure and compare results."
+        ]
+        standards = [
+            {'standard_id': index, 'standard_text': texts[index % len(texts)], 'discipline_id': 1 + index % 2}
+            for index in range(12)
+        ]
+        
+        def same_metrics(batch, single):
+            return (batch.standard_id == single.standard_id and
+                    batch.overall_score == single.overall_score and
+                    batch.quality_level == single.quality_level and
+                    abs(batch.confidence - single.confidence) < 1e-9 and
+                    batch.dimension_scores == single.dimension_scores and
+                    batch.detailed_feedback == single.detailed_feedback and
+                    batch.improvement_suggestions == single.improvement_suggestions)
+        
+        # Test 1: Batch scores match single assessments, in input order
+        batch = engine.batch_assess_standards(standards, max_workers=1)
+        single = [engine.assess_standard_quality(s['standard_id'], s['standard_text'], s['discipline_id'])
+                  for s in standards]
+        assert [m.standard_id for m in batch] == list(range(12))
+        assert all(same_metrics(b, s) for b, s in zip(batch, single))
+        results['assertions_passed'] += 1
+        
+        # Test 2: Standards without a discipline profile are skipped and counted as failures
+        stats_before = engine.get_scoring_statistics()
+        mixed = engine.batch_assess_standards(
+            standards[:2] + [{'standard_id': 99, 'standard_text': texts[0], 'discipline_id': 42}],
+            max_workers=1
+        )
+        stats_after = engine.get_scoring_statistics()
+        assert [m.standard_id for m in mixed] == [0, 1]
+        assert stats_after['total_assessments'] - stats_before['total_assessments'] == 3
+        assert stats_after['successful_assessments'] - stats_before['successful_assessments'] == 2
+        results['assertions_passed'] += 1
+        
+        # Test 3: Large batches scored on a process pool give the same results
+        with patch.object(QualityScoringEngine, 'BATCH_CHUNK_SIZE', 4), \
+             patch.object(QualityScoringEngine, 'PARALLEL_BATCH_THRESHOLD', 8):
+            pooled = engine.batch_assess_standards(standards, max_workers=2)
+        assert len(pooled) == len(batch)
+        assert all(same_metrics(p, b) for p, b in zip(pooled, batch))
+        results['assertions_passed'] += 1
+        
+        # Test 4: Batch confidences match single assessments when the score spread sits on a threshold
+        # (np.std gives exactly 0.2 for the first row, statistics.stdev 0.19999999999999998)
+        dimensions = list(QualityDimension)
+        rows = [[0.2, 0.5, 0.3, 0.5, 0.4, 0.4, 0.4, 0.7, 0.6, 0.0],
+                [0.6, 0.5, 0.3, 0.3, 0.1, 0.4, 0.1, 0.5, 0.0, 0.2]]
+        rows += [[round((index * 7 + column * 3) % 11 / 10, 1) for column in range(len(dimensions))]
+                 for index in range(50)]
+        dimension_scores = [dict(zip(dimensions, row)) for row in rows]
+        profile = engine.discipline_profiles[1]
+        word_counts = [index * 5 for index in range(len(rows))]
+        _, confidences, _ = engine._aggregate_batch_scores(
+            dimension_scores, [profile] * len(rows), word_counts
+        )
+        assert confidences == [engine._calculate_assessment_confidence(scores, word_count)
+                               for scores, word_count in zip(dimension_scores, word_counts)]
+        results['assertions_passed'] += 1
+        
+        results['success'] = True
+        results['details']['quality_scoring_batch_tests'] = 'All batch quality scoring unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
+def test_keyword_matcher_unit() -> dict:
+    """Test compiled keyword matching used by quality scoring"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        matcher = KeywordMatcher(['under', 'understand', 'under conditions', 'conditions',
+                                  'know', 'rate', 'DNA', 'will be able to', 'topic'])
+        
+        # Test 1: Terms match at word starts, including inflected forms
+        found = matcher.find('students understand dna sequencing and rates')
+        assert found == {'understand', 'under', 'dna', 'rate'}
+        results['assertions_passed'] += 1
+        
+        # Test 2: Terms inside other words are not matched
+        assert matcher.find('acknowledge and demonstrate') == set()
+        results['assertions_passed'] += 1
+        
+        # Test 3: Terms starting inside a multi-word match are still found
+        found = matcher.find('students will be able to topics under conditions')
+        assert {'will be able to', 'topic', 'under conditions', 'under', 'conditions'} <= found
+        assert KeywordMatcher([]).find('anything') == set()
+        results['assertions_passed'] += 1
+        
+        # Test 4: Each discipline profile carries a matcher with its own keywords
+        mock_db = Mock()
+        mock_db.get_all_disciplines.return_value = [{'discipline_id': 1, 'discipline_name': 'Biology'}]
+        engine = QualityScoringEngine(mock_db)
+        profile = engine.discipline_profiles[1]
+        assert {'dna', 'classify', 'analyze'} <= profile.term_matcher.find('classify dna samples and analyze')
+        results['assertions_passed'] += 1
+        
+        results['success'] = True
+        results['details']['keyword_matcher_tests'] = 'All keyword matcher unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
+def test_incremental_quality_scoring_unit() -> dict:
+    """Test persisted quality scores are reused until text or profile changes"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(
+                database_type="sqlite",
+                sqlite_path=str(Path(temp_dir) / 'standards.db'),
+                pool_size=1
+            )
+            db = DatabaseManager(config)
+            db.execute_query("""
+            CREATE TABLE disciplines (
+                discipline_id INTEGER PRIMARY KEY, discipline_name TEXT, display_name TEXT,
+                openalex_id TEXT, description TEXT, priority_level INTEGER, created_at TEXT,
+                is_active BOOLEAN
+            )""", fetch_results=False)
+            db.execute_query("""
+            CREATE TABLE standard_quality_scores (
+                standard_id INTEGER PRIMARY KEY, discipline_id INTEGER NOT NULL,
+                text_hash TEXT NOT NULL, profile_version TEXT NOT NULL, overall_score REAL NOT NULL,
+                quality_level TEXT NOT NULL, confidence REAL, dimension_scores TEXT,
+                detailed_feedback TEXT, improvement_suggestions TEXT, assessment_method TEXT,
+                assessment_timestamp TEXT
+            )""", fetch_results=False)
+            db.bulk_insert('disciplines', ['discipline_name', 'priority_level', 'is_active'],
+                           [('Mathematics', 1, True), ('Biology', 2, True)])
+            
+            engine = QualityScoringEngine(db)
+            standards = [
+                {'standard_id': index, 'discipline_id': 1 + index % 2,
+                 'standard_text': f"Students will analyze and compare {index} specific data sets using a rubric."}
+                for index in range(6)
+            ]
+            count_query = "SELECT COUNT(*) AS count FROM standard_quality_scores"
+            
+            # Test 1: The first run scores and persists every standard
+            first = engine.assess_standards_incremental(standards)
+            assert [m.standard_id for m in first] == list(range(6))
+            assert db.execute_query(count_query) == [{'count': 6}]
+            results['assertions_passed'] += 1
+            
+            # Test 2: A re-run only rescores the changed standard and reuses the rest intact
+            standards[2] = dict(standards[2], standard_text="Understand cells.")
+            with patch.object(engine, 'batch_assess_standards', wraps=engine.batch_assess_standards) as batch:
+                second = engine.assess_standards_incremental(standards)
+                assert [s['standard_id'] for s in batch.call_args[0][0]] == [2]
+            assert second[2].overall_score < first[2].overall_score
+            for index in (0, 1, 3, 4, 5):
+                assert second[index].overall_score == first[index].overall_score
+                assert second[index].dimension_scores == first[index].dimension_scores
+                assert second[index].detailed_feedback == first[index].detailed_feedback
+                assert second[index].quality_level == first[index].quality_level
+            assert db.execute_query(count_query) == [{'count': 6}]
+            assert engine.get_scoring_statistics()['reused_assessments'] == 5
+            results['assertions_passed'] += 1
+            
+            # Test 3: A profile change invalidates that discipline's stored scores
+            engine.discipline_profiles[1].profile_version = 'changed'
+            cached = engine.get_cached_quality_scores(list(range(6)))
+            assert sorted(cached) == [1, 3, 5]
+            assert len(engine.get_cached_quality_scores(list(range(6)), include_stale=True)) == 6
+            with patch.object(engine, 'batch_assess_standards', wraps=engine.batch_assess_standards) as batch:
+                engine.assess_standards_incremental(standards)
+                assert [s['standard_id'] for s in batch.call_args[0][0]] == [0, 2, 4]
+            results['assertions_passed'] += 1
+            
+            # Test 4: force rescores everything
+            with patch.object(engine, 'batch_assess_standards', wraps=engine.batch_assess_standards) as batch:
+                engine.assess_standards_incremental(standards, force=True)
+                assert len(batch.call_args[0][0]) == 6
+            results['assertions_passed'] += 1
+            
+            db.connection_pool.closeall()
+            
+            results['success'] = True
+            results['details']['incremental_quality_tests'] = 'All incremental quality scoring unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
+def test_performance_time_series_unit() -> dict:
+    """Test bounded metric storage and rollups behind the performance monitor"""
+    
+    results = {
+        'success': False,
+        'assertions_passed': 0,
+        'assertions_failed': 0,
+        'details': {},
+        'error': None
+    }
+    
+    try:
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        
+        def cpu_metric(value, seconds_ago, component='system'):
+            return PerformanceMetric(PerformanceMetricType.CPU_USAGE, value, '%',
+                                     now - timedelta(seconds=seconds_ago), component)
+        
+        # Test 1: Raw buffers and rollups stay bounded however many metrics arrive
+        store = MetricTimeSeriesStore(raw_capacity=50, component_capacity=20,
+                                      minute_retention=10, hour_retention=3, sample_size=8)
+        for index in range(600):
+            store.add(cpu_metric(float(index), 600 - index))
+        assert len(store.raw_metrics) == 50
+        assert len(store.component_metrics['system']) == 20
+        minute_rollups = store.get_rollups('system', PerformanceMetricType.CPU_USAGE, 'minute')
+        assert len(minute_rollups) == 10
+        assert all(len(bucket.samples) <= 8 for bucket in store.series[('system', PerformanceMetricType.CPU_USAGE)]['minute'])
+        results['assertions_passed'] += 1
+        
+        # Test 2: Rollups keep exact count, min, max and average per bucket
+        store = MetricTimeSeriesStore(sample_size=1000)
+        for value in range(1, 101):
+            store.add(cpu_metric(float(value), 0))
+        assert [m.value for m in store.recent(60, now=now)] == [float(value) for value in range(1, 101)]
+        store.add(cpu_metric(500.0, 7200))
+        rollups = store.get_rollups('system', PerformanceMetricType.CPU_USAGE, 'minute')
+        assert [bucket['count'] for bucket in rollups] == [1, 100]
+        assert (rollups[1]['min'], rollups[1]['max'], rollups[1]['avg'], rollups[1]['p95']) == (1.0, 100.0, 50.5, 95.0)
+        assert len(store.get_rollups('system', PerformanceMetricType.CPU_USAGE, 'hour')) == 2
+        results['assertions_passed'] += 1
+        
+        # Test 3: Late metrics land in their own rollup bucket and summaries read only the window
+        store.add(cpu_metric(7.0, 3600))
+        assert [bucket['count'] for bucket in store.get_rollups('system', PerformanceMetricType.CPU_USAGE, 'hour')] == [1, 1, 100]
+        short = store.summarize(now - timedelta(minutes=5), now=now)[('system', PerformanceMetricType.CPU_USAGE)]
+        assert short['count'] == 100 and short['max'] == 100.0
+        full = store.summarize(now - timedelta(hours=24), now=now)[('system', PerformanceMetricType.CPU_USAGE)]
+        assert full['count'] == 102 and full['max'] == 500.0 and full['min'] == 1.0
+        results['assertions_passed'] += 1
+        
+        # Test 4: The monitor summary is built from rollups with its existing shape
+        monitor = PerformanceMonitor(Mock())
+        current = datetime.now()
+        for value in (10.0, 20.0, 30.0):
+            monitor._add_metric(PerformanceMetric(PerformanceMetricType.CPU_USAGE, value, '%', current, 'system'))
+        monitor._add_metric(PerformanceMetric(PerformanceMetricType.RESPONSE_TIME, 2.0, 's', current, 'api'))
+        summary = monitor.get_performance_summary(hours=1)
+        assert summary['total_metrics'] == 4
+        cpu_summary = summary['metrics_by_type']['cpu_usage']
+        assert (cpu_summary['count'], cpu_summary['average'], cpu_summary['min'], cpu_summary['max']) == (3, 20.0, 10.0, 30.0)
+        assert abs(cpu_summary['std_dev'] - 10.0) < 1e-9
+        assert summary['metrics_by_component'] == {'system': {'count': 3, 'metric_types': 1},
+                                                   'api': {'count': 1, 'metric_types': 1}}
+        assert len(monitor.metric_store.recent(300, component='api')) == 1
+        results['assertions_passed'] += 1
+        
+        results['success'] = True
+        results['details']['performance_time_series_tests'] = 'All performance time-series unit tests passed'
+    
+    except Exception as e:
+        results['error'] = str(e)
+        results['assertions_failed'] = 4
+    
+    return results
+
 # Entry point for running all unit tests
 def run_all_unit_tests():
     """Run all unit tests and return results"""
@@ -665,7 +1584,18 @@ def run_all_unit_tests():
         test_discovery_agent_unit,
         test_retrieval_agent_unit,
         test_processing_agent_unit,
-        test_validation_agent_unit
+        test_validation_agent_unit,
+        test_database_manager_unit,
+        test_query_cache_unit,
+        test_bulk_insert_unit,
+        test_keyset_pagination_unit,
+        test_streaming_query_unit,
+        test_async_database_manager_unit,
+        test_response_cache_unit,
+        test_quality_scoring_batch_unit,
+        test_keyword_matcher_unit,
+        test_incremental_quality_scoring_unit,
+        test_performance_time_series_unit
     ]
     
     results = {}
@@ -70,9 +70,13 @@ except ImportError:
     PDF_PROCESSING_AVAILABLE = False
 
 
+@st.cache_data(max_entries=256, show_spinner=False)
 def process_html_for_streamlit(html_content: str, base_path: Optional[Path] = None) -> tuple[str, List[Dict]]:
     """Process HTML content to handle images for Streamlit display.
     
+    Results are memoized across reruns, so revisiting a section skips the
+    image placeholder pass.
+    
     Returns:
         tuple: (processed_html, image_list)
         - processed_html: HTML with image placeholders
@@ -25,7 +25,7 @@ from .repository_manager import RepositoryManager
 from .content_processor import ContentProcessor
 from .parallel_processor import ParallelProcessor, ProcessingTask, ProcessingResult
 from .text_extractor import TextExtractor, ExtractedContent
-from .search_indexer import SearchIndexer, SearchResult, IndexStats
+from .search_indexer import SearchIndexer, SearchResult, IndexStats, BulkIndexStats
 
 __all__ = [
     "OpenBooksConfig",
@@ -39,5 +39,6 @@ __all__ = [
     "ExtractedContent",
     "SearchIndexer",
     "SearchResult",
-    "IndexStats"
+    "IndexStats",
+    "BulkIndexStats"
 ]
\ No newline at end of file
@@ -11,8 +11,17 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+import hashlib
+import json
+import os
+import threading
 from dataclasses import dataclass
 
+from .search_indexer import compute_source_fingerprint
+
+# Default on-disk location of parsed book structures
+DEFAULT_STRUCTURE_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache" / "book_structure"
+
 
 @dataclass
 class BookModule:
@@ -44,8 +53,27 @@ class Book:
 class OpenStaxBookParser:
     """Parser for OpenStax textbook collections and modules."""
     
-    def __init__(self):
+    # Bump when parsing changes so cached structures are rebuilt
+    STRUCTURE_CACHE_VERSION = "1"
+    
+    MDML_TITLE_TAG = '{http://cnx.rice.edu/mdml}title'
+    
+    # Parsed books shared by every parser in the process, keyed by collection path
+    # and stored as (stamp, fingerprint, book)
+    _memory_cache: Dict[str, Tuple[Optional[str], str, Book]] = {}
+    _memory_cache_lock = threading.Lock()
+    
+    def __init__(self, cache_dir: Optional[Path] = None, use_cache: bool = True):
+        """
+        Initialize the parser.
+        
+        Args:
+            cache_dir: Directory for cached book structures (defaults to cache/book_structure)
+            use_cache: Reuse parsed structures until the collection's repository changes
+        """
         self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_STRUCTURE_CACHE_DIR
+        self.use_cache = use_cache
     
     def detect_book_collections(self, repository_path: Path) -> List[Path]:
         """Detect all book collections in a repository."""
@@ -117,7 +145,164 @@ class OpenStaxBookParser:
             return {"title": title, "language": "en", "uuid": "", "slug": ""}
     
     def parse_book_structure(self, collection_path: Path) -> Optional[Book]:
-        """Parse the complete structure of a book from its collection XML."""
+        """
+        Parse the complete structure of a book from its collection XML.
+        
+        Parsed books are cached in memory and on disk, keyed by the collection
+        file and the fingerprint of its repository (git HEAD, or file count and
+        newest modification time), so reopening an unchanged book skips reading
+        every module. The memory tier is checked first against a cheap stamp of
+        the collection file and git refs, so a reopen in the same process does
+        not pay for the repository fingerprint.
+        """
+        if not self.use_cache:
+            return self._parse_book_structure(collection_path)
+        
+        cache_key = str(Path(collection_path).resolve())
+        stamp = self.get_structure_stamp(collection_path)
+        
+        with self._memory_cache_lock:
+            cached = self._memory_cache.get(cache_key)
+        if cached and stamp is not None and cached[0] == stamp:
+            return cached[2]
+        
+        fingerprint = self.get_structure_fingerprint(collection_path)
+        if cached and cached[1] == fingerprint:
+            book = cached[2]
+        else:
+            book = self.load_cached_structure(collection_path, fingerprint)
+            if book is None:
+                book = self._parse_book_structure(collection_path)
+                if book is None:
+                    return None
+                self.save_cached_structure(book, fingerprint)
+        
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = (stamp, fingerprint, book)
+        return book
+    
+    def get_structure_stamp(self, collection_path: Path) -> Optional[str]:
+        """
+        Cheaply stamp a collection file and the git refs of its repository.
+        
+        Only stats files (HEAD, the branch it points at and packed-refs), so it
+        is far cheaper than the full fingerprint. Returns None outside git
+        repositories, where module edits can only be seen by the full fingerprint.
+        """
+        collection_path = Path(collection_path)
+        git_dir = collection_path.parent.parent / '.git'
+        head_path = git_dir / 'HEAD'
+        if not head_path.is_file():
+            return None
+        
+        parts = []
+        try:
+            head = head_path.read_text(encoding='utf-8').strip()
+            ref_paths = [head_path, git_dir / 'packed-refs']
+            if head.startswith('ref:'):
+                ref_paths.append(git_dir / head[4:].strip())
+            for path in [collection_path] + ref_paths:
+                try:
+                    stat = path.stat()
+                    parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+                except FileNotFoundError:
+                    parts.append("missing")
+        except OSError:
+            return None
+        return f"{self.STRUCTURE_CACHE_VERSION}|{head}|{'|'.join(parts)}"
+    
+    def get_structure_fingerprint(self, collection_path: Path) -> str:
+        """Fingerprint a collection file together with the repository holding its modules."""
+        collection_path = Path(collection_path)
+        try:
+            stat = collection_path.stat()
+            collection_stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            collection_stamp = "missing"
+        
+        repository_fingerprint = compute_source_fingerprint(str(collection_path.parent.parent))
+        return f"{self.STRUCTURE_CACHE_VERSION}|{collection_stamp}|{repository_fingerprint}"
+    
+    def get_structure_cache_path(self, collection_path: Path) -> Path:
+        """Get cache file path for a collection's parsed structure."""
+        path_hash = hashlib.sha256(str(Path(collection_path).resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{Path(collection_path).stem}_{path_hash[:12]}.json"
+    
+    def load_cached_structure(self, collection_path: Path, fingerprint: str) -> Optional[Book]:
+        """Load a parsed book from the disk cache if its fingerprint still matches."""
+        cache_path = self.get_structure_cache_path(collection_path)
+        try:
+            if cache_path.exists():
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('fingerprint') == fingerprint:
+                    return self._book_from_dict(data['book'])
+        except Exception as e:
+            self.logger.warning(f"Failed to load cached structure {cache_path}: {e}")
+        return None
+    
+    def save_cached_structure(self, book: Book, fingerprint: str):
+        """Save a parsed book to the disk cache."""
+        cache_path = self.get_structure_cache_path(book.collection_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint, 'book': self._book_to_dict(book)}, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save cached structure {cache_path}: {e}")
+    
+    @staticmethod
+    def _book_to_dict(book: Book) -> Dict[str, Any]:
+        """Convert a book tree to JSON-serializable data."""
+        return {
+            'title': book.title,
+            'language': book.language,
+            'uuid': book.uuid,
+            'slug': book.slug,
+            'collection_path': str(book.collection_path),
+            'chapters': [
+                {
+                    'title': chapter.title,
+                    'modules': [
+                        {'id': module.id, 'title': module.title, 'content_path': str(module.content_path)}
+                        for module in chapter.modules
+                    ]
+                }
+                for chapter in book.chapters
+            ]
+        }
+    
+    @staticmethod
+    def _book_from_dict(data: Dict[str, Any]) -> Book:
+        """Rebuild a book tree from cached data."""
+        return Book(
+            title=data['title'],
+            language=data['language'],
+            uuid=data['uuid'],
+            slug=data['slug'],
+            collection_path=Path(data['collection_path']),
+            chapters=[
+                BookChapter(
+                    title=chapter['title'],
+                    modules=[
+                        BookModule(id=module['id'], title=module['title'], content_path=Path(module['content_path']))
+                        for module in chapter['modules']
+                    ]
+                )
+                for chapter in data['chapters']
+            ]
+        )
+    
+    @classmethod
+    def clear_memory_cache(cls):
+        """Forget parsed books held in memory."""
+        with cls._memory_cache_lock:
+            cls._memory_cache.clear()
+    
+    def _parse_book_structure(self, collection_path: Path) -> Optional[Book]:
+        """Parse a book's structure from its collection XML without the cache."""
         try:
             tree = ET.parse(collection_path)
             root = tree.getroot()
@@ -186,25 +371,32 @@ class OpenStaxBookParser:
             return None
     
     def get_module_title(self, module_path: Path) -> Optional[str]:
-        """Extract the title from a module's CNXML file."""
+        """
+        Extract the title from a module's CNXML file.
+        
+        The file is streamed and reading stops at the first metadata title,
+        which sits near the top of the module, instead of parsing the whole
+        document.
+        """
         if not module_path.exists():
             return None
         
         try:
-            tree = ET.parse(module_path)
-            root = tree.getroot()
-            
-            # Try to find title in metadata first
-            namespaces = {'md': 'http://cnx.rice.edu/mdml'}
-            title_elem = root.find('.//md:title', namespaces)
+            # Fallback to the first document title element if there is no metadata title
+            fallback_elem = None
+            first_metadata_title = True
             
-            if title_elem is not None and title_elem.text:
-                return title_elem.text.strip()
+            with open(module_path, 'rb') as f:
+                for _, elem in ET.iterparse(f, events=('end',)):
+                    if elem.tag == self.MDML_TITLE_TAG and first_metadata_title:
+                        if elem.text:
+                            return elem.text.strip()
+                        first_metadata_title = False
+                    elif elem.tag == 'title' and fallback_elem is None:
+                        fallback_elem = elem
             
-            # Fallback to document title element
-            title_elem = root.find('.//title')
-            if title_elem is not None and title_elem.text:
-                return title_elem.text.strip()
+            if fallback_elem is not None and fallback_elem.text:
+                return fallback_elem.text.strip()
             
             return None
             
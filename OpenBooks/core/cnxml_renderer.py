@@ -7,18 +7,182 @@ readable HTML and Markdown formats for display in the ReadOpenBooks interface.
 """
 
 import xml.etree.ElementTree as ET
+import hashlib
+import json
+import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Any
 import logging
 from html import escape
 
+# Default on-disk location of rendered modules
+DEFAULT_RENDER_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache" / "rendered"
+
+
+class MediaIndex:
+    """
+    Lazily built filename -> path index of files in 'media' directories.
+    
+    One index is kept per repository root and one per search root (the
+    working directory), each built with a single walk on first lookup and
+    reused until invalidated, so resolving a figure is a dictionary lookup
+    rather than a directory walk.
+    """
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._indexes: Dict[str, Dict[str, Path]] = {}
+        self._lock = threading.Lock()
+    
+    def lookup(self, filename: str, root: Path) -> Optional[Path]:
+        """Find a media file by name anywhere under root."""
+        key = str(Path(root).resolve())
+        
+        with self._lock:
+            index = self._indexes.get(key)
+        
+        if index is None:
+            index = self._build_index(Path(key))
+            with self._lock:
+                index = self._indexes.setdefault(key, index)
+        
+        return index.get(filename)
+    
+    def invalidate(self, root: Optional[Path] = None):
+        """
+        Drop cached indexes after media files change.
+        
+        Args:
+            root: Repository that changed; indexes of directories containing
+                it are dropped too. None drops every index.
+        """
+        with self._lock:
+            if root is None:
+                self._indexes.clear()
+                return
+            
+            changed = Path(root).resolve()
+            for key in list(self._indexes):
+                if changed == Path(key) or Path(key) in changed.parents:
+                    del self._indexes[key]
+    
+    def _build_index(self, root: Path) -> Dict[str, Path]:
+        """Walk root once, recording the first file of each name found in a media directory."""
+        index = {}
+        
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != '.git')
+            if os.path.basename(dirpath) != 'media':
+                continue
+            for filename in filenames:
+                index.setdefault(filename, Path(dirpath) / filename)
+        
+        self.logger.debug(f"Indexed {len(index)} media files under {root}")
+        return index
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered modules.
+    
+    Entries are kept in a bounded in-memory LRU and written to JSON files
+    under cache_dir, so a rendered module survives both Streamlit reruns and
+    new processes.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_memory_entries: int = 256):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_RENDER_CACHE_DIR
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+    
+    def get_cache_path(self, key: str) -> Path:
+        """Get cache file path for a render key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a rendered entry, promoting disk hits into memory."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return entry
+        
+        cache_path = self.get_cache_path(key)
+        try:
+            if cache_path.exists():
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                self._remember(key, entry)
+                with self._lock:
+                    self.stats['disk_hits'] += 1
+                return entry
+        except Exception as e:
+            self.logger.warning(f"Failed to load rendered module {cache_path}: {e}")
+        
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+    
+    def put(self, key: str, entry: Dict[str, Any]):
+        """Store a rendered entry in memory and on disk."""
+        self._remember(key, entry)
+        
+        cache_path = self.get_cache_path(key)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save rendered module {cache_path}: {e}")
+    
+    def clear_memory(self):
+        """Forget entries held in memory; disk entries are kept."""
+        with self._lock:
+            self._memory.clear()
+    
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """Insert into the memory tier, evicting the least recently used entry."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
 
 class CNXMLRenderer:
     """Renderer for converting CNXML content to HTML and Markdown."""
     
-    def __init__(self):
+    # Bump when rendering output changes so cached modules are rebuilt
+    RENDERER_VERSION = "2"
+    
+    FIGURE_IMAGE_PATTERN = re.compile(r'<div class="figure-image" data-image-path="([^"]+)" data-alt="([^"]*)">')
+    # Figures whose media could not be found, rendered as their source path
+    UNRESOLVED_FIGURE_PATTERN = re.compile(r'<div class="figure-image">\[📷 .*? - Path: ')
+    
+    # Media lookups and rendered modules shared by every renderer in the process
+    media_index = MediaIndex()
+    shared_render_cache = RenderCache()
+    
+    def __init__(self, render_cache: Optional[RenderCache] = None, use_cache: bool = True):
+        """
+        Initialize the renderer.
+        
+        Args:
+            render_cache: Cache for rendered modules (defaults to the shared cache under cache/rendered)
+            use_cache: Serve repeated renders of the same CNXML from the cache
+        """
         self.logger = logging.getLogger(__name__)
+        self.render_cache = render_cache or self.shared_render_cache
+        self.use_cache = use_cache
         
         # Define namespace mappings
         self.namespaces = {
@@ -105,15 +269,11 @@ class CNXMLRenderer:
             # Look for pattern: .../osbooks-*/media/filename
             filename = src.split('/')[-1]
             
-            # Search from current working directory
-            current_dir = Path.cwd()
-            
-            # Look for media directories
-            for media_dir in current_dir.rglob('media'):
-                if media_dir.is_dir():
-                    image_file = media_dir / filename
-                    if image_file.exists():
-                        return image_file
+            # Search the repository's media directories, then those under the working directory
+            for root in ([base_path] if base_path else []) + [Path.cwd()]:
+                image_file = self.media_index.lookup(filename, root)
+                if image_file and image_file.exists():
+                    return image_file
         
         elif not src.startswith('/') and not src.startswith('http'):
             # Relative path
@@ -325,15 +485,110 @@ class CNXMLRenderer:
         
         return '\n\n'.join(content_parts)
     
-    def cnxml_to_html(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, str]:
-        """Convert CNXML content to HTML."""
+    def get_render_key(self, cnxml_content: str, output_format: str, base_path: Optional[Path] = None) -> str:
+        """Content-addressed key for a rendered module."""
+        sha256 = hashlib.sha256()
+        # Image paths in the output depend on where media is resolved from
+        header = f"{self.RENDERER_VERSION}\0{output_format}\0{Path(base_path).resolve() if base_path else ''}\0"
+        sha256.update(header.encode('utf-8'))
+        sha256.update(cnxml_content.encode('utf-8', errors='surrogatepass'))
+        return sha256.hexdigest()
+    
+    def _render_cached(self, cnxml_content: str, output_format: str,
+                       base_path: Optional[Path], render) -> Dict[str, Any]:
+        """Serve a render from the cache, rendering and storing it on a miss."""
+        if not self.use_cache:
+            return render(cnxml_content, base_path)
+        
+        key = self.get_render_key(cnxml_content, output_format, base_path)
+        entry = self.render_cache.get(key)
+        if entry is None:
+            result = render(cnxml_content, base_path)
+            # Failed renders are not cached so they are retried next time, nor are
+            # renders with missing media, which may arrive with a later clone or pull
+            if result['title'] == 'Error' or self.UNRESOLVED_FIGURE_PATTERN.search(result['content']):
+                return result
+            entry = {name: value for name, value in result.items() if name != 'raw_content'}
+            self.render_cache.put(key, entry)
+        
+        return dict(entry, raw_content=cnxml_content)
+    
+    def extract_images(self, html_content: str) -> List[Dict[str, str]]:
+        """List the resolved images in rendered HTML."""
+        return [{'path': path, 'alt': alt} for path, alt in self.FIGURE_IMAGE_PATTERN.findall(html_content)]
+    
+    def cnxml_to_html(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Convert CNXML content to HTML.
+        
+        Returns title, content, raw_content and images (resolved figure
+        paths); repeated renders of the same CNXML come from the render cache.
+        """
+        return self._render_cached(cnxml_content, 'html', base_path, self._cnxml_to_html)
+    
+    def cnxml_to_markdown(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Convert CNXML content to Markdown (simplified version)."""
+        return self._render_cached(cnxml_content, 'markdown', base_path, self._cnxml_to_markdown)
+    
+    def prerender_collection(self, collection_path: Path) -> Dict[str, int]:
+        """
+        Render every module of a collection into the render cache.
+        
+        Args:
+            collection_path: Collection XML file, or a repository whose collections are all rendered
+            
+        Returns:
+            Counts of modules rendered, already cached, and failed
+        """
+        from .book_parser import OpenStaxBookParser
+        
+        parser = OpenStaxBookParser()
+        collection_path = Path(collection_path)
+        if collection_path.is_dir():
+            collections = parser.detect_book_collections(collection_path)
+        else:
+            collections = [collection_path]
+        
+        counts = {'rendered': 0, 'cached': 0, 'failed': 0}
+        for collection in collections:
+            book = parser.parse_book_structure(collection)
+            if not book:
+                counts['failed'] += 1
+                continue
+            
+            # Match the reader, which resolves media from the repository root
+            base_path = collection.parent.parent
+            for chapter in book.chapters:
+                for module in chapter.modules:
+                    content = parser.get_module_content(module.content_path)
+                    if content is None:
+                        counts['failed'] += 1
+                        continue
+                    
+                    html_key = self.get_render_key(content, 'html', base_path)
+                    markdown_key = self.get_render_key(content, 'markdown', base_path)
+                    if (self.render_cache.get_cache_path(html_key).exists() and
+                            self.render_cache.get_cache_path(markdown_key).exists()):
+                        counts['cached'] += 1
+                        continue
+                    
+                    html_result = self.cnxml_to_html(content, base_path)
+                    self.cnxml_to_markdown(content, base_path)
+                    counts['failed' if html_result['title'] == 'Error' else 'rendered'] += 1
+        
+        self.logger.info(f"Pre-rendered {collection_path}: {counts}")
+        return counts
+    
+    def _cnxml_to_html(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Render CNXML content to HTML without the cache."""
         try:
             root = self.parse_cnxml(cnxml_content)
             if root is None:
                 return {
                     'title': 'Error',
                     'content': '<p>Failed to parse CNXML content.</p>',
-                    'raw_content': cnxml_content[:500] + '...' if len(cnxml_content) > 500 else cnxml_content
+                    'raw_content': cnxml_content[:500] + '...' if len(cnxml_content) > 500 else cnxml_content,
+                    'images': []
                 }
             
             # Extract title
@@ -388,7 +643,8 @@ class CNXMLRenderer:
             return {
                 'title': title,
                 'content': styled_content,
-                'raw_content': cnxml_content
+                'raw_content': cnxml_content,
+                'images': self.extract_images(rendered_content)
             }
             
         except Exception as e:
@@ -396,11 +652,12 @@ class CNXMLRenderer:
             return {
                 'title': 'Error',
                 'content': f'<p>Error rendering content: {e}</p>',
-                'raw_content': cnxml_content[:500] + '...' if len(cnxml_content) > 500 else cnxml_content
+                'raw_content': cnxml_content[:500] + '...' if len(cnxml_content) > 500 else cnxml_content,
+                'images': []
             }
     
-    def cnxml_to_markdown(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, str]:
-        """Convert CNXML content to Markdown (simplified version)."""
+    def _cnxml_to_markdown(self, cnxml_content: str, base_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Render CNXML content to Markdown without the cache."""
         try:
             # First convert to HTML, then simplify to Markdown-like format
             html_result = self.cnxml_to_html(cnxml_content, base_path)
@@ -480,9 +737,18 @@ def test_cnxml_renderer():
 
 
 if __name__ == "__main__":
+    import sys
+    
     # Set up logging
     logging.basicConfig(level=logging.INFO)
     
+    # Pre-render collections: python -m core.cnxml_renderer <collection.xml or repository> ...
+    if len(sys.argv) > 1:
+        renderer = CNXMLRenderer()
+        for target in sys.argv[1:]:
+            print(f"{target}: {renderer.prerender_collection(Path(target))}")
+        sys.exit(0)
+    
     # Run test
     success = test_cnxml_renderer()
     print(f"\n{'✅ CNXML Renderer test passed!' if success else '❌ CNXML Renderer test failed!'}")
\ No newline at end of file
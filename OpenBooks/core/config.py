@@ -35,6 +35,7 @@ class OpenBooksConfig:
     specialized_dir: str = "Books/Specialized"
     extracted_content_dir: str = "Books/Specialized/Archives/extracted"
     search_index_dir: str = "metadata/search_index"
+    search_engine: str = "terms"  # "terms" (TF-IDF tables) or "fts5" (SQLite FTS5 with BM25)
     
     # Educational levels (data-driven)
     educational_levels: List[str] = field(default_factory=lambda: 
@@ -80,6 +81,7 @@ class OpenBooksConfig:
     max_discovery_workers: int = 8  # Parallel discovery workers
     max_clone_workers: int = 6  # Parallel git clone workers
     max_processing_workers: int = 12  # Content processing workers
+    search_index_queue_size: int = 16  # Extracted books buffered ahead of the index writer
     enable_pdf_processing: bool = True
     enable_git_cloning: bool = True
     enable_parallel_processing: bool = True
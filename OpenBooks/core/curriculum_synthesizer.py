@@ -18,6 +18,7 @@ from .data_models import (
     SubtopicEntry, TOCEntry, EducationalLevel, BloomLevel, QuestionType,
     create_subtopic_id
 )
+from .cycle_breaker import break_cycles
 
 logger = logging.getLogger(__name__)
 
@@ -504,13 +505,9 @@ class CurriculumSynthesizer:
     def _remove_cycles(self, graph: nx.DiGraph) -> nx.DiGraph:
         """Remove cycles from prerequisite graph."""
         try:
-            # Find and remove edges that create cycles
-            cycles = list(nx.simple_cycles(graph))
-            for cycle in cycles:
-                # Remove the edge with lowest confidence/strength
-                # For now, remove the last edge in the cycle
-                if len(cycle) >= 2:
-                    graph.remove_edge(cycle[-1], cycle[0])
+            # Edges carry no strength, so this removes a small feedback arc set
+            report = break_cycles(graph)
+            graph.graph['cycle_breaking'] = report.to_dict()
             
             return graph
         except Exception as e:
@@ -0,0 +1,213 @@
+"""
+Cycle breaking for prerequisite graphs.
+
+Removes a small, low-weight set of edges (a feedback arc set) so a directed
+graph becomes acyclic, without enumerating its cycles. Each strongly connected
+component is ordered with the greedy Eades-Lin-Smyth heuristic, weighted so
+strong prerequisites tend to point forward; edges pointing backwards in that
+order are removed, then re-added strongest first wherever that does not close
+a cycle.
+
+Ordering costs O(E log V). Restoration runs one reachability search per
+backward edge, so it is O(F * E) for F backward edges; on dense components
+(1000 nodes, 50k edges) that is seconds. Each component's restoration is
+therefore capped at RESTORE_EDGE_BUDGET scanned edges, after which the
+remaining, weakest backward edges stay removed without being checked. The
+result is still acyclic, just not guaranteed minimal for those components.
+"""
+
+import heapq
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+# Edges scanned by reachability searches when restoring backward edges in one component
+RESTORE_EDGE_BUDGET = 5_000_000
+
+
+@dataclass
+class CycleBreakingReport:
+    """Edges removed to make a graph acyclic."""
+    removed_edges: List[Tuple[Hashable, Hashable, float]] = field(default_factory=list)
+    cyclic_components: int = 0
+    restored_edges: int = 0
+    unchecked_edges: int = 0
+
+    @property
+    def removed_weight(self) -> float:
+        """Total weight of the removed edges."""
+        return sum(weight for _, _, weight in self.removed_edges)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'removed_edges': [
+                {'source': source, 'target': target, 'weight': weight}
+                for source, target, weight in self.removed_edges
+            ],
+            'removed_count': len(self.removed_edges),
+            'removed_weight': self.removed_weight,
+            'cyclic_components': self.cyclic_components,
+            'restored_edges': self.restored_edges,
+            'unchecked_edges': self.unchecked_edges
+        }
+
+
+def break_cycles(graph: nx.DiGraph, weight: str = 'weight',
+                 default_weight: float = 1.0) -> CycleBreakingReport:
+    """
+    Remove low-weight edges until the graph is acyclic.
+
+    Args:
+        graph: Graph to make acyclic; modified in place
+        weight: Edge attribute holding dependency strength
+        default_weight: Strength of edges without the attribute
+
+    Returns:
+        Report of the removed edges
+    """
+    report = CycleBreakingReport()
+
+    for source, target in list(nx.selfloop_edges(graph)):
+        report.removed_edges.append((source, target, graph[source][target].get(weight, default_weight)))
+        graph.remove_edge(source, target)
+
+    for component in nx.strongly_connected_components(graph):
+        if len(component) > 1:
+            report.cyclic_components += 1
+            _break_component_cycles(graph, component, weight, default_weight, report)
+
+    if report.removed_edges:
+        logger.info(f"Removed {len(report.removed_edges)} edges (total weight {report.removed_weight:.2f}) "
+                    f"to break cycles in {report.cyclic_components} components")
+
+    return report
+
+
+def _break_component_cycles(graph: nx.DiGraph, component: Set[Hashable], weight: str,
+                            default_weight: float, report: CycleBreakingReport):
+    """Make one strongly connected component acyclic."""
+    successors = {node: {} for node in component}
+    for node in component:
+        for target, data in graph[node].items():
+            if target in component:
+                successors[node][target] = data.get(weight, default_weight)
+
+    position = {node: index for index, node in enumerate(_greedy_order(successors))}
+    backward = [
+        (source, target, edge_weight)
+        for source, targets in successors.items()
+        for target, edge_weight in targets.items()
+        if position[source] > position[target]
+    ]
+    for source, target, _ in backward:
+        del successors[source][target]
+
+    # Restore the strongest removed edges that no longer close a cycle, within the edge budget
+    backward.sort(key=lambda edge: -edge[2])
+    budget = RESTORE_EDGE_BUDGET
+    unchecked = 0
+    for source, target, edge_weight in backward:
+        if budget <= 0:
+            unchecked += 1
+            closes_cycle = True
+        else:
+            closes_cycle, scanned = _reaches(successors, target, source)
+            budget -= scanned
+        if closes_cycle:
+            report.removed_edges.append((source, target, edge_weight))
+            graph.remove_edge(source, target)
+        else:
+            successors[source][target] = edge_weight
+            report.restored_edges += 1
+
+    if unchecked:
+        report.unchecked_edges += unchecked
+        logger.info(f"Restoration budget exhausted in a {len(component)}-node component; "
+                    f"{unchecked} weakest backward edges removed without checking")
+
+
+def _greedy_order(successors: Dict[Hashable, Dict[Hashable, float]]) -> List[Hashable]:
+    """
+    Weighted Eades-Lin-Smyth vertex ordering.
+
+    Sinks are peeled to the back and sources to the front; otherwise the node
+    with the largest outgoing minus incoming weight goes to the front.
+    """
+    predecessors = {node: {} for node in successors}
+    for source, targets in successors.items():
+        for target, edge_weight in targets.items():
+            predecessors[target][source] = edge_weight
+
+    out_count = {node: len(successors[node]) for node in successors}
+    in_count = {node: len(predecessors[node]) for node in successors}
+    delta = {node: sum(successors[node].values()) - sum(predecessors[node].values()) for node in successors}
+    tiebreak = {node: index for index, node in enumerate(successors)}
+
+    sinks = deque(node for node in successors if out_count[node] == 0)
+    sources = deque(node for node in successors if in_count[node] == 0)
+    heap = [(-delta[node], tiebreak[node], node) for node in successors]
+    heapq.heapify(heap)
+
+    remaining = set(successors)
+    front, back = [], []
+
+    def remove(node):
+        remaining.discard(node)
+        for source, edge_weight in predecessors[node].items():
+            if source in remaining:
+                out_count[source] -= 1
+                delta[source] -= edge_weight
+                heapq.heappush(heap, (-delta[source], tiebreak[source], source))
+                if out_count[source] == 0:
+                    sinks.append(source)
+        for target, edge_weight in successors[node].items():
+            if target in remaining:
+                in_count[target] -= 1
+                delta[target] += edge_weight
+                heapq.heappush(heap, (-delta[target], tiebreak[target], target))
+                if in_count[target] == 0:
+                    sources.append(target)
+
+    while remaining:
+        if sinks:
+            node = sinks.popleft()
+            if node in remaining:
+                back.append(node)
+                remove(node)
+        elif sources:
+            node = sources.popleft()
+            if node in remaining:
+                front.append(node)
+                remove(node)
+        else:
+            key, _, node = heapq.heappop(heap)
+            # Skip heap entries made stale by later degree updates
+            if node in remaining and -key == delta[node]:
+                front.append(node)
+                remove(node)
+
+    back.reverse()
+    return front + back
+
+
+def _reaches(successors: Dict[Hashable, Dict[Hashable, float]], start: Hashable,
+             goal: Hashable) -> Tuple[bool, int]:
+    """Whether goal is reachable from start, and how many edges were scanned."""
+    seen = {start}
+    stack = [start]
+    scanned = 0
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return True, scanned
+        scanned += len(successors[node])
+        for target in successors[node]:
+            if target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return False, scanned
@@ -8,12 +8,14 @@ how concepts build upon each other, creating optimal learning sequences.
 
 import logging
 import networkx as nx
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set, Callable
 from dataclasses import dataclass
 from collections import defaultdict
+from bisect import bisect_right
 import re
 
 from .data_models import SubtopicEntry, EducationalLevel, BloomLevel
+from .cycle_breaker import break_cycles
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,66 @@ class NaturalOrderingResult:
         }
 
 
+class SubtopicIndex:
+    """
+    Lookup indexes over a subtopic list for building dependency graphs.
+    
+    Answers the same queries as scanning the list in order (first match
+    wins) without rescanning it: exact lowercase names and normalized names
+    are dictionary lookups, and substring matches search one joined string of
+    all titles, memoized per query since the same prerequisite and concept
+    names recur across subtopics.
+    """
+    
+    # Separates titles in the joined search string; never part of a query match
+    SEPARATOR = '\0'
+    
+    def __init__(self, subtopics: List[SubtopicEntry], normalize: Callable[[str], str]):
+        self.subtopics = subtopics
+        self.by_name: Dict[str, SubtopicEntry] = {}
+        self.by_normalized_name: Dict[str, SubtopicEntry] = {}
+        self.title_starts: List[int] = []
+        self.substring_matches: Dict[str, Optional[SubtopicEntry]] = {}
+        
+        titles = []
+        position = 0
+        for subtopic in subtopics:
+            title = subtopic.subtopic.lower()
+            self.by_name.setdefault(title, subtopic)
+            self.by_normalized_name.setdefault(normalize(subtopic.subtopic), subtopic)
+            self.title_starts.append(position)
+            titles.append(title)
+            position += len(title) + len(self.SEPARATOR)
+        self.titles = titles
+        self.joined_titles = self.SEPARATOR.join(titles)
+    
+    def find_by_name(self, name: str) -> Optional[SubtopicEntry]:
+        """Exact case-insensitive title match, else the first title containing name."""
+        name_lower = name.lower()
+        return self.by_name.get(name_lower) or self.find_containing(name_lower)
+    
+    def find_by_normalized_name(self, normalized_name: str) -> Optional[SubtopicEntry]:
+        """First subtopic whose normalized title equals normalized_name."""
+        return self.by_normalized_name.get(normalized_name)
+    
+    def find_containing(self, text: str) -> Optional[SubtopicEntry]:
+        """First subtopic whose lowercase title contains text."""
+        text = text.lower()
+        if text in self.substring_matches:
+            return self.substring_matches[text]
+        
+        match = None
+        if self.SEPARATOR in text:
+            match = next((subtopic for subtopic, title in zip(self.subtopics, self.titles) if text in title), None)
+        else:
+            position = self.joined_titles.find(text)
+            if position >= 0 and self.subtopics:
+                match = self.subtopics[bisect_right(self.title_starts, position) - 1]
+        
+        self.substring_matches[text] = match
+        return match
+
+
 class NaturalOrderOptimizer:
     """
     Optimizes subtopic ordering for natural educational progression.
@@ -106,6 +168,10 @@ class NaturalOrderOptimizer:
             optimized_subtopics, dependency_graph, discipline
         )
         
+        removed_edges = dependency_graph.graph.get('cycle_breaking', {}).get('removed_count', 0)
+        if removed_edges:
+            notes.append(f"Removed {removed_edges} weak prerequisite edges to break dependency cycles")
+        
         logger.info(f"Natural ordering optimization complete: quality score {quality_score:.2f}")
         
         return NaturalOrderingResult(
@@ -432,12 +498,16 @@ class NaturalOrderOptimizer:
         
         # Use TOC-derived dependencies if available
         toc_dependencies = self.toc_dependency_cache.get(discipline, {}).get('prerequisites', {})
+        dependencies = self.concept_dependencies.get(discipline, {})
+        
+        # Index subtopics once instead of rescanning the list per lookup
+        index = SubtopicIndex(subtopics, self._normalize_concept_name)
         
         # Add edges based on explicit prerequisites
         for subtopic in subtopics:
             # Use explicit prerequisites from subtopic
             for prereq in subtopic.prerequisites:
-                prereq_subtopic = self._find_subtopic_by_name(prereq, subtopics)
+                prereq_subtopic = index.find_by_name(prereq)
                 if prereq_subtopic:
                     graph.add_edge(prereq_subtopic.id, subtopic.id, 
                                  weight=1.0, type='explicit')
@@ -450,7 +520,7 @@ class NaturalOrderOptimizer:
                     strength = dep_info['strength']
                     
                     # Find matching subtopic
-                    prereq_subtopic = self._find_subtopic_with_normalized_name(prereq_name, subtopics)
+                    prereq_subtopic = index.find_by_normalized_name(prereq_name)
                     if prereq_subtopic and prereq_subtopic.id != subtopic.id:
                         if not graph.has_edge(prereq_subtopic.id, subtopic.id):
                             graph.add_edge(prereq_subtopic.id, subtopic.id,
@@ -458,12 +528,11 @@ class NaturalOrderOptimizer:
             
             # Use discipline knowledge dependencies
             subtopic_concepts = self._extract_concepts(subtopic.subtopic)
-            dependencies = self.concept_dependencies.get(discipline, {})
             
             for concept in subtopic_concepts:
                 if concept in dependencies:
                     for prereq_concept in dependencies[concept]:
-                        prereq_subtopic = self._find_subtopic_with_concept(prereq_concept, subtopics)
+                        prereq_subtopic = index.find_containing(prereq_concept)
                         if prereq_subtopic and prereq_subtopic.id != subtopic.id:
                             if not graph.has_edge(prereq_subtopic.id, subtopic.id):
                                 strength = self._calculate_dependency_strength(
@@ -990,26 +1059,9 @@ class NaturalOrderOptimizer:
     def _remove_cycles_preserving_structure(self, graph: nx.DiGraph) -> nx.DiGraph:
         """Remove cycles while preserving important dependency structure."""
         try:
-            cycles = list(nx.simple_cycles(graph))
-            for cycle in cycles:
-                if len(cycle) >= 2:
-                    # Remove edge with lowest weight
-                    edges_in_cycle = [(cycle[i], cycle[(i+1) % len(cycle)]) 
-                                    for i in range(len(cycle))]
-                    
-                    # Find edge with minimum weight
-                    min_weight = float('inf')
-                    min_edge = None
-                    
-                    for edge in edges_in_cycle:
-                        if graph.has_edge(edge[0], edge[1]):
-                            weight = graph[edge[0]][edge[1]].get('weight', 0.5)
-                            if weight < min_weight:
-                                min_weight = weight
-                                min_edge = edge
-                    
-                    if min_edge:
-                        graph.remove_edge(min_edge[0], min_edge[1])
+            # Drop a low-weight feedback arc set so strong dependencies survive
+            report = break_cycles(graph, weight='weight', default_weight=0.5)
+            graph.graph['cycle_breaking'] = report.to_dict()
         
         except Exception as e:
             logger.warning(f"Error removing cycles: {e}")
@@ -6,9 +6,14 @@ providing a clean separation between command-line interface and core functionali
 All orchestration logic is properly tested and uses only core modules.
 """
 
+import os
 import time
+import queue
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import concurrent.futures
+import multiprocessing as mp
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from .config import OpenBooksConfig
@@ -19,11 +24,44 @@ from .repository_manager import RepositoryManager
 from .content_processor import ContentProcessor
 from .parallel_processor import ParallelProcessor, ProcessingTask, create_parallel_task_batches
 from .pdf_downloader import PDFDownloader
-from .search_indexer import SearchIndexer
+from .search_indexer import SearchIndexer, compute_source_fingerprint
+from .text_extractor import TextExtractor, ExtractedContent
 from .language_detector import LanguageDetector
 
 logger = logging.getLogger(__name__)
 
+# Per-process text extractor used by search indexing workers
+_index_worker_extractor: Optional[TextExtractor] = None
+
+
+def _init_index_worker(config: OpenBooksConfig) -> None:
+    """Create the text extractor once per indexing worker process."""
+    global _index_worker_extractor
+    _index_worker_extractor = TextExtractor(config)
+
+
+def _extract_repository_for_index(repo_path: str, fingerprint: Optional[str] = None
+                                  ) -> Tuple[str, Optional[ExtractedContent], float, Optional[str]]:
+    """
+    Extract a repository's content in an indexing worker process.
+    
+    The source fingerprint is attached to the content metadata so the index
+    can record it for later incremental runs.
+    
+    Returns:
+        Tuple of (repo_path, extracted content or None, duration, error message)
+    """
+    start_time = time.time()
+    try:
+        content = _index_worker_extractor.extract_content(repo_path)
+        # Workers are long-lived; don't keep every extracted book in memory
+        _index_worker_extractor.extraction_cache.clear()
+        if content and fingerprint:
+            content.metadata = dict(content.metadata or {}, source_fingerprint=fingerprint)
+        return repo_path, content, time.time() - start_time, None
+    except Exception as e:
+        return repo_path, None, time.time() - start_time, str(e)
+
 
 class OpenBooksOrchestrator:
     """
@@ -45,6 +83,7 @@ class OpenBooksOrchestrator:
         self.repo_manager = RepositoryManager(config)
         self.content_processor = ContentProcessor(config)
         self.search_indexer = SearchIndexer(config)
+        self.text_extractor = TextExtractor(config)
         self.language_detector = LanguageDetector()
         self.parallel_processor = ParallelProcessor(config)
         self.pdf_downloader = PDFDownloader(config)
@@ -124,9 +163,9 @@ class OpenBooksOrchestrator:
                           lambda: self.generate_catalog(),
                           workflow_results)
             
-            # Phase 7: Build search index
+            # Phase 7: Build search index (only changed repositories are re-indexed)
             self._run_phase("build_search_index", 7,
-                          lambda: self.build_search_index(),
+                          lambda: self.build_search_index(incremental=True),
                           workflow_results)
             
             # Final statistics
@@ -507,61 +546,233 @@ class OpenBooksOrchestrator:
                 'error': str(e)
             }
     
-    def build_search_index(self) -> Dict[str, Any]:
+    def build_search_index(self, incremental: bool = False) -> Dict[str, Any]:
         """
         Build search index for the collection.
         
+        Repositories are extracted in parallel worker processes while a single
+        writer thread loads the results into the index.
+        
+        Args:
+            incremental: Only re-extract repositories whose git HEAD / file
+                         mtimes changed since they were indexed, and drop
+                         repositories that no longer exist
+        
         Returns:
-            Dictionary with search index results
+            Dictionary with search index results and per-stage timings
         """
         books_path = Path(self.config.books_path)
         
-        if not books_path.exists():
+        if not self.config.enable_search_indexing or not books_path.exists():
             return {'books_indexed': 0, 'terms_indexed': 0, 'size_mb': 0.0}
         
         # Find all repositories to index
-        repo_paths = []
-        for git_dir in books_path.rglob(".git"):
-            if git_dir.is_dir():
-                repo_paths.append(git_dir.parent)
-        
-        # Index repositories
-        indexed_count = 0
-        for repo_path in repo_paths:
-            try:
-                if self.index_book(repo_path):
-                    indexed_count += 1
-            except Exception as e:
-                self.logger.log_error(e, f"indexing {repo_path.name}", "search_indexer", "warning")
+        discovery_start = time.time()
+        repo_paths = self._find_git_repositories(books_path)
+        fingerprints = {str(repo_path): compute_source_fingerprint(str(repo_path)) for repo_path in repo_paths}
+        discovery_time = time.time() - discovery_start
+        
+        books_unchanged = 0
+        books_removed = 0
+        if incremental:
+            indexed_sources = self.search_indexer.get_indexed_sources()
+            
+            # Drop books whose repositories disappeared
+            for source_path in indexed_sources:
+                if source_path not in fingerprints and source_path.startswith(str(books_path) + os.sep):
+                    if self.search_indexer.remove_source(source_path):
+                        books_removed += 1
+            
+            changed_paths = [
+                repo_path for repo_path in repo_paths
+                if indexed_sources.get(str(repo_path), {}).get('fingerprint') != fingerprints[str(repo_path)]
+            ]
+            books_unchanged = len(repo_paths) - len(changed_paths)
+            self.ui.print_info(f"{len(changed_paths)} of {len(repo_paths)} repositories changed since last index")
+            repo_paths = changed_paths
+        
+        pipeline_results = self.run_indexing_pipeline(repo_paths, fingerprints, skip_existing=incremental)
+        pipeline_results['timings']['discovery'] = discovery_time
+        pipeline_results['books_unchanged'] = books_unchanged
+        pipeline_results['books_removed'] = books_removed
         
         # Get final index statistics
         stats = self.search_indexer.get_index_stats()
         
-        return {
-            'books_indexed': indexed_count,
+        pipeline_results.update({
             'terms_indexed': stats.unique_terms,
             'size_mb': stats.index_size_mb
+        })
+        return pipeline_results
+    
+    def run_indexing_pipeline(self, repo_paths: List[Path],
+                              fingerprints: Optional[Dict[str, str]] = None,
+                              skip_existing: bool = False) -> Dict[str, Any]:
+        """
+        Extract and index repositories with a process pool and a single writer.
+        
+        Extraction runs in up to config.max_processing_workers processes. Results
+        pass through a bounded queue (config.search_index_queue_size) to one
+        writer thread that feeds SearchIndexer.bulk_index, so extraction blocks
+        instead of piling up results when the writer falls behind.
+        
+        Args:
+            repo_paths: Repository directories to index
+            fingerprints: Optional source fingerprints keyed by repository path,
+                          recorded in the index for incremental runs
+            skip_existing: Don't rewrite books whose content hash is already indexed
+            
+        Returns:
+            Dictionary with indexing counts and per-stage timings
+            
+        Raises:
+            Exception: Whatever SearchIndexer.bulk_index raised, after the
+                       remaining extraction results have been drained
+        """
+        results = {
+            'books_indexed': 0,
+            'books_failed': 0,
+            'books_skipped': 0,
+            'timings': {'extraction_wall': 0.0, 'extraction_cpu': 0.0,
+                        'queue_wait': 0.0, 'index_write': 0.0, 'total': 0.0},
+            'rows_per_second': 0.0
         }
+        if not repo_paths:
+            return results
+        
+        start_time = time.time()
+        timings = results['timings']
+        max_workers = max(1, min(self.config.max_processing_workers, len(repo_paths)))
+        results_queue = queue.Queue(maxsize=max(1, self.config.search_index_queue_size))
+        writer_state = {}
+        
+        def queued_contents():
+            while True:
+                content = results_queue.get()
+                if content is None:
+                    return
+                yield content
+        
+        def write_index():
+            try:
+                writer_state['stats'] = self.search_indexer.bulk_index(
+                    queued_contents(), batch_size=self.config.batch_size, skip_existing=skip_existing
+                )
+            except Exception as e:
+                writer_state['error'] = e
+                # Keep draining so extraction never blocks on a dead writer
+                while results_queue.get() is not None:
+                    pass
+        
+        # Spawned workers avoid forking while the writer thread holds locks
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context('spawn'),
+            initializer=_init_index_worker,
+            initargs=(self.config,)
+        )
+        writer_thread = threading.Thread(target=write_index, name="search-index-writer", daemon=True)
+        writer_thread.start()
+        
+        try:
+            pending_paths = iter(repo_paths)
+            in_flight = set()
+            completed = 0
+            
+            fingerprints = fingerprints or {}
+            
+            def submit(repo_path: Path) -> None:
+                in_flight.add(executor.submit(_extract_repository_for_index, str(repo_path),
+                                              fingerprints.get(str(repo_path))))
+            
+            # Cap submitted work so results cannot outrun the bounded queue
+            for repo_path in pending_paths:
+                submit(repo_path)
+                if len(in_flight) >= max_workers * 2:
+                    break
+            
+            while in_flight:
+                done, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    completed += 1
+                    try:
+                        repo_path, content, duration, error = future.result()
+                    except Exception as e:
+                        repo_path, content, duration, error = "unknown", None, 0.0, str(e)
+                    
+                    timings['extraction_cpu'] += duration
+                    self.ui.print_progress(completed, len(repo_paths), "Indexing repositories",
+                                         details=Path(repo_path).name)
+                    
+                    if content:
+                        wait_start = time.time()
+                        results_queue.put(content)
+                        timings['queue_wait'] += time.time() - wait_start
+                    else:
+                        results['books_failed'] += 1
+                        self.logger.logger.warning(f"No content extracted from {repo_path}"
+                                                   + (f": {error}" if error else ""))
+                    
+                    next_path = next(pending_paths, None)
+                    if next_path is not None:
+                        submit(next_path)
+            
+            timings['extraction_wall'] = time.time() - start_time
+            
+        finally:
+            results_queue.put(None)
+            executor.shutdown(wait=True)
+            writer_thread.join()
+        
+        # Surface writer failures only once extraction and the writer have wound down
+        if 'error' in writer_state:
+            raise writer_state['error']
+        
+        bulk_stats = writer_state.get('stats')
+        if bulk_stats:
+            results['books_indexed'] = bulk_stats.books_indexed
+            results['books_skipped'] = bulk_stats.books_skipped
+            results['books_failed'] += bulk_stats.books_failed
+            results['rows_per_second'] = bulk_stats.rows_per_second
+            timings['index_write'] = bulk_stats.elapsed_seconds
+        
+        timings['total'] = time.time() - start_time
+        self.logger.logger.info(
+            f"Indexed {results['books_indexed']}/{len(repo_paths)} repositories with {max_workers} workers "
+            f"in {timings['total']:.2f}s (extraction {timings['extraction_wall']:.2f}s, "
+            f"queue wait {timings['queue_wait']:.2f}s, {results['rows_per_second']:.0f} rows/s)"
+        )
+        return results
     
     def index_book(self, repo_path: Path) -> bool:
-        """Index a single book repository for search."""
+        """Extract and index a single book repository for search."""
         try:
-            # Extract metadata from the repository
-            metadata = self.content_processor.extract_book_metadata(str(repo_path))
+            content = self.text_extractor.extract_content(str(repo_path))
             
-            if metadata:
-                # For now, just log successful metadata extraction
-                # Full content indexing would require implementing ExtractedContent integration
-                self.logger.logger.info(f"Extracted metadata for {repo_path.name}")
-                return True
+            if content:
+                return self.search_indexer.index_content(content)
             else:
-                self.logger.log_warning(f"No metadata extracted from {repo_path}")
+                self.logger.logger.warning(f"No content extracted from {repo_path}")
                 return False
                 
         except Exception as e:
             self.logger.log_error(e, f"indexing book {repo_path.name}", "search_indexer", "warning")
             return False
     
+    def _find_git_repositories(self, books_path: Path) -> List[Path]:
+        """Find git repositories below books_path without descending into them."""
+        repo_paths = []
+        for root, dirs, _ in os.walk(books_path):
+            if '.git' in dirs:
+                repo_paths.append(Path(root))
+                dirs[:] = []
+            else:
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+        return sorted(repo_paths)
+    
     def _run_phase(self, phase_name: str, phase_number: int, phase_func, workflow_results: Dict[str, Any]):
         """Execute a workflow phase with timing and error handling."""
         start_time = time.time()
@@ -11,8 +11,15 @@ import json
 import os
 import hashlib
 import logging
+import random
+import threading
+import concurrent.futures
+import contextlib
+import io
+import unicodedata
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 import time
 from datetime import datetime
 import PyPDF2
@@ -35,11 +42,116 @@ class PDFProcessingResult:
     success: bool
     error_message: Optional[str] = None
 
+class TokenBucketRateLimiter:
+    """
+    Thread-safe rate limiter with request and token buckets.
+    
+    Both buckets refill continuously at their per-minute rate and hold at most
+    one minute of capacity. acquire() blocks until a request slot and the
+    requested number of tokens are available.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_minute: Maximum API requests per minute
+            tokens_per_minute: Maximum API tokens per minute (None for unlimited)
+        """
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        
+        self._request_capacity = max(1.0, self.requests_per_minute)
+        self._available_requests = self._request_capacity
+        self._available_tokens = self.tokens_per_minute or 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add capacity accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60.0
+        self._last_refill = now
+        
+        self._available_requests = min(self._request_capacity,
+                                       self._available_requests + elapsed_minutes * self.requests_per_minute)
+        if self.tokens_per_minute:
+            self._available_tokens = min(self.tokens_per_minute,
+                                         self._available_tokens + elapsed_minutes * self.tokens_per_minute)
+    
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request and the given number of tokens can be spent.
+        
+        Args:
+            tokens: Estimated tokens for the request
+            
+        Returns:
+            Seconds spent waiting
+        """
+        if self.tokens_per_minute:
+            # A single request larger than the bucket could never be admitted
+            tokens = min(tokens, self.tokens_per_minute)
+        
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                
+                request_deficit = 1.0 - self._available_requests
+                token_deficit = (tokens - self._available_tokens) if self.tokens_per_minute else 0.0
+                
+                if request_deficit <= 0 and token_deficit <= 0:
+                    self._available_requests -= 1.0
+                    if self.tokens_per_minute:
+                        self._available_tokens -= tokens
+                    return waited
+                
+                wait_seconds = 0.0
+                if request_deficit > 0:
+                    wait_seconds = request_deficit / self.requests_per_minute * 60.0
+                if token_deficit > 0:
+                    wait_seconds = max(wait_seconds, token_deficit / self.tokens_per_minute * 60.0)
+            
+            wait_seconds = max(wait_seconds, 0.01)
+            time.sleep(wait_seconds)
+            waited += wait_seconds
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once a request's real usage is known."""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._refill()
+            self._available_tokens -= (actual_tokens - min(estimated_tokens, self.tokens_per_minute))
+
+
 class PDFProcessor:
     """
     Advanced PDF processor using Claude API with intelligent chunking and caching.
+    
+    Completed documents are cached as a whole; individual chunk results are
+    cached by (file hash, page range, model, prompt version) so interrupted or
+    partially failed runs resume without paying for finished chunks again.
     """
     
+    # Block size for streaming file hashes; PDFs are never read into memory whole
+    HASH_BLOCK_SIZE = 1024 * 1024
+    
+    # Characters typical of mathematical notation; equation layout rarely survives a PDF text layer
+    MATH_GLYPHS = frozenset(
+        "∫∬∮∑∏√∂∇∆∞±∓×÷≤≥≠≈≡∝∈∉⊂⊃⊆⊇∪∩∀∃∧∨¬→←↔⇒⇔⟨⟩‖°′″"
+        "αβγδεζηθικλμνξπρστυφχψωΓΔΘΛΞΠΣΦΨΩ"
+    )
+    
+    # Bump PROMPT_VERSION whenever EXTRACTION_PROMPT changes to invalidate chunk caches
+    PROMPT_VERSION = "1"
+    EXTRACTION_PROMPT = """Extract all text content from this PDF chunk without summarizing. 
+                        Preserve formatting, headings, and structure as much as possible. 
+                        Include any tables, figures captions, and mathematical content.
+                        If there are equations, preserve them in a readable format."""
+    
     def __init__(self, config=None):
         """Initialize PDF processor with configuration."""
         self.config = config or {}
@@ -56,6 +168,22 @@ class PDFProcessor:
         self.cache_dir = Path(self.config.get('cache_dir', './cache/pdf_processed'))
         self.rate_limit_delay = self.config.get('rate_limit_delay', 1.0)  # seconds between API calls
         
+        # Concurrency and rate limiting
+        self.max_concurrent_chunks = max(1, int(self.config.get('max_concurrent_chunks', 1)))
+        self.requests_per_minute = self.config.get('requests_per_minute') or (
+            60.0 / self.rate_limit_delay if self.rate_limit_delay > 0 else 1000.0)
+        self.tokens_per_minute = self.config.get('tokens_per_minute')
+        self.estimated_tokens_per_page = self.config.get('estimated_tokens_per_page', 2000)
+        self.retry_attempts = max(1, int(self.config.get('retry_attempts', 3)))
+        self.retry_backoff_seconds = self.config.get('retry_backoff_seconds', 2.0)
+        self.rate_limiter = TokenBucketRateLimiter(self.requests_per_minute, self.tokens_per_minute)
+        
+        # Local text-layer fast path (PyMuPDF); pages failing these checks go to the API
+        self.local_text_fast_path = self.config.get('local_text_fast_path', True)
+        self.local_text_min_chars = self.config.get('local_text_min_chars', 200)
+        self.local_text_max_garbage_ratio = self.config.get('local_text_max_garbage_ratio', 0.05)
+        self.local_text_max_math_ratio = self.config.get('local_text_max_math_ratio', 0.03)
+        
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -65,13 +193,21 @@ class PDFProcessor:
             'cache_hits': 0,
             'api_calls': 0,
             'total_pages_processed': 0,
-            'processing_time': 0.0
+            'processing_time': 0.0,
+            'chunk_retries': 0,
+            'chunk_cache_hits': 0,
+            'local_pages': 0,
+            'rate_limit_wait': 0.0
         }
+        self._stats_lock = threading.Lock()
     
     def get_pdf_hash(self, pdf_path: Path) -> str:
-        """Generate hash of PDF file for cache key."""
+        """Generate hash of PDF file for cache key, reading in fixed-size blocks."""
+        sha256 = hashlib.sha256()
         with open(pdf_path, 'rb') as f:
-            return hashlib.sha256(f.read()).hexdigest()
+            for block in iter(lambda: f.read(self.HASH_BLOCK_SIZE), b''):
+                sha256.update(block)
+        return sha256.hexdigest()
     
     def get_cache_path(self, pdf_path: Path, file_hash: str) -> Path:
         """Get cache file path for processed PDF."""
@@ -99,50 +235,183 @@ class PDFProcessor:
         except Exception as e:
             logger.error(f"Failed to save cache {cache_path}: {e}")
     
+    def get_chunk_cache_path(self, file_hash: str, metadata: Dict[str, Any]) -> Path:
+        """Get cache file path for one chunk's extracted text."""
+        key_data = f"{file_hash}:{metadata['start_page']}:{metadata['end_page']}:{self.model}:{self.PROMPT_VERSION}"
+        key = hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        filename = f"p{metadata['start_page']:05d}-{metadata['end_page']:05d}_{key}.json"
+        return self.cache_dir / "chunks" / file_hash[:16] / filename
+    
+    def load_chunk_from_cache(self, file_hash: str, metadata: Dict[str, Any]) -> Optional[str]:
+        """Load a chunk's extracted text from the chunk cache."""
+        chunk_cache_path = self.get_chunk_cache_path(file_hash, metadata)
+        try:
+            if chunk_cache_path.exists():
+                with open(chunk_cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)['text']
+        except Exception as e:
+            logger.warning(f"Failed to load chunk cache {chunk_cache_path}: {e}")
+        return None
+    
+    def save_chunk_to_cache(self, file_hash: str, metadata: Dict[str, Any], text: str):
+        """Save a chunk's extracted text to the chunk cache."""
+        chunk_cache_path = self.get_chunk_cache_path(file_hash, metadata)
+        try:
+            chunk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so an interrupted run never leaves a truncated entry
+            tmp_path = chunk_cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'file_hash': file_hash,
+                    'start_page': metadata['start_page'],
+                    'end_page': metadata['end_page'],
+                    'claude_model': self.model,
+                    'prompt_version': self.PROMPT_VERSION,
+                    'processed_date': datetime.now().isoformat(),
+                    'text': text
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, chunk_cache_path)
+        except Exception as e:
+            logger.error(f"Failed to save chunk cache {chunk_cache_path}: {e}")
+    
+    def assess_page_text(self, text: str) -> Dict[str, Any]:
+        """
+        Score a page's embedded text layer.
+        
+        Returns:
+            Dictionary with char_count, garbage_ratio, math_ratio and
+            use_local (True when the text is good enough to skip the API)
+        """
+        chars = [c for c in text if not c.isspace()]
+        char_count = len(chars)
+        if char_count == 0:
+            return {'char_count': 0, 'garbage_ratio': 0.0, 'math_ratio': 0.0, 'use_local': False}
+        
+        # Replacement, control and private-use characters come from broken font encodings
+        garbage = sum(1 for c in chars if c == '\ufffd' or unicodedata.category(c) in ('Cc', 'Co', 'Cs'))
+        math = sum(1 for c in chars if c in self.MATH_GLYPHS)
+        garbage_ratio = garbage / char_count
+        math_ratio = math / char_count
+        
+        return {
+            'char_count': char_count,
+            'garbage_ratio': garbage_ratio,
+            'math_ratio': math_ratio,
+            'use_local': (char_count >= self.local_text_min_chars and
+                          garbage_ratio <= self.local_text_max_garbage_ratio and
+                          math_ratio <= self.local_text_max_math_ratio)
+        }
+    
+    def triage_pages(self, pdf_path: Path) -> Optional[List[Optional[str]]]:
+        """
+        Extract each page's text layer locally and keep the pages that pass assess_page_text.
+        
+        Returns:
+            Per-page list holding local text, or None for pages that need
+            the API; None overall if the fast path is disabled, PyMuPDF
+            is not installed or the text layer cannot be read
+        """
+        if not self.local_text_fast_path:
+            return None
+        
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            logger.debug("PyMuPDF not available - sending all pages to the API")
+            return None
+        
+        page_texts = []
+        try:
+            with fitz.open(str(pdf_path)) as doc:
+                for page in doc:
+                    text = page.get_text()
+                    page_texts.append(text if self.assess_page_text(text)['use_local'] else None)
+        except Exception as e:
+            # Malformed or encrypted files still go through the API path
+            logger.warning(f"Text layer triage failed for {pdf_path.name}, sending all pages to the API: {e}")
+            return None
+        
+        local_count = sum(1 for text in page_texts if text is not None)
+        logger.info(f"Text layer triage for {pdf_path.name}: {local_count}/{len(page_texts)} pages local")
+        return page_texts
+    
+    def plan_chunks(self, page_texts: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """
+        Group pages into chunks of at most max_pages_per_chunk.
+        
+        Runs of local pages and of API pages are chunked separately, so each
+        chunk has a single source ('local' or 'api') and chunks stay in page order.
+        """
+        plan = []
+        page_num = 0
+        while page_num < len(page_texts):
+            is_local = page_texts[page_num] is not None
+            end_page = page_num + 1
+            while (end_page < len(page_texts) and end_page - page_num < self.max_pages_per_chunk and
+                   (page_texts[end_page] is not None) == is_local):
+                end_page += 1
+            
+            plan.append({
+                'chunk_index': len(plan),
+                'start_page': page_num + 1,  # 1-indexed for human readability
+                'end_page': end_page,
+                'page_count': end_page - page_num,
+                'source': 'local' if is_local else 'api'
+            })
+            page_num = end_page
+        return plan
+    
+    def iter_pdf_chunks(self, pdf_reader: PyPDF2.PdfReader,
+                        chunk_plan: Optional[Iterable[Dict[str, Any]]] = None) -> Iterator[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Lazily yield chunks from an open PDF reader.
+        
+        Only one chunk's bytes are built at a time, so peak memory stays
+        around a single chunk however large the PDF is. The reader's file
+        must stay open while the generator is consumed.
+        
+        Args:
+            pdf_reader: Open PDF reader
+            chunk_plan: Chunk metadata from plan_chunks; defaults to every page
+        
+        Yields:
+            (pdf_bytes, metadata) tuples in page order
+        """
+        if chunk_plan is None:
+            chunk_plan = self.plan_chunks([None] * len(pdf_reader.pages))
+        
+        for metadata in chunk_plan:
+            # Create new PDF with chunk pages
+            pdf_writer = PyPDF2.PdfWriter()
+            for page_num in range(metadata['start_page'] - 1, metadata['end_page']):
+                pdf_writer.add_page(pdf_reader.pages[page_num])
+            
+            # Write chunk to bytes
+            with io.BytesIO() as chunk_buffer:
+                pdf_writer.write(chunk_buffer)
+                chunk_bytes = chunk_buffer.getvalue()
+            
+            metadata = dict(metadata, chunk_size_bytes=len(chunk_bytes))
+            
+            logger.debug(f"Created chunk {metadata['chunk_index'] + 1}: "
+                        f"pages {metadata['start_page']}-{metadata['end_page']}")
+            yield chunk_bytes, metadata
+    
     def split_pdf_into_chunks(self, pdf_path: Path) -> List[Tuple[bytes, Dict[str, Any]]]:
         """
         Split PDF into manageable chunks with metadata.
         
+        Materialises every chunk; process_pdf streams them with iter_pdf_chunks instead.
+        
         Returns:
             List of (pdf_bytes, metadata) tuples
         """
-        chunks = []
-        
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
+                logger.info(f"Splitting PDF {pdf_path.name} ({len(pdf_reader.pages)} pages) into chunks")
                 
-                logger.info(f"Splitting PDF {pdf_path.name} ({total_pages} pages) into chunks")
-                
-                # Create chunks of pages
-                for start_page in range(0, total_pages, self.max_pages_per_chunk):
-                    end_page = min(start_page + self.max_pages_per_chunk, total_pages)
-                    
-                    # Create new PDF with chunk pages
-                    pdf_writer = PyPDF2.PdfWriter()
-                    for page_num in range(start_page, end_page):
-                        pdf_writer.add_page(pdf_reader.pages[page_num])
-                    
-                    # Write chunk to bytes
-                    chunk_bytes = bytes()
-                    import io
-                    chunk_buffer = io.BytesIO()
-                    pdf_writer.write(chunk_buffer)
-                    chunk_bytes = chunk_buffer.getvalue()
-                    chunk_buffer.close()
-                    
-                    # Create metadata
-                    metadata = {
-                        'chunk_index': len(chunks),
-                        'start_page': start_page + 1,  # 1-indexed for human readability
-                        'end_page': end_page,
-                        'page_count': end_page - start_page,
-                        'chunk_size_bytes': len(chunk_bytes)
-                    }
-                    
-                    chunks.append((chunk_bytes, metadata))
-                    logger.debug(f"Created chunk {len(chunks)}: pages {start_page+1}-{end_page}")
+                chunks = list(self.iter_pdf_chunks(pdf_reader))
                 
                 logger.info(f"Split PDF into {len(chunks)} chunks")
                 return chunks
@@ -156,8 +425,9 @@ class PDFProcessor:
         try:
             chunk_base64 = base64.b64encode(chunk_bytes).decode('utf-8')
             
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            # Rate limiting (shared across concurrent chunk workers)
+            estimated_tokens = metadata.get('page_count', 1) * self.estimated_tokens_per_page + self.max_tokens
+            waited = self.rate_limiter.acquire(estimated_tokens)
             
             response = self.client.messages.create(
                 model=self.model,
@@ -173,15 +443,21 @@ class PDFProcessor:
                         }
                     }, {
                         "type": "text", 
-                        "text": """Extract all text content from this PDF chunk without summarizing. 
-                        Preserve formatting, headings, and structure as much as possible. 
-                        Include any tables, figures captions, and mathematical content.
-                        If there are equations, preserve them in a readable format."""
+                        "text": self.EXTRACTION_PROMPT
                     }]
                 }]
             )
             
-            self.stats['api_calls'] += 1
+            usage = getattr(response, 'usage', None)
+            if usage is not None:
+                self.rate_limiter.record_usage(
+                    estimated_tokens,
+                    getattr(usage, 'input_tokens', 0) + getattr(usage, 'output_tokens', 0)
+                )
+            
+            with self._stats_lock:
+                self.stats['api_calls'] += 1
+                self.stats['rate_limit_wait'] += waited
             
             # Extract text from response
             text_content = response.content[0].text if response.content else ""
@@ -196,13 +472,113 @@ class PDFProcessor:
             logger.error(f"Failed to process PDF chunk {metadata['chunk_index']}: {e}")
             raise
     
-    def process_pdf(self, pdf_path: Path, force_reprocess: bool = False) -> PDFProcessingResult:
+    @staticmethod
+    def is_transient_error(error: Exception) -> bool:
+        """Whether a chunk failure may succeed on retry (rate limit, timeout, connection, 5xx)."""
+        if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError,
+                              anthropic.InternalServerError)):
+            return True
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in (408, 409, 429) or error.status_code >= 500
+        return isinstance(error, (TimeoutError, ConnectionError))
+    
+    def process_pdf_chunk_with_retry(self, chunk_bytes: bytes, metadata: Dict[str, Any]) -> str:
+        """
+        Process a PDF chunk, retrying transient failures with exponential backoff.
+        
+        Waits retry_backoff_seconds * 2**attempt (with jitter) between the
+        retry_attempts tries; the last error is re-raised. Permanent errors
+        (authentication, other 4xx, malformed chunks) are re-raised at once.
+        """
+        for attempt in range(self.retry_attempts):
+            try:
+                return self.process_pdf_chunk(chunk_bytes, metadata)
+            except Exception as e:
+                if attempt + 1 >= self.retry_attempts or not self.is_transient_error(e):
+                    raise
+                
+                delay = self.retry_backoff_seconds * (2 ** attempt) * (1 + random.random() * 0.25)
+                with self._stats_lock:
+                    self.stats['chunk_retries'] += 1
+                logger.warning(f"Retrying chunk {metadata['chunk_index']} in {delay:.1f}s "
+                              f"(attempt {attempt + 2}/{self.retry_attempts}): {e}")
+                time.sleep(delay)
+    
+    def process_chunks(self, chunks: Iterable[Tuple[bytes, Dict[str, Any]]],
+                       file_hash: Optional[str] = None,
+                       use_chunk_cache: bool = True) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Process chunks, concurrently when max_concurrent_chunks > 1.
+        
+        Chunks are pulled from the iterable lazily with at most twice
+        max_concurrent_chunks in flight, so a generator such as
+        iter_pdf_chunks never has to be materialised.
+        
+        Args:
+            chunks: (pdf_bytes, metadata) tuples from iter_pdf_chunks
+            file_hash: Hash of the source PDF; enables the chunk cache
+            use_chunk_cache: Reuse cached chunk text (new results are always cached)
+        
+        Yields:
+            (metadata, text) pairs in chunk order; text is None for chunks
+            that failed after all retries (the error is stored in metadata)
+        """
+        def run_chunk(chunk: Tuple[bytes, Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[str]]:
+            chunk_bytes, chunk_metadata = chunk
+            
+            if file_hash and use_chunk_cache:
+                cached_text = self.load_chunk_from_cache(file_hash, chunk_metadata)
+                if cached_text is not None:
+                    chunk_metadata['from_cache'] = True
+                    with self._stats_lock:
+                        self.stats['chunk_cache_hits'] += 1
+                    return chunk_metadata, cached_text
+            
+            try:
+                chunk_text = self.process_pdf_chunk_with_retry(chunk_bytes, chunk_metadata)
+                if file_hash:
+                    self.save_chunk_to_cache(file_hash, chunk_metadata, chunk_text)
+                return chunk_metadata, chunk_text
+            except Exception as e:
+                logger.error(f"Failed to process chunk {chunk_metadata['chunk_index']}: {e}")
+                chunk_metadata['error'] = str(e)
+                return chunk_metadata, None
+        
+        if self.max_concurrent_chunks == 1:
+            for chunk in chunks:
+                yield run_chunk(chunk)
+            return
+        
+        # Futures are yielded in submission order, so chunk text reassembles in page order
+        max_in_flight = self.max_concurrent_chunks * 2
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent_chunks,
+            thread_name_prefix="pdf_chunk"
+        ) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(run_chunk, chunk))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def process_pdf(self, pdf_path: Path, force_reprocess: bool = False,
+                    failed_chunks_only: bool = False) -> PDFProcessingResult:
         """
         Process a PDF file with intelligent chunking and caching.
         
+        Chunks already in the chunk cache are reused, so a run that was
+        interrupted or had failed chunks resumes with only the missing ones.
+        The whole-document cache is written only when every chunk succeeded.
+        Pages whose embedded text layer passes assess_page_text are read
+        locally with PyMuPDF and never sent to the API.
+        
         Args:
             pdf_path: Path to PDF file
             force_reprocess: If True, ignore cache and reprocess
+            failed_chunks_only: With force_reprocess, keep cached chunks and
+                                only reprocess chunks that failed or are missing
             
         Returns:
             PDFProcessingResult with extracted text and metadata
@@ -228,27 +604,54 @@ class PDFProcessor:
                 return cached_result
         
         try:
-            # Split PDF into chunks
-            chunks = self.split_pdf_into_chunks(pdf_path)
-            
-            if not chunks:
-                raise ValueError("No chunks created from PDF")
-            
-            # Process each chunk
-            full_text = ""
+            text_parts = []
             chunks_metadata = []
             processed_pages = 0
             
-            logger.info(f"Processing {len(chunks)} chunks for {pdf_path.name}")
+            # Pages with a usable text layer are read locally; only the rest go to the API
+            page_texts = self.triage_pages(pdf_path)
             
-            for chunk_bytes, chunk_metadata in chunks:
-                try:
-                    chunk_text = self.process_pdf_chunk(chunk_bytes, chunk_metadata)
+            with contextlib.ExitStack() as stack:
+                # Single PyPDF2 parse pass, and none at all when every page is local
+                pdf_reader = None
+                if page_texts is None or None in page_texts:
+                    pdf_reader = PyPDF2.PdfReader(stack.enter_context(open(pdf_path, 'rb')))
+                    if page_texts is None:
+                        page_texts = [None] * len(pdf_reader.pages)
+                total_pages = len(page_texts)
+                
+                if total_pages == 0:
+                    raise ValueError("No chunks created from PDF")
+                
+                chunk_plan = self.plan_chunks(page_texts)
+                api_plan = [chunk for chunk in chunk_plan if chunk['source'] == 'api']
+                logger.info(f"Processing {len(chunk_plan)} chunks ({total_pages} pages) for {pdf_path.name}: "
+                           f"{len(api_plan)} via API ({self.max_concurrent_chunks} concurrent)")
+                
+                use_chunk_cache = not force_reprocess or failed_chunks_only
+                api_results = iter(())
+                if api_plan:
+                    api_results = self.process_chunks(self.iter_pdf_chunks(pdf_reader, api_plan),
+                                                      file_hash, use_chunk_cache)
+                
+                # Merge local and API chunks back into page order
+                for planned_chunk in chunk_plan:
+                    if planned_chunk['source'] == 'local':
+                        chunk_metadata = dict(planned_chunk)
+                        chunk_text = "\n".join(page_texts[planned_chunk['start_page'] - 1:planned_chunk['end_page']])
+                        self.stats['local_pages'] += planned_chunk['page_count']
+                    else:
+                        chunk_metadata, chunk_text = next(api_results)
+                    
+                    if chunk_text is None:
+                        chunk_metadata['success'] = False
+                        chunks_metadata.append(chunk_metadata)
+                        continue
                     
                     # Add chunk separator and text
-                    if full_text:
-                        full_text += f"\n\n--- PAGE {chunk_metadata['start_page']} ---\n\n"
-                    full_text += chunk_text
+                    if text_parts:
+                        text_parts.append(f"\n\n--- PAGE {chunk_metadata['start_page']} ---\n\n")
+                    text_parts.append(chunk_text)
                     
                     # Update metadata
                     chunk_metadata['text_length'] = len(chunk_text)
@@ -257,19 +660,10 @@ class PDFProcessor:
                     
                     processed_pages += chunk_metadata['page_count']
                     
-                    logger.info(f"Completed chunk {chunk_metadata['chunk_index'] + 1}/{len(chunks)} "
+                    logger.info(f"Completed chunk {chunk_metadata['chunk_index'] + 1}/{len(chunk_plan)} "
                               f"for {pdf_path.name}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process chunk {chunk_metadata['chunk_index']}: {e}")
-                    chunk_metadata['success'] = False
-                    chunk_metadata['error'] = str(e)
-                    chunks_metadata.append(chunk_metadata)
-            
-            # Calculate total pages from original PDF
-            with open(pdf_path, 'rb') as f:
-                total_pages = len(PyPDF2.PdfReader(f).pages)
             
+            full_text = "".join(text_parts)
             processing_time = time.time() - start_time
             
             # Create result
@@ -286,8 +680,13 @@ class PDFProcessor:
                 success=True
             )
             
-            # Save to cache
-            self.save_to_cache(result, cache_path)
+            # Only complete results go in the document cache; partial runs resume from chunk caches
+            failed_chunks = [c['chunk_index'] for c in chunks_metadata if not c.get('success')]
+            if failed_chunks:
+                logger.warning(f"{len(failed_chunks)} chunks failed for {pdf_path.name}; "
+                              f"rerun to resume from the chunk cache")
+            else:
+                self.save_to_cache(result, cache_path)
             
             # Update statistics
             self.stats['processed_count'] += 1
@@ -357,7 +756,8 @@ class PDFProcessor:
             **self.stats,
             'cache_hit_rate': self.stats['cache_hits'] / max(1, self.stats['processed_count']),
             'avg_processing_time': self.stats['processing_time'] / max(1, self.stats['processed_count']),
-            'avg_pages_per_pdf': self.stats['total_pages_processed'] / max(1, self.stats['processed_count'])
+            'avg_pages_per_pdf': self.stats['total_pages_processed'] / max(1, self.stats['processed_count']),
+            'local_page_rate': self.stats['local_pages'] / max(1, self.stats['total_pages_processed'])
         }
     
     def clear_cache(self, older_than_days: Optional[int] = None):
@@ -369,10 +769,10 @@ class PDFProcessor:
         """
         if older_than_days:
             cutoff_time = time.time() - (older_than_days * 24 * 60 * 60)
-            cache_files = [f for f in self.cache_dir.glob("*.json") 
+            cache_files = [f for f in self.cache_dir.rglob("*.json") 
                           if f.stat().st_mtime < cutoff_time]
         else:
-            cache_files = list(self.cache_dir.glob("*.json"))
+            cache_files = list(self.cache_dir.rglob("*.json"))
         
         for cache_file in cache_files:
             try:
@@ -15,6 +15,7 @@ from contextlib import contextmanager
 
 from .config import OpenBooksConfig
 from .repository_tracker import RepositoryTracker
+from .cnxml_renderer import CNXMLRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,9 @@ class RepositoryManager:
                 if self.config.git_lfs_enabled and self._check_git_lfs():
                     self._setup_git_lfs(target_path)
                 
+                # New media files must be visible to image resolution
+                CNXMLRenderer.media_index.invalidate(target_path)
+                
                 # Add to repository tracker
                 size_mb = self._get_directory_size(target_path) / (1024 * 1024)
                 self.tracker.add_repository(book_info, str(target_path), size_mb)
@@ -256,6 +260,8 @@ class RepositoryManager:
                     if self.config.git_lfs_enabled and self._check_git_lfs():
                         self._update_git_lfs(repo_path)
                     
+                    CNXMLRenderer.media_index.invalidate(repo_path)
+                    
                     return True
                 else:
                     logger.error(f"Failed to pull updates: {result.stderr}")
@@ -9,9 +9,11 @@ Goal: Provide lightning-fast search capabilities across entire textbook collecti
 
 import logging
 import json
+import os
 import sqlite3
+import subprocess
 import re
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable
 from pathlib import Path
 from dataclasses import dataclass
 import hashlib
@@ -51,20 +53,103 @@ class IndexStats:
     last_updated: float
 
 
+@dataclass
+class BulkIndexStats:
+    """Throughput statistics for a bulk index build."""
+    books_indexed: int = 0
+    books_failed: int = 0
+    books_skipped: int = 0
+    chapters: int = 0
+    terms: int = 0
+    formulas: int = 0
+    total_rows: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+
+
+def compute_source_fingerprint(source_path: str) -> str:
+    """
+    Compute a cheap change fingerprint for an indexed source.
+    
+    Git repositories are identified by their HEAD commit; other files and
+    directories by size/file count and newest modification time.
+    
+    Args:
+        source_path: Path to a repository, directory or file
+        
+    Returns:
+        Fingerprint string that changes when the source changes
+    """
+    path = Path(source_path)
+    
+    if (path / '.git').exists():
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=path, capture_output=True, text=True, timeout=30,
+                # Never fall through to an enclosing repository
+                env=dict(os.environ, GIT_CEILING_DIRECTORIES=str(path.resolve().parent))
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return f"git:{result.stdout.strip()}"
+        except Exception as e:
+            logger.debug(f"Could not read git HEAD for {path}: {e}")
+    
+    if path.is_file():
+        stat = path.stat()
+        return f"mtime:{stat.st_size}:{stat.st_mtime_ns}"
+    
+    file_count = 0
+    newest_mtime = 0
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d != '.git']
+        for filename in files:
+            try:
+                newest_mtime = max(newest_mtime, os.stat(os.path.join(root, filename)).st_mtime_ns)
+                file_count += 1
+            except OSError:
+                continue
+    return f"mtime:{file_count}:{newest_mtime}"
+
+
 class SearchIndexer:
     """
     High-performance search indexing system for textbook collections.
     
     Features:
-    - Full-text search with TF-IDF scoring
+    - Full-text search with TF-IDF scoring (document frequencies maintained
+      incrementally, IDF applied at query time)
+    - Optional SQLite FTS5 engine with BM25 ranking, phrase and prefix queries
     - Mathematical formula indexing
     - Chapter and section structure preservation
     - Fast autocomplete suggestions
     - Relevance-based result ranking
     """
     
-    def __init__(self, config: OpenBooksConfig):
-        """Initialize search indexer with configuration."""
+    SUPPORTED_ENGINES = ('terms', 'fts5')
+    
+    # Markers placed around matched terms in FTS5 snippets (Markdown bold)
+    FTS_HIGHLIGHT_START = '**'
+    FTS_HIGHLIGHT_END = '**'
+    FTS_SNIPPET_TOKENS = 32
+    
+    # Secondary indexes, dropped and recreated around bulk loads
+    SECONDARY_INDEXES = {
+        'idx_terms_term': 'CREATE INDEX IF NOT EXISTS idx_terms_term ON terms (term)',
+        'idx_terms_book': 'CREATE INDEX IF NOT EXISTS idx_terms_book ON terms (book_id)',
+        'idx_chapters_book': 'CREATE INDEX IF NOT EXISTS idx_chapters_book ON chapters (book_id)',
+        'idx_formulas_book': 'CREATE INDEX IF NOT EXISTS idx_formulas_book ON formulas (book_id)',
+    }
+    
+    def __init__(self, config: OpenBooksConfig, engine: Optional[str] = None):
+        """
+        Initialize search indexer with configuration.
+        
+        Args:
+            config: OpenBooks configuration
+            engine: Text search engine ('terms' or 'fts5'); defaults to
+                    config.search_engine
+        """
         self.config = config
         self.index_dir = Path(config.search_index_dir)
         self.index_dir.mkdir(parents=True, exist_ok=True)
@@ -73,10 +158,21 @@ class SearchIndexer:
         self.db_path = self.index_dir / "search_index.db"
         self.stopwords = self._load_stopwords()
         
+        # Select text search engine
+        self.engine = (engine or getattr(config, 'search_engine', 'terms') or 'terms').lower()
+        if self.engine not in self.SUPPORTED_ENGINES:
+            raise ValueError(f"Unsupported search engine: {self.engine}")
+        if self.engine == 'fts5' and not self.fts5_available():
+            logger.warning("SQLite FTS5 extension not available, falling back to 'terms' engine")
+            self.engine = 'terms'
+        
+        # Whether chapters/formulas are mirrored into FTS5 tables (set by _init_database)
+        self.fts_enabled = False
+        
         # Initialize database
         self._init_database()
         
-        logger.info(f"SearchIndexer initialized with index at {self.index_dir}")
+        logger.info(f"SearchIndexer initialized with index at {self.index_dir} (engine: {self.engine})")
     
     def index_content(self, content: ExtractedContent) -> bool:
         """
@@ -94,21 +190,17 @@ class SearchIndexer:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Insert book record
+                # Replace any previous version of this book so counts stay consistent
                 book_id = content.content_hash
+                self._record_source(cursor, content)
+                self._delete_book(cursor, book_id)
+                
+                # Insert book record
                 cursor.execute('''
                     INSERT OR REPLACE INTO books 
                     (id, title, authors, source_path, format_type, content_hash, indexed_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    book_id,
-                    content.title,
-                    json.dumps(content.authors),
-                    content.source_path,
-                    content.format_type,
-                    content.content_hash,
-                    time.time()
-                ))
+                ''', self._book_row(content))
                 
                 # Index chapters
                 for chapter in content.chapters:
@@ -118,8 +210,8 @@ class SearchIndexer:
                 for formula in content.mathematical_notation:
                     self._index_formula(cursor, book_id, formula)
                 
-                # Build search terms index
-                self._build_terms_index(cursor, book_id, content)
+                # Update document frequencies for this book's terms
+                self._update_document_frequency(cursor, book_id)
                 
                 conn.commit()
                 logger.info(f"Successfully indexed {content.title}")
@@ -129,6 +221,171 @@ class SearchIndexer:
             logger.error(f"Error indexing content {content.title}: {e}")
             return False
     
+    def bulk_index(self, contents: Iterable[ExtractedContent], batch_size: int = 50,
+                   skip_existing: bool = False) -> BulkIndexStats:
+        """
+        Index many books over a single connection with batched inserts.
+        
+        Runs with synchronous=OFF for the duration of the build, buffers
+        chapter/term/formula rows for executemany, and commits every
+        batch_size books. When the index starts empty, secondary indexes are
+        dropped before the load and recreated afterwards, also when the load
+        fails part-way. The database is switched to WAL journaling; unlike
+        the other pragmas this persists on the file, which is intended so
+        searches can read while later incremental runs write.
+        
+        Args:
+            contents: Iterable of ExtractedContent objects (may be a generator)
+            batch_size: Number of books per commit
+            skip_existing: Leave books whose content hash is already indexed
+                           untouched (only their source record is refreshed)
+            
+        Returns:
+            BulkIndexStats with row counts and rows/second throughput
+        """
+        stats = BulkIndexStats()
+        start_time = time.time()
+        batch_size = max(1, batch_size)
+        
+        conn = sqlite3.connect(self.db_path)
+        drop_indexes = False
+        try:
+            cursor = conn.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=OFF')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            
+            # Only drop indexes for fresh builds; replacing books needs idx_*_book
+            cursor.execute('SELECT COUNT(*) FROM books')
+            drop_indexes = cursor.fetchone()[0] == 0
+            if drop_indexes:
+                for index_name in self.SECONDARY_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+            
+            # Row ids are assigned here so terms and FTS rows can reference them
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM chapters')
+            next_chapter_id = cursor.fetchone()[0] + 1
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM formulas')
+            next_formula_id = cursor.fetchone()[0] + 1
+            
+            batch = self._new_bulk_batch()
+            seen_books = set()
+            books_in_batch = 0
+            
+            for content in contents:
+                book_id = content.content_hash
+                try:
+                    if book_id in seen_books or (skip_existing and self._book_exists(cursor, book_id)):
+                        self._record_source(cursor, content)
+                        stats.books_skipped += 1
+                        continue
+                    
+                    # Build the book's rows on their own so a failure part-way leaves no trace
+                    book_batch = self._new_bulk_batch()
+                    book_batch['books'].append(self._book_row(content))
+                    chapter_id = next_chapter_id
+                    formula_id = next_formula_id
+                    book_terms = set()
+                    
+                    for chapter in content.chapters:
+                        book_batch['chapters'].append((
+                            chapter_id,
+                            book_id,
+                            chapter.get('number', ''),
+                            chapter.get('title', ''),
+                            chapter.get('content', ''),
+                            chapter.get('page_start')
+                        ))
+                        book_batch['chapters_fts'].append(
+                            (chapter_id, chapter.get('title', ''), chapter.get('content', ''))
+                        )
+                        term_rows = self._chapter_term_rows(book_id, chapter_id, chapter.get('content', ''))
+                        book_batch['terms'].extend(term_rows)
+                        book_terms.update(row[0] for row in term_rows)
+                        chapter_id += 1
+                    
+                    for formula in content.mathematical_notation:
+                        book_batch['formulas'].append((
+                            formula_id,
+                            book_id,
+                            formula.get('content', ''),
+                            formula.get('type', 'formula'),
+                            formula.get('context', '')
+                        ))
+                        book_batch['formulas_fts'].append(
+                            (formula_id, formula.get('content', ''), formula.get('context', ''))
+                        )
+                        formula_id += 1
+                    
+                    book_batch['doc_freq'].update(book_terms)
+                    
+                except Exception as e:
+                    stats.books_failed += 1
+                    logger.error(f"Error preparing {content.title} for bulk indexing: {e}")
+                    continue
+                
+                # Only a fully prepared book replaces the indexed copy and its source record
+                self._record_source(cursor, content)
+                if not drop_indexes:
+                    self._delete_book(cursor, book_id)
+                for key, rows in book_batch.items():
+                    if key == 'doc_freq':
+                        batch[key].update(rows)
+                    else:
+                        batch[key].extend(rows)
+                seen_books.add(book_id)
+                next_chapter_id = chapter_id
+                next_formula_id = formula_id
+                stats.books_indexed += 1
+                books_in_batch += 1
+                
+                if books_in_batch >= batch_size:
+                    self._flush_bulk_batch(cursor, batch, stats)
+                    conn.commit()
+                    batch = self._new_bulk_batch()
+                    books_in_batch = 0
+                    
+                    elapsed = time.time() - start_time
+                    logger.info(f"Bulk indexed {stats.books_indexed} books, "
+                               f"{stats.total_rows / elapsed if elapsed > 0 else 0:.0f} rows/s")
+            
+            self._flush_bulk_batch(cursor, batch, stats)
+            conn.commit()
+            
+            if drop_indexes:
+                logger.info("Recreating search index secondary indexes")
+                self._create_secondary_indexes(conn)
+            if self.fts_enabled:
+                cursor.execute("INSERT INTO chapters_fts(chapters_fts) VALUES ('optimize')")
+            conn.commit()
+            
+        except Exception:
+            # Batches already committed stay indexed; never leave the index without its lookups
+            conn.rollback()
+            if drop_indexes:
+                try:
+                    self._create_secondary_indexes(conn)
+                except sqlite3.Error as e:
+                    logger.error(f"Could not recreate secondary indexes after failed bulk load: {e}")
+            raise
+            
+        finally:
+            conn.close()
+        
+        stats.elapsed_seconds = time.time() - start_time
+        if stats.elapsed_seconds > 0:
+            stats.rows_per_second = stats.total_rows / stats.elapsed_seconds
+        
+        logger.info(f"Bulk indexing complete: {stats.books_indexed} books, {stats.total_rows} rows "
+                   f"in {stats.elapsed_seconds:.2f}s ({stats.rows_per_second:.0f} rows/s)")
+        return stats
+    
+    def _create_secondary_indexes(self, conn: sqlite3.Connection):
+        """Create any missing SECONDARY_INDEXES and commit."""
+        for create_sql in self.SECONDARY_INDEXES.values():
+            conn.execute(create_sql)
+        conn.commit()
+    
     def search(self, 
                query: str, 
                max_results: int = 50,
@@ -155,10 +412,16 @@ class SearchIndexer:
                 results = []
                 
                 if search_type in ['all', 'text']:
-                    results.extend(self._search_text(conn, query, max_results))
+                    if self.engine == 'fts5':
+                        results.extend(self._search_text_fts(conn, query, max_results))
+                    else:
+                        results.extend(self._search_text(conn, query, max_results))
                 
                 if search_type in ['all', 'formula']:
-                    results.extend(self._search_formulas(conn, query, max_results))
+                    if self.engine == 'fts5':
+                        results.extend(self._search_formulas_fts(conn, query, max_results))
+                    else:
+                        results.extend(self._search_formulas(conn, query, max_results))
                 
                 if search_type in ['all', 'title']:
                     results.extend(self._search_titles(conn, query, max_results))
@@ -175,6 +438,73 @@ class SearchIndexer:
             logger.error(f"Error searching for '{query}': {e}")
             return []
     
+    def remove_book(self, book_id: str) -> bool:
+        """
+        Remove a book and all of its chapters, terms and formulas from the index.
+        
+        Args:
+            book_id: Identifier of the book (its content hash)
+            
+        Returns:
+            True if removal successful, False otherwise
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                self._delete_book(cursor, book_id)
+                cursor.execute('DELETE FROM sources WHERE book_id = ?', (book_id,))
+                conn.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error removing book {book_id} from index: {e}")
+            return False
+    
+    def remove_source(self, source_path: str) -> bool:
+        """
+        Remove an indexed source and its book, unless another source shares the book.
+        
+        Args:
+            source_path: Source path recorded when the book was indexed
+            
+        Returns:
+            True if removal successful, False otherwise
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT book_id FROM sources WHERE source_path = ?', (source_path,))
+                row = cursor.fetchone()
+                cursor.execute('DELETE FROM sources WHERE source_path = ?', (source_path,))
+                if row:
+                    self._delete_book_if_unreferenced(cursor, row[0])
+                conn.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error removing source {source_path} from index: {e}")
+            return False
+    
+    def get_indexed_sources(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get fingerprints of all indexed sources.
+        
+        Returns:
+            Dictionary mapping source path to its book_id, fingerprint and indexed_at
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT source_path, book_id, fingerprint, indexed_at FROM sources')
+                return {
+                    source_path: {'book_id': book_id, 'fingerprint': fingerprint, 'indexed_at': indexed_at}
+                    for source_path, book_id, fingerprint, indexed_at in cursor.fetchall()
+                }
+                
+        except Exception as e:
+            logger.error(f"Error reading indexed sources: {e}")
+            return {}
+    
     def get_suggestions(self, partial_query: str, max_suggestions: int = 10) -> List[str]:
         """
         Get autocomplete suggestions for a partial query.
@@ -228,7 +558,7 @@ class SearchIndexer:
                 total_chapters = cursor.fetchone()[0]
                 
                 # Count unique terms
-                cursor.execute('SELECT COUNT(*) FROM terms')
+                cursor.execute('SELECT COUNT(*) FROM document_frequency')
                 unique_terms = cursor.fetchone()[0]
                 
                 # Count total words
@@ -279,6 +609,49 @@ class SearchIndexer:
             logger.error(f"Error rebuilding index: {e}")
             return False
     
+    def migrate_to_fts5(self) -> bool:
+        """
+        Migrate an existing terms/chapters index to the FTS5 engine.
+        
+        Creates the FTS5 tables if needed, (re)builds them from the existing
+        chapters and formulas tables, and switches this indexer to 'fts5'.
+        
+        Returns:
+            True if migration successful, False otherwise
+        """
+        if not self.fts5_available():
+            logger.error("Cannot migrate to FTS5: SQLite FTS5 extension not available")
+            return False
+        
+        try:
+            start_time = time.time()
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                self._init_fts_tables(cursor)
+                self.fts_enabled = True
+                cursor.execute("INSERT INTO chapters_fts(chapters_fts) VALUES ('rebuild')")
+                cursor.execute("INSERT INTO formulas_fts(formulas_fts) VALUES ('rebuild')")
+                cursor.execute("INSERT INTO chapters_fts(chapters_fts) VALUES ('optimize')")
+                conn.commit()
+            
+            self.engine = 'fts5'
+            logger.info(f"Migrated search index to FTS5 in {time.time() - start_time:.2f}s")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error migrating search index to FTS5: {e}")
+            return False
+    
+    @staticmethod
+    def fts5_available() -> bool:
+        """Check whether the SQLite library was compiled with FTS5."""
+        try:
+            with sqlite3.connect(':memory:') as conn:
+                conn.execute('CREATE VIRTUAL TABLE fts5_probe USING fts5(content)')
+            return True
+        except sqlite3.OperationalError:
+            return False
+    
     def _init_database(self) -> None:
         """Initialize SQLite database for search index."""
         try:
@@ -332,6 +705,36 @@ class SearchIndexer:
                     )
                 ''')
                 
+                # Document frequency table: number of books containing each term
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='document_frequency'")
+                needs_df_backfill = cursor.fetchone() is None
+                
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS document_frequency (
+                        term TEXT PRIMARY KEY,
+                        doc_count INTEGER NOT NULL
+                    )
+                ''')
+                
+                # Backfill frequencies for indexes created before the table existed; those
+                # indexes also stored frequency * IDF in tf_idf, so convert it back to TF
+                if needs_df_backfill:
+                    cursor.execute('''
+                        INSERT INTO document_frequency (term, doc_count)
+                        SELECT term, COUNT(DISTINCT book_id) FROM terms GROUP BY term
+                    ''')
+                    self._migrate_legacy_term_scores(conn)
+                
+                # Sources table: change fingerprints for incremental re-indexing
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS sources (
+                        source_path TEXT PRIMARY KEY,
+                        book_id TEXT NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        indexed_at REAL NOT NULL
+                    )
+                ''')
+                
                 # Formulas table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS formulas (
@@ -345,10 +748,15 @@ class SearchIndexer:
                 ''')
                 
                 # Create indexes for performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_terms_term ON terms (term)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_terms_book ON terms (book_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_chapters_book ON chapters (book_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_formulas_book ON formulas (book_id)')
+                for create_sql in self.SECONDARY_INDEXES.values():
+                    cursor.execute(create_sql)
+                
+                # Full-text tables for the FTS5 engine; keep existing FTS tables in
+                # sync even when this indexer searches with the terms engine
+                if self.engine == 'fts5':
+                    self._init_fts_tables(cursor)
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='chapters_fts'")
+                self.fts_enabled = cursor.fetchone() is not None
                 
                 conn.commit()
                 
@@ -356,6 +764,36 @@ class SearchIndexer:
             logger.error(f"Error initializing database: {e}")
             raise
     
+    def _init_fts_tables(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Create FTS5 tables over chapters and formulas.
+        
+        The FTS tables use the chapters/formulas tables as external content,
+        so text is stored once. Tables created over an already populated
+        index are rebuilt from the existing rows.
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='chapters_fts'")
+        needs_rebuild = cursor.fetchone() is None
+        
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS chapters_fts USING fts5(
+                title, content,
+                content='chapters', content_rowid='id',
+                tokenize='porter unicode61'
+            )
+        ''')
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS formulas_fts USING fts5(
+                content, context,
+                content='formulas', content_rowid='id',
+                tokenize='unicode61'
+            )
+        ''')
+        
+        if needs_rebuild:
+            cursor.execute("INSERT INTO chapters_fts(chapters_fts) VALUES ('rebuild')")
+            cursor.execute("INSERT INTO formulas_fts(formulas_fts) VALUES ('rebuild')")
+    
     def _index_chapter(self, cursor: sqlite3.Cursor, book_id: str, chapter: Dict[str, Any]) -> None:
         """Index a single chapter."""
         # Insert chapter record
@@ -373,24 +811,118 @@ class SearchIndexer:
         
         chapter_id = cursor.lastrowid
         
+        if self.fts_enabled:
+            cursor.execute('''
+                INSERT INTO chapters_fts (rowid, title, content)
+                VALUES (?, ?, ?)
+            ''', (chapter_id, chapter.get('title', ''), chapter.get('content', '')))
+        
         # Extract and index terms from chapter content
-        content = chapter.get('content', '')
+        term_rows = self._chapter_term_rows(book_id, chapter_id, chapter.get('content', ''))
+        cursor.executemany('''
+            INSERT OR REPLACE INTO terms 
+            (term, book_id, chapter_id, frequency, tf_idf)
+            VALUES (?, ?, ?, ?, ?)
+        ''', term_rows)
+    
+    def _migrate_legacy_term_scores(self, conn: sqlite3.Connection) -> None:
+        """Rewrite tf_idf as plain TF for terms indexed before IDF moved to query time."""
+        chapter_totals = (
+            (len(self._extract_terms(content)), chapter_id)
+            for chapter_id, content in conn.execute(
+                'SELECT id, content FROM chapters WHERE id IN (SELECT DISTINCT chapter_id FROM terms)'
+            ).fetchall()
+        )
+        conn.executemany('''
+            UPDATE terms SET tf_idf = CASE WHEN ? > 0 THEN CAST(frequency AS REAL) / ? ELSE 0 END
+            WHERE chapter_id = ?
+        ''', ((total, total, chapter_id) for total, chapter_id in chapter_totals))
+    
+    def _chapter_term_rows(self, book_id: str, chapter_id: int, content: str) -> List[Tuple]:
+        """Build terms table rows (term, book_id, chapter_id, frequency, tf) for a chapter."""
         terms = self._extract_terms(content)
         
         # Calculate term frequencies
         term_freq = Counter(terms)
         total_terms = len(terms)
         
+        rows = []
         for term, freq in term_freq.items():
             if term not in self.stopwords and len(term) > 2:
+                # Store the TF component; IDF is applied at query time
                 tf = freq / total_terms if total_terms > 0 else 0
-                
-                # Insert term (IDF will be calculated later)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO terms 
-                    (term, book_id, chapter_id, frequency, tf_idf)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (term, book_id, chapter_id, freq, tf))
+                rows.append((term, book_id, chapter_id, freq, tf))
+        
+        return rows
+    
+    def _book_row(self, content: ExtractedContent) -> Tuple:
+        """Build a books table row for extracted content."""
+        return (
+            content.content_hash,
+            content.title,
+            json.dumps(content.authors),
+            content.source_path,
+            content.format_type,
+            content.content_hash,
+            time.time()
+        )
+    
+    @staticmethod
+    def _new_bulk_batch() -> Dict[str, Any]:
+        """Create empty row buffers for a bulk indexing batch."""
+        return {
+            'books': [],
+            'chapters': [],
+            'chapters_fts': [],
+            'terms': [],
+            'formulas': [],
+            'formulas_fts': [],
+            'doc_freq': Counter()
+        }
+    
+    def _flush_bulk_batch(self, cursor: sqlite3.Cursor, batch: Dict[str, Any], stats: BulkIndexStats) -> None:
+        """Write buffered bulk indexing rows with executemany."""
+        cursor.executemany('''
+            INSERT OR REPLACE INTO books 
+            (id, title, authors, source_path, format_type, content_hash, indexed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', batch['books'])
+        cursor.executemany('''
+            INSERT INTO chapters 
+            (id, book_id, chapter_number, title, content, page_number)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', batch['chapters'])
+        cursor.executemany('''
+            INSERT OR REPLACE INTO terms 
+            (term, book_id, chapter_id, frequency, tf_idf)
+            VALUES (?, ?, ?, ?, ?)
+        ''', batch['terms'])
+        cursor.executemany('''
+            INSERT INTO formulas 
+            (id, book_id, content, formula_type, context)
+            VALUES (?, ?, ?, ?, ?)
+        ''', batch['formulas'])
+        cursor.executemany('''
+            INSERT INTO document_frequency (term, doc_count)
+            VALUES (?, ?)
+            ON CONFLICT(term) DO UPDATE SET doc_count = doc_count + excluded.doc_count
+        ''', batch['doc_freq'].items())
+        
+        if self.fts_enabled:
+            cursor.executemany(
+                'INSERT INTO chapters_fts (rowid, title, content) VALUES (?, ?, ?)',
+                batch['chapters_fts']
+            )
+            cursor.executemany(
+                'INSERT INTO formulas_fts (rowid, content, context) VALUES (?, ?, ?)',
+                batch['formulas_fts']
+            )
+        
+        stats.chapters += len(batch['chapters'])
+        stats.terms += len(batch['terms'])
+        stats.formulas += len(batch['formulas'])
+        stats.total_rows += (len(batch['books']) + len(batch['chapters']) +
+                             len(batch['terms']) + len(batch['formulas']))
     
     def _index_formula(self, cursor: sqlite3.Cursor, book_id: str, formula: Dict[str, str]) -> None:
         """Index a mathematical formula."""
@@ -404,34 +936,78 @@ class SearchIndexer:
             formula.get('type', 'formula'),
             formula.get('context', '')
         ))
+        
+        if self.fts_enabled:
+            cursor.execute('''
+                INSERT INTO formulas_fts (rowid, content, context)
+                VALUES (?, ?, ?)
+            ''', (cursor.lastrowid, formula.get('content', ''), formula.get('context', '')))
     
-    def _build_terms_index(self, cursor: sqlite3.Cursor, book_id: str, content: ExtractedContent) -> None:
-        """Build and update TF-IDF scores for terms."""
-        # Get total number of documents
-        cursor.execute('SELECT COUNT(DISTINCT book_id) FROM terms')
-        total_docs = cursor.fetchone()[0]
+    def _update_document_frequency(self, cursor: sqlite3.Cursor, book_id: str) -> None:
+        """Increment document frequencies for every distinct term of a newly indexed book."""
+        cursor.execute('''
+            INSERT INTO document_frequency (term, doc_count)
+            SELECT DISTINCT term, 1 FROM terms WHERE book_id = ?
+            ON CONFLICT(term) DO UPDATE SET doc_count = doc_count + 1
+        ''', (book_id,))
+    
+    def _delete_book(self, cursor: sqlite3.Cursor, book_id: str) -> None:
+        """Delete a book's rows and decrement document frequencies of its terms."""
+        cursor.execute('''
+            UPDATE document_frequency SET doc_count = doc_count - 1
+            WHERE term IN (SELECT DISTINCT term FROM terms WHERE book_id = ?)
+        ''', (book_id,))
+        cursor.execute('DELETE FROM document_frequency WHERE doc_count <= 0')
+        
+        if self.fts_enabled:
+            # External-content FTS rows must be removed with the original values
+            cursor.execute('''
+                INSERT INTO chapters_fts (chapters_fts, rowid, title, content)
+                SELECT 'delete', id, title, content FROM chapters WHERE book_id = ?
+            ''', (book_id,))
+            cursor.execute('''
+                INSERT INTO formulas_fts (formulas_fts, rowid, content, context)
+                SELECT 'delete', id, content, context FROM formulas WHERE book_id = ?
+            ''', (book_id,))
+        
+        cursor.execute('DELETE FROM terms WHERE book_id = ?', (book_id,))
+        cursor.execute('DELETE FROM chapters WHERE book_id = ?', (book_id,))
+        cursor.execute('DELETE FROM formulas WHERE book_id = ?', (book_id,))
+        cursor.execute('DELETE FROM books WHERE id = ?', (book_id,))
+    
+    def _record_source(self, cursor: sqlite3.Cursor, content: ExtractedContent) -> None:
+        """
+        Record the source fingerprint carried in content.metadata['source_fingerprint'].
         
-        if total_docs == 0:
+        If the source previously produced a different book, that book is
+        removed unless another source still references it.
+        """
+        fingerprint = (content.metadata or {}).get('source_fingerprint')
+        if not fingerprint:
             return
         
-        # Update TF-IDF scores for all terms in this book
-        cursor.execute('SELECT DISTINCT term FROM terms WHERE book_id = ?', (book_id,))
-        book_terms = [row[0] for row in cursor.fetchall()]
+        cursor.execute('SELECT book_id FROM sources WHERE source_path = ?', (content.source_path,))
+        row = cursor.fetchone()
         
-        for term in book_terms:
-            # Calculate IDF
-            cursor.execute('SELECT COUNT(DISTINCT book_id) FROM terms WHERE term = ?', (term,))
-            docs_with_term = cursor.fetchone()[0]
-            
-            if docs_with_term > 0:
-                idf = math.log(total_docs / docs_with_term)
-                
-                # Update TF-IDF scores
-                cursor.execute('''
-                    UPDATE terms 
-                    SET tf_idf = (frequency * ?) 
-                    WHERE term = ? AND book_id = ?
-                ''', (idf, term, book_id))
+        cursor.execute('''
+            INSERT OR REPLACE INTO sources (source_path, book_id, fingerprint, indexed_at)
+            VALUES (?, ?, ?, ?)
+        ''', (content.source_path, content.content_hash, fingerprint, time.time()))
+        
+        if row and row[0] != content.content_hash:
+            self._delete_book_if_unreferenced(cursor, row[0])
+    
+    def _delete_book_if_unreferenced(self, cursor: sqlite3.Cursor, book_id: str) -> None:
+        """Delete a book unless a recorded source still points at it."""
+        cursor.execute('SELECT COUNT(*) FROM sources WHERE book_id = ?', (book_id,))
+        if cursor.fetchone()[0] == 0:
+            self._delete_book(cursor, book_id)
+    
+    @staticmethod
+    def _book_exists(cursor: sqlite3.Cursor, book_id: str) -> bool:
+        """Check whether a book is already indexed."""
+        cursor.execute('SELECT 1 FROM books WHERE id = ?', (book_id,))
+        return cursor.fetchone() is not None
     
     def _search_text(self, conn: sqlite3.Connection, query: str, max_results: int) -> List[SearchResult]:
         """Search text content using TF-IDF scoring."""
@@ -441,18 +1017,28 @@ class SearchIndexer:
         if not query_terms:
             return []
         
+        # Smoothed IDF, log(1 + N / df), so single-book indexes still rank by TF
+        cursor.execute('SELECT COUNT(*) FROM books')
+        total_docs = cursor.fetchone()[0]
+        conn.create_function(
+            'idf', 1,
+            lambda doc_count: math.log(1 + total_docs / doc_count) if doc_count else 0.0,
+            deterministic=True
+        )
+        
         results = []
         
         # Search for each term
         for term in query_terms:
             cursor.execute('''
                 SELECT b.id, b.title, c.chapter_number, c.title, c.content, 
-                       t.tf_idf, b.source_path, c.page_number
+                       t.tf_idf * idf(d.doc_count) AS score, b.source_path, c.page_number
                 FROM terms t
+                JOIN document_frequency d ON d.term = t.term
                 JOIN books b ON t.book_id = b.id
                 JOIN chapters c ON t.chapter_id = c.id
                 WHERE t.term LIKE ?
-                ORDER BY t.tf_idf DESC
+                ORDER BY score DESC
                 LIMIT ?
             ''', (f"%{term}%", max_results))
             
@@ -507,6 +1093,118 @@ class SearchIndexer:
         
         return results
     
+    def _search_text_fts(self, conn: sqlite3.Connection, query: str, max_results: int) -> List[SearchResult]:
+        """Search chapter text with FTS5 using BM25 ranking."""
+        match_query = self._build_fts_query(query)
+        if not match_query:
+            return []
+        
+        cursor = conn.cursor()
+        
+        # bm25() returns lower-is-better scores; chapter titles weigh more than body text
+        cursor.execute('''
+            SELECT b.id, b.title, c.chapter_number, c.title,
+                   snippet(chapters_fts, 1, ?, ?, '...', ?),
+                   bm25(chapters_fts, 2.0, 1.0) AS rank,
+                   b.source_path, c.page_number
+            FROM chapters_fts
+            JOIN chapters c ON c.id = chapters_fts.rowid
+            JOIN books b ON b.id = c.book_id
+            WHERE chapters_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+        ''', (self.FTS_HIGHLIGHT_START, self.FTS_HIGHLIGHT_END, self.FTS_SNIPPET_TOKENS,
+              match_query, max_results))
+        
+        results = []
+        for row in cursor.fetchall():
+            book_id, book_title, chapter_num, chapter_title, snippet, rank, source_path, page_num = row
+            
+            result = SearchResult(
+                book_id=book_id,
+                book_title=book_title,
+                chapter_number=chapter_num,
+                chapter_title=chapter_title,
+                content_snippet=snippet,
+                relevance_score=-rank,
+                match_type='text',
+                source_path=source_path,
+                page_number=page_num
+            )
+            results.append(result)
+        
+        return results
+    
+    def _search_formulas_fts(self, conn: sqlite3.Connection, query: str, max_results: int) -> List[SearchResult]:
+        """Search formulas and their surrounding context with FTS5."""
+        match_query = self._build_fts_query(query)
+        if not match_query:
+            return []
+        
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT b.id, b.title, f.content,
+                   snippet(formulas_fts, 1, ?, ?, '...', ?),
+                   bm25(formulas_fts) AS rank,
+                   b.source_path
+            FROM formulas_fts
+            JOIN formulas f ON f.id = formulas_fts.rowid
+            JOIN books b ON b.id = f.book_id
+            WHERE formulas_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+        ''', (self.FTS_HIGHLIGHT_START, self.FTS_HIGHLIGHT_END, self.FTS_SNIPPET_TOKENS,
+              match_query, max_results))
+        
+        results = []
+        for row in cursor.fetchall():
+            book_id, book_title, formula_content, context_snippet, rank, source_path = row
+            
+            snippet = f"Formula: {formula_content[:200]}"
+            if context_snippet:
+                snippet += f" ({context_snippet})"
+            
+            result = SearchResult(
+                book_id=book_id,
+                book_title=book_title,
+                chapter_number="",
+                chapter_title="Mathematical Formula",
+                content_snippet=snippet,
+                relevance_score=-rank,
+                match_type='formula',
+                source_path=source_path
+            )
+            results.append(result)
+        
+        return results
+    
+    def _build_fts_query(self, query: str) -> str:
+        """
+        Convert a user query into an FTS5 MATCH expression.
+        
+        Supports quoted phrases ("newton's second law") and prefix terms
+        (therm*). Remaining words are combined with implicit AND; every
+        token is quoted so user input cannot inject FTS5 operators.
+        """
+        clauses = []
+        
+        for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query):
+            if phrase:
+                words = re.findall(r'\w+', phrase.lower())
+                if words:
+                    clauses.append('"' + ' '.join(words) + '"')
+                continue
+            
+            is_prefix = word.endswith('*')
+            for token in re.findall(r'\w+', word.lower()):
+                if is_prefix:
+                    clauses.append(f'"{token}"*')
+                elif token not in self.stopwords:
+                    clauses.append(f'"{token}"')
+        
+        return ' '.join(clauses)
+    
     def _search_titles(self, conn: sqlite3.Connection, query: str, max_results: int) -> List[SearchResult]:
         """Search book and chapter titles."""
         cursor = conn.cursor()
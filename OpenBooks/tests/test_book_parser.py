@@ -0,0 +1,184 @@
+"""
+Unit tests for core.book_parser module
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import os
+import time
+import shutil
+from pathlib import Path
+
+from core.book_parser import OpenStaxBookParser
+
+
+COLLECTION_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<col:collection xmlns="http://cnx.rice.edu/collxml" xmlns:col="http://cnx.rice.edu/collxml" xmlns:md="http://cnx.rice.edu/mdml">
+  <col:metadata>
+    <md:title>Test Physics</md:title>
+    <md:language>en</md:language>
+    <md:uuid>1234</md:uuid>
+    <md:slug>test-physics</md:slug>
+  </col:metadata>
+  <col:content>
+    <col:subcollection>
+      <md:title>Kinematics</md:title>
+      <col:content>
+        <col:module document="m0001"/>
+        <col:module document="m0002"/>
+      </col:content>
+    </col:subcollection>
+    <col:subcollection>
+      <md:title>Dynamics</md:title>
+      <col:content>
+        <col:module document="m0003"/>
+      </col:content>
+    </col:subcollection>
+  </col:content>
+</col:collection>
+"""
+
+MODULE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<document xmlns:md="http://cnx.rice.edu/mdml">
+  <title>Document {title}</title>
+  <metadata>
+    <md:title>{title}</md:title>
+  </metadata>
+  <content><para>Body text</para></content>
+</document>
+"""
+
+
+class TestOpenStaxBookParser(unittest.TestCase):
+    """Test cases for OpenStaxBookParser"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = Path(self.temp_dir) / "repo"
+        (self.repo / "collections").mkdir(parents=True)
+        self.collection_path = self.repo / "collections" / "physics.collection.xml"
+        self.collection_path.write_text(COLLECTION_XML, encoding='utf-8')
+        for index, title in enumerate(["Motion", "Vectors", "Forces"], 1):
+            self.write_module(f"m000{index}", MODULE_XML.format(title=title))
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        OpenStaxBookParser.clear_memory_cache()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        OpenStaxBookParser.clear_memory_cache()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def write_module(self, module_id, text):
+        """Write a module's index.cnxml"""
+        module_dir = self.repo / "modules" / module_id
+        module_dir.mkdir(parents=True, exist_ok=True)
+        (module_dir / "index.cnxml").write_text(text, encoding='utf-8')
+
+    def test_parse_book_structure(self):
+        """Test chapters and module titles are read from the collection"""
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir)
+
+        book = parser.parse_book_structure(self.collection_path)
+
+        self.assertEqual(book.slug, "test-physics")
+        self.assertEqual([c.title for c in book.chapters], ["Kinematics", "Dynamics"])
+        self.assertEqual([m.title for m in book.chapters[0].modules], ["Motion", "Vectors"])
+        self.assertEqual(book.chapters[1].modules[0].content_path,
+                         self.repo / "modules" / "m0003" / "index.cnxml")
+
+    def test_module_title_stops_at_first_metadata_title(self):
+        """Test the title reader does not need the rest of the document"""
+        parser = OpenStaxBookParser(use_cache=False)
+        self.write_module("m0004", MODULE_XML.format(title="Energy").replace("</document>", "<broken>"))
+        self.write_module("m0005", "<document><title>Only Title</title><content/></document>")
+
+        self.assertEqual(parser.get_module_title(self.repo / "modules" / "m0004" / "index.cnxml"), "Energy")
+        self.assertEqual(parser.get_module_title(self.repo / "modules" / "m0005" / "index.cnxml"), "Only Title")
+        self.assertIsNone(parser.get_module_title(self.repo / "modules" / "missing" / "index.cnxml"))
+
+    def test_structure_reused_from_disk_cache(self):
+        """Test a new parser process reads the cached structure instead of the modules"""
+        first = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+        OpenStaxBookParser.clear_memory_cache()
+
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir)
+        with patch.object(parser, 'get_module_title') as get_title:
+            second = parser.parse_book_structure(self.collection_path)
+
+        get_title.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(len(list(self.cache_dir.glob("*.json"))), 1)
+
+    def test_structure_reused_from_memory(self):
+        """Test reopening a book in the same process skips the disk cache too"""
+        first = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir)
+        with patch.object(parser, 'load_cached_structure') as load:
+            second = parser.parse_book_structure(self.collection_path)
+
+        load.assert_not_called()
+        self.assertIs(second, first)
+
+    def test_repository_change_invalidates_cache(self):
+        """Test editing a module rebuilds the cached structure"""
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir)
+        parser.parse_book_structure(self.collection_path)
+
+        module_path = self.repo / "modules" / "m0002" / "index.cnxml"
+        module_path.write_text(MODULE_XML.format(title="Vector Algebra"), encoding='utf-8')
+        future = time.time() + 10
+        os.utime(module_path, (future, future))
+
+        book = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+
+        self.assertEqual(book.chapters[0].modules[1].title, "Vector Algebra")
+
+    def write_git_ref(self, commit):
+        """Point the repository's checked-out branch at a commit"""
+        refs_dir = self.repo / ".git" / "refs" / "heads"
+        refs_dir.mkdir(parents=True, exist_ok=True)
+        (self.repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding='utf-8')
+        (refs_dir / "main").write_text(f"{commit}\n", encoding='utf-8')
+
+    def test_memory_hit_skips_repository_fingerprint(self):
+        """Test reopening an unchanged git checkout only stats the collection and refs"""
+        self.write_git_ref("a" * 40)
+        first = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+
+        with patch('core.book_parser.compute_source_fingerprint') as fingerprint:
+            second = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+
+        fingerprint.assert_not_called()
+        self.assertIs(second, first)
+
+    def test_git_ref_change_invalidates_memory_cache(self):
+        """Test moving the checked-out branch re-checks the full fingerprint"""
+        self.write_git_ref("a" * 40)
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir)
+        parser.parse_book_structure(self.collection_path)
+
+        self.write_module("m0002", MODULE_XML.format(title="Vector Algebra"))
+        self.write_git_ref("b" * 40)
+        future = time.time() + 10
+        os.utime(self.repo / ".git" / "refs" / "heads" / "main", (future, future))
+        os.utime(self.repo / "modules" / "m0002" / "index.cnxml", (future, future))
+
+        book = OpenStaxBookParser(cache_dir=self.cache_dir).parse_book_structure(self.collection_path)
+
+        self.assertEqual(book.chapters[0].modules[1].title, "Vector Algebra")
+
+    def test_cache_disabled(self):
+        """Test use_cache=False always parses and writes nothing"""
+        parser = OpenStaxBookParser(cache_dir=self.cache_dir, use_cache=False)
+
+        self.assertIsNot(parser.parse_book_structure(self.collection_path),
+                         parser.parse_book_structure(self.collection_path))
+        self.assertFalse(self.cache_dir.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
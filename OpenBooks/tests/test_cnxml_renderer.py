@@ -0,0 +1,220 @@
+"""
+Unit tests for core.cnxml_renderer module
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import os
+import shutil
+from pathlib import Path
+
+from core.cnxml_renderer import CNXMLRenderer, MediaIndex, RenderCache
+
+
+FIGURE_CNXML = """<?xml version="1.0" encoding="UTF-8"?>
+<document xmlns="http://cnx.rice.edu/cnxml" xmlns:md="http://cnx.rice.edu/mdml">
+  <metadata><md:title>Optics</md:title></metadata>
+  <content>
+    <para>Light bends.</para>
+    {figures}
+  </content>
+</document>
+"""
+
+
+def figure_xml(filename):
+    """Build a figure element referencing a media file"""
+    return (f'<figure><media alt="{filename}"><image src="../../media/{filename}"/></media>'
+            f'<caption>Caption for {filename}</caption></figure>')
+
+
+class TestMediaIndex(unittest.TestCase):
+    """Test cases for MediaIndex and image resolution"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.books = Path(self.temp_dir) / "Books"
+        self.repo = self.books / "english" / "Physics" / "osbooks-physics"
+        self.other_repo = self.books / "english" / "Biology" / "osbooks-biology"
+        for repo in (self.repo, self.other_repo):
+            (repo / "media").mkdir(parents=True)
+            (repo / "modules" / "m0001").mkdir(parents=True)
+        for index in range(20):
+            (self.repo / "media" / f"Figure_{index}.jpg").write_bytes(b"jpg")
+        (self.other_repo / "media" / "Cell.png").write_bytes(b"png")
+        (self.repo / "modules" / "m0001" / "media").mkdir()
+        (self.repo / "modules" / "m0001" / "media" / "Nested.png").write_bytes(b"png")
+        CNXMLRenderer.media_index.invalidate()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        CNXMLRenderer.media_index.invalidate()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_lookup_indexes_media_directories(self):
+        """Test files in any media directory under the root are found"""
+        index = MediaIndex()
+
+        self.assertEqual(index.lookup("Figure_3.jpg", self.repo), (self.repo / "media" / "Figure_3.jpg").resolve())
+        self.assertEqual(index.lookup("Nested.png", self.repo).name, "Nested.png")
+        self.assertIsNone(index.lookup("Cell.png", self.repo))
+        self.assertIsNotNone(index.lookup("Cell.png", self.books))
+
+    def test_chapter_render_walks_once(self):
+        """Test rendering many figures builds each index once"""
+        renderer = CNXMLRenderer(use_cache=False)
+        figures = "".join(figure_xml(f"Figure_{index}.jpg") for index in range(20))
+        cnxml = FIGURE_CNXML.format(figures=figures + figure_xml("Cell.png"))
+
+        with patch.object(MediaIndex, '_build_index', autospec=True,
+                          side_effect=MediaIndex._build_index) as build, \
+                patch('core.cnxml_renderer.Path.cwd', return_value=self.books):
+            # base_path without a top-level media directory forces index lookups
+            html = renderer.cnxml_to_html(cnxml, self.repo / "modules")
+            renderer.cnxml_to_html(cnxml, self.repo / "modules")
+
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(html['content'].count('data-image-path='), 21)
+
+    def test_base_path_media_resolved_directly(self):
+        """Test the repository's own media directory needs no index"""
+        renderer = CNXMLRenderer()
+
+        with patch.object(MediaIndex, 'lookup') as lookup:
+            path = renderer.resolve_image_path("../../media/Figure_1.jpg", self.repo)
+
+        lookup.assert_not_called()
+        self.assertEqual(path, self.repo / "media" / "Figure_1.jpg")
+
+    def test_invalidate_after_repository_update(self):
+        """Test invalidating a repository drops its index and enclosing ones"""
+        index = MediaIndex()
+        self.assertIsNone(index.lookup("New.png", self.repo))
+        self.assertIsNone(index.lookup("New.png", self.books))
+        self.assertIsNone(index.lookup("New.png", self.other_repo))
+        (self.repo / "media" / "New.png").write_bytes(b"png")
+
+        index.invalidate(self.repo)
+
+        self.assertIsNotNone(index.lookup("New.png", self.repo))
+        self.assertIsNotNone(index.lookup("New.png", self.books))
+        self.assertIn(str(self.other_repo.resolve()), index._indexes)
+
+
+class TestRenderCache(unittest.TestCase):
+    """Test cases for the rendered-module cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = Path(self.temp_dir) / "rendered"
+        self.repo = Path(self.temp_dir) / "repo"
+        (self.repo / "media").mkdir(parents=True)
+        (self.repo / "media" / "Lens.jpg").write_bytes(b"jpg")
+        self.cnxml = FIGURE_CNXML.format(figures=figure_xml("Lens.jpg"))
+        CNXMLRenderer.media_index.invalidate()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        CNXMLRenderer.media_index.invalidate()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_repeat_render_served_from_memory(self):
+        """Test re-rendering unchanged CNXML does not parse it again"""
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+        first = renderer.cnxml_to_html(self.cnxml, self.repo)
+
+        with patch.object(renderer, 'parse_cnxml') as parse:
+            second = renderer.cnxml_to_html(self.cnxml, self.repo)
+
+        parse.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(first['title'], "Optics")
+        self.assertEqual(first['raw_content'], self.cnxml)
+        self.assertEqual(first['images'], [{'path': str(self.repo / "media" / "Lens.jpg"), 'alt': "Figure"}])
+        self.assertEqual(renderer.render_cache.stats['memory_hits'], 1)
+
+    def test_disk_tier_survives_new_cache(self):
+        """Test a fresh cache instance reads renders from disk"""
+        CNXMLRenderer(render_cache=RenderCache(self.cache_dir)).cnxml_to_markdown(self.cnxml, self.repo)
+
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+        with patch.object(renderer, 'parse_cnxml') as parse:
+            result = renderer.cnxml_to_markdown(self.cnxml, self.repo)
+
+        parse.assert_not_called()
+        self.assertIn("Light bends.", result['content'])
+        self.assertEqual(renderer.render_cache.stats['disk_hits'], 1)
+
+    def test_key_covers_content_format_and_version(self):
+        """Test changed CNXML, output format or renderer version miss the cache"""
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+        key = renderer.get_render_key(self.cnxml, 'html', self.repo)
+
+        self.assertNotEqual(key, renderer.get_render_key(self.cnxml + " ", 'html', self.repo))
+        self.assertNotEqual(key, renderer.get_render_key(self.cnxml, 'markdown', self.repo))
+        self.assertNotEqual(key, renderer.get_render_key(self.cnxml, 'html', None))
+        with patch.object(CNXMLRenderer, 'RENDERER_VERSION', str(int(CNXMLRenderer.RENDERER_VERSION) + 1)):
+            self.assertNotEqual(key, renderer.get_render_key(self.cnxml, 'html', self.repo))
+
+    def test_memory_tier_is_bounded(self):
+        """Test the LRU keeps at most max_memory_entries renders"""
+        cache = RenderCache(self.cache_dir, max_memory_entries=2)
+        for index in range(3):
+            cache.put(f"{index:064d}", {'title': str(index)})
+
+        self.assertEqual(list(cache._memory), [f"{1:064d}", f"{2:064d}"])
+        self.assertEqual(cache.get(f"{0:064d}"), {'title': "0"})
+        self.assertEqual(cache.stats['disk_hits'], 1)
+
+    def test_failed_render_not_cached(self):
+        """Test unparseable CNXML is retried rather than cached"""
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+
+        self.assertEqual(renderer.cnxml_to_html("<document>", self.repo)['title'], "Error")
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_render_with_missing_media_not_cached(self):
+        """Test a figure whose media is missing is resolved once the media arrives"""
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+        cnxml = FIGURE_CNXML.format(figures=figure_xml("Prism.jpg"))
+
+        with patch('core.cnxml_renderer.Path.cwd', return_value=self.repo):
+            self.assertIn("Path: media/media/Prism.jpg", renderer.cnxml_to_markdown(cnxml, self.repo)['content'])
+            self.assertFalse(self.cache_dir.exists())
+
+            (self.repo / "media" / "Prism.jpg").write_bytes(b"jpg")
+            CNXMLRenderer.media_index.invalidate(self.repo)
+            html = renderer.cnxml_to_html(cnxml, self.repo)
+
+        self.assertEqual(html['images'], [{'path': str(self.repo / "media" / "Prism.jpg"), 'alt': "Figure"}])
+
+    def test_prerender_collection(self):
+        """Test pre-rendering fills the cache for every module once"""
+        (self.repo / "collections").mkdir()
+        (self.repo / "collections" / "optics.collection.xml").write_text(
+            '<col:collection xmlns:col="http://cnx.rice.edu/collxml" xmlns:md="http://cnx.rice.edu/mdml">'
+            '<col:content><col:subcollection><md:title>Light</md:title><col:content>'
+            '<col:module document="m0001"/><col:module document="m0002"/>'
+            '</col:content></col:subcollection></col:content></col:collection>', encoding='utf-8')
+        for module_id in ("m0001", "m0002"):
+            (self.repo / "modules" / module_id).mkdir(parents=True)
+            (self.repo / "modules" / module_id / "index.cnxml").write_text(self.cnxml.replace("Optics", module_id))
+        renderer = CNXMLRenderer(render_cache=RenderCache(self.cache_dir))
+
+        with patch('core.book_parser.DEFAULT_STRUCTURE_CACHE_DIR', Path(self.temp_dir) / "structure"):
+            self.assertEqual(renderer.prerender_collection(self.repo), {'rendered': 2, 'cached': 0, 'failed': 0})
+            self.assertEqual(renderer.prerender_collection(self.repo), {'rendered': 0, 'cached': 2, 'failed': 0})
+
+        with patch.object(renderer, 'parse_cnxml') as parse:
+            content = (self.repo / "modules" / "m0002" / "index.cnxml").read_text()
+            self.assertEqual(renderer.cnxml_to_html(content, self.repo)['title'], "m0002")
+        parse.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for core.cycle_breaker module
+"""
+
+import unittest
+import random
+import time
+from unittest.mock import patch
+
+import networkx as nx
+
+from core.cycle_breaker import break_cycles
+from core.curriculum_synthesizer import CurriculumSynthesizer
+from core.natural_order_optimizer import NaturalOrderOptimizer
+
+
+class TestBreakCycles(unittest.TestCase):
+    """Test cases for break_cycles"""
+
+    def test_acyclic_graph_unchanged(self):
+        """Test a DAG keeps every edge"""
+        graph = nx.DiGraph([("a", "b"), ("b", "c"), ("a", "c")])
+
+        report = break_cycles(graph)
+
+        self.assertEqual(report.removed_edges, [])
+        self.assertEqual(report.cyclic_components, 0)
+        self.assertEqual(graph.number_of_edges(), 3)
+
+    def test_lowest_weight_edge_removed(self):
+        """Test the weakest edge of a cycle is the one dropped"""
+        graph = nx.DiGraph()
+        graph.add_edge("vectors", "kinematics", weight=0.9)
+        graph.add_edge("kinematics", "dynamics", weight=0.8)
+        graph.add_edge("dynamics", "vectors", weight=0.2)
+        graph.add_edge("dynamics", "energy", weight=0.7)
+
+        report = break_cycles(graph)
+
+        self.assertEqual(report.removed_edges, [("dynamics", "vectors", 0.2)])
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertEqual(report.to_dict()['removed_count'], 1)
+        self.assertAlmostEqual(report.to_dict()['removed_weight'], 0.2)
+
+    def test_self_loops_and_default_weight(self):
+        """Test self-loops are removed and unweighted edges use the default"""
+        graph = nx.DiGraph([("a", "a"), ("a", "b"), ("b", "a")])
+
+        report = break_cycles(graph, default_weight=0.5)
+
+        self.assertIn(("a", "a", 0.5), report.removed_edges)
+        self.assertEqual(len(report.removed_edges), 2)
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+
+    def test_removed_set_is_minimal(self):
+        """Test every removed edge would close a cycle if restored"""
+        rng = random.Random(3)
+        graph = nx.DiGraph()
+        for _ in range(400):
+            source, target = rng.randrange(60), rng.randrange(60)
+            if source != target:
+                graph.add_edge(source, target, weight=rng.random())
+
+        report = break_cycles(graph)
+
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertGreater(report.cyclic_components, 0)
+        for source, target, _ in report.removed_edges:
+            self.assertTrue(nx.has_path(graph, target, source))
+
+    def test_dense_graph_finishes_quickly(self):
+        """Test a complete digraph, with astronomically many cycles, is handled fast"""
+        graph = nx.complete_graph(80, create_using=nx.DiGraph)
+
+        start = time.perf_counter()
+        report = break_cycles(graph)
+
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertEqual(len(report.removed_edges), 80 * 79 // 2)
+
+    def test_restoration_budget_caps_work(self):
+        """Test an exhausted restoration budget still leaves a DAG and reports unchecked edges"""
+        rng = random.Random(5)
+        graph = nx.gnm_random_graph(200, 4000, seed=5, directed=True)
+        for source, target in graph.edges:
+            graph[source][target]['weight'] = rng.random()
+        original_edges = graph.number_of_edges()
+
+        with patch('core.cycle_breaker.RESTORE_EDGE_BUDGET', 1000):
+            report = break_cycles(graph)
+
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertGreater(report.unchecked_edges, 0)
+        self.assertEqual(report.to_dict()['unchecked_edges'], report.unchecked_edges)
+        self.assertEqual(graph.number_of_edges() + len(report.removed_edges), original_edges)
+
+
+class TestCycleRemovalCallers(unittest.TestCase):
+    """Test cases for the curriculum builders' cycle removal"""
+
+    def test_natural_order_optimizer_records_report(self):
+        """Test removed edges are recorded on the dependency graph"""
+        graph = nx.DiGraph()
+        graph.add_edge("s0", "s1", weight=0.9)
+        graph.add_edge("s1", "s0")
+
+        graph = NaturalOrderOptimizer()._remove_cycles_preserving_structure(graph)
+
+        self.assertEqual(list(graph.edges), [("s0", "s1")])
+        self.assertEqual(graph.graph['cycle_breaking']['removed_edges'],
+                         [{'source': "s1", 'target': "s0", 'weight': 0.5}])
+
+    def test_curriculum_synthesizer_returns_dag(self):
+        """Test the synthesizer's prerequisite graph is made acyclic"""
+        graph = nx.complete_graph(30, create_using=nx.DiGraph)
+        nx.set_edge_attributes(graph, "prerequisite", "relationship_type")
+
+        graph = CurriculumSynthesizer()._remove_cycles(graph)
+
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertEqual(graph.graph['cycle_breaking']['removed_count'], 30 * 29 // 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for core.natural_order_optimizer module
+"""
+
+import unittest
+import random
+import time
+
+from core.natural_order_optimizer import NaturalOrderOptimizer, SubtopicIndex
+from core.data_models import SubtopicEntry, EducationalLevel, BloomLevel
+
+
+def make_subtopic(index, title, prerequisites=None, level=EducationalLevel.UG_INTRO):
+    """Create a subtopic with only the fields graph building uses"""
+    return SubtopicEntry(
+        id=f"s{index}", discipline="Physics", category="Mechanics", subtopic=title,
+        level=level, bloom=BloomLevel.UNDERSTAND, standards_links=[],
+        prerequisites=prerequisites or [], learning_objectives=[], textbook_references=[],
+        question_types=[], hierarchy_level=3, parent_topics=[], child_topics=[],
+        discipline_specific_context="", discipline_specific_learning_objectives=[],
+        discipline_specific_applications=[], discipline_specific_prerequisites=[]
+    )
+
+
+class TestSubtopicIndex(unittest.TestCase):
+    """Test cases for SubtopicIndex"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = NaturalOrderOptimizer()
+        self.subtopics = [
+            make_subtopic(0, "Vectors and Scalars"),
+            make_subtopic(1, "Kinematics in One Dimension"),
+            make_subtopic(2, "Chapter 3: Kinematics"),
+            make_subtopic(3, "kinematics"),
+            make_subtopic(4, "Dynamics (Newton's Laws)"),
+            make_subtopic(5, "Energy"),
+        ]
+        self.index = SubtopicIndex(self.subtopics, self.optimizer._normalize_concept_name)
+
+    def test_matches_linear_scans(self):
+        """Test every lookup returns what scanning the list in order returns"""
+        queries = ["kinematics", "KINEMATICS", "Kinematics in One Dimension", "dimension", "vectors",
+                   "scalars\0kin", "s and s", "energy", "momentum", "", "dynamics", "newton's"]
+
+        for query in queries:
+            self.assertIs(self.index.find_by_name(query),
+                          self.optimizer._find_subtopic_by_name(query, self.subtopics), query)
+            self.assertIs(self.index.find_containing(query),
+                          self.optimizer._find_subtopic_with_concept(query, self.subtopics), query)
+            normalized = self.optimizer._normalize_concept_name(query)
+            self.assertIs(self.index.find_by_normalized_name(normalized),
+                          self.optimizer._find_subtopic_with_normalized_name(normalized, self.subtopics), query)
+
+    def test_exact_name_preferred_over_partial(self):
+        """Test an exact title beats an earlier partial match"""
+        self.assertIs(self.index.find_by_name("Kinematics"), self.subtopics[3])
+        self.assertIs(self.index.find_containing("kinematics"), self.subtopics[1])
+        self.assertIs(self.index.find_by_normalized_name("kinematics"), self.subtopics[2])
+
+    def test_empty_index(self):
+        """Test lookups on no subtopics find nothing"""
+        index = SubtopicIndex([], self.optimizer._normalize_concept_name)
+
+        self.assertIsNone(index.find_by_name("kinematics"))
+        self.assertIsNone(index.find_containing(""))
+
+
+class TestUnifiedCurriculumGraph(unittest.TestCase):
+    """Test cases for NaturalOrderOptimizer graph construction"""
+
+    def test_graph_edges(self):
+        """Test explicit, TOC-derived and knowledge-based edges are added"""
+        optimizer = NaturalOrderOptimizer()
+        subtopics = [
+            make_subtopic(0, "Vectors"),
+            make_subtopic(1, "Kinematics"),
+            make_subtopic(2, "Dynamics", prerequisites=["kinematics"]),
+            make_subtopic(3, "Work and Energy"),
+        ]
+        optimizer.toc_dependency_cache["Physics"] = {
+            "prerequisites": {"work_and_energy": [{"prerequisite": "dynamics", "strength": 0.8}]}
+        }
+
+        graph = optimizer._build_unified_curriculum_graph(subtopics, "Physics")
+
+        self.assertEqual(graph["s1"]["s2"]["type"], "explicit")
+        self.assertEqual(graph["s0"]["s2"]["type"], "knowledge_based")
+        self.assertEqual(graph["s2"]["s3"], {"weight": 0.8, "type": "toc_derived"})
+
+    def test_full_discipline_builds_quickly(self):
+        """Test a ~1000-subtopic discipline builds well under a second"""
+        optimizer = NaturalOrderOptimizer()
+        rng = random.Random(7)
+        words = ["kinematics", "dynamics", "vectors", "energy", "waves", "oscillations",
+                 "quantum", "fields", "calculus", "optics", "entropy", "momentum"]
+        subtopics = [
+            make_subtopic(index, f"{rng.choice(words).title()} {rng.choice(words)} part {index}",
+                          prerequisites=[f"{rng.choice(words)} part {rng.randrange(1000)}", rng.choice(words)])
+            for index in range(1000)
+        ]
+        optimizer.toc_dependency_cache["Physics"] = {"prerequisites": {
+            optimizer._normalize_concept_name(subtopic.subtopic): [
+                {"prerequisite": optimizer._normalize_concept_name(rng.choice(subtopics).subtopic), "strength": 0.5},
+                {"prerequisite": "unmatched_concept", "strength": 0.5}
+            ]
+            for subtopic in subtopics
+        }}
+        optimizer._remove_cycles_preserving_structure = lambda graph: graph
+
+        start = time.perf_counter()
+        graph = optimizer._build_unified_curriculum_graph(subtopics, "Physics")
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(graph.number_of_nodes(), 1000)
+        self.assertGreater(graph.number_of_edges(), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
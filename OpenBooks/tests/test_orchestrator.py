@@ -0,0 +1,90 @@
+"""
+Unit tests for the core.orchestrator search indexing pipeline
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import os
+from pathlib import Path
+import shutil
+
+from core.orchestrator import OpenBooksOrchestrator
+from core.config import OpenBooksConfig
+from core.terminal_ui import TerminalUI
+
+
+def make_html_repository(root, name, heading, text):
+    """Create a repository directory holding a single HTML book"""
+    repo_path = Path(root) / name
+    repo_path.mkdir()
+    (repo_path / 'index.html').write_text(
+        f"<html><head><title>{name.title()}</title></head>"
+        f"<body><h1>{heading}</h1><p>{text}</p></body></html>"
+    )
+    return repo_path
+
+
+class TestIndexingPipeline(unittest.TestCase):
+    """Test cases for run_indexing_pipeline"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = OpenBooksConfig()
+        self.config.search_index_dir = os.path.join(self.temp_dir, 'search_index')
+        self.config.max_processing_workers = 2
+        self.config.search_index_queue_size = 1
+        self.orchestrator = OpenBooksOrchestrator(self.config, TerminalUI(no_color=True))
+
+        self.repo_paths = [
+            make_html_repository(self.temp_dir, 'optics', 'Lenses', 'Refraction bends light through lenses.'),
+            make_html_repository(self.temp_dir, 'plasma', 'Ions', 'Plasma physics studies ionized gas.'),
+        ]
+        # No supported content, so extraction yields nothing
+        broken_path = Path(self.temp_dir) / 'broken'
+        broken_path.mkdir()
+        (broken_path / 'notes.bin').write_bytes(b'\x00\x01')
+        self.repo_paths.append(broken_path)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_pipeline_counts_indexed_and_failed_books(self):
+        """Test extracted repositories are indexed and failed extractions counted"""
+        results = self.orchestrator.run_indexing_pipeline(self.repo_paths)
+
+        self.assertEqual(results['books_indexed'], 2)
+        self.assertEqual(results['books_failed'], 1)
+        self.assertEqual(results['books_skipped'], 0)
+        self.assertGreater(results['timings']['total'], 0)
+        self.assertEqual(self.orchestrator.search_indexer.get_index_stats().total_books, 2)
+        self.assertEqual(len(self.orchestrator.search_indexer.search("refraction", search_type="text")), 1)
+
+    def test_pipeline_empty_input(self):
+        """Test an empty repository list skips the worker pool"""
+        results = self.orchestrator.run_indexing_pipeline([])
+
+        self.assertEqual(results['books_indexed'], 0)
+        self.assertEqual(results['books_failed'], 0)
+
+    def test_writer_failure_drains_queue_and_reraises(self):
+        """Test a failing bulk_index neither blocks extraction nor is swallowed"""
+        consumed = []
+
+        def failing_bulk_index(contents, **kwargs):
+            consumed.append(next(iter(contents)))
+            raise RuntimeError("disk full")
+
+        with patch.object(self.orchestrator.search_indexer, 'bulk_index', side_effect=failing_bulk_index):
+            with self.assertRaises(RuntimeError):
+                self.orchestrator.run_indexing_pipeline(self.repo_paths)
+
+        # The writer took one book, then drained the rest through the single-slot queue
+        self.assertEqual(len(consumed), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,319 @@
+"""
+Unit tests for core.pdf_processor module
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import tempfile
+import os
+import time
+import shutil
+import threading
+import hashlib
+from pathlib import Path
+
+import anthropic
+import httpx
+import PyPDF2
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+from core.pdf_processor import PDFProcessor, TokenBucketRateLimiter
+
+API_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+def api_status_error(status_code):
+    """Build the Anthropic SDK error raised for an HTTP status"""
+    response = httpx.Response(status_code, request=API_REQUEST)
+    return anthropic.APIStatusError(f"HTTP {status_code}", response=response, body=None)
+
+
+def write_blank_pdf(path, page_count):
+    """Write a PDF with blank pages for chunking tests"""
+    writer = PyPDF2.PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=612, height=792)
+    with open(path, 'wb') as f:
+        writer.write(f)
+
+
+def write_text_pdf(path, page_texts):
+    """Write a PDF with an embedded text layer; None entries become blank pages"""
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        if text:
+            page.insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=9)
+    doc.save(str(path))
+    doc.close()
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    """Test cases for TokenBucketRateLimiter"""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        """Test requests within the bucket are admitted immediately"""
+        limiter = TokenBucketRateLimiter(requests_per_minute=600, tokens_per_minute=10000)
+
+        waited = sum(limiter.acquire(1000) for _ in range(5))
+
+        self.assertEqual(waited, 0.0)
+
+    def test_request_limit_blocks(self):
+        """Test an empty request bucket makes callers wait"""
+        limiter = TokenBucketRateLimiter(requests_per_minute=1200)
+        for _ in range(1200):
+            limiter.acquire()
+
+        start = time.monotonic()
+        limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_token_limit_blocks(self):
+        """Test an exhausted token bucket makes callers wait"""
+        limiter = TokenBucketRateLimiter(requests_per_minute=1000, tokens_per_minute=60000)
+        limiter.acquire(60000)
+
+        waited = limiter.acquire(100)
+
+        self.assertGreater(waited, 0.0)
+
+    def test_oversized_request_is_admitted(self):
+        """Test a request larger than the token bucket cannot deadlock"""
+        limiter = TokenBucketRateLimiter(requests_per_minute=1000, tokens_per_minute=1000)
+
+        self.assertEqual(limiter.acquire(5000), 0.0)
+
+
+@patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+class TestPDFProcessor(unittest.TestCase):
+    """Test cases for PDFProcessor"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = Path(self.temp_dir) / "book.pdf"
+        write_blank_pdf(self.pdf_path, 10)
+        self.config = {
+            'cache_dir': os.path.join(self.temp_dir, 'cache'),
+            'max_pages_per_chunk': 2,
+            'max_concurrent_chunks': 4,
+            'requests_per_minute': 6000,
+            'retry_attempts': 3,
+            'retry_backoff_seconds': 0.0
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_concurrent_chunks_reassemble_in_order(self):
+        """Test out-of-order completion still yields page-ordered text"""
+        processor = PDFProcessor(self.config)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_chunk(chunk_bytes, metadata):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            # Later chunks finish first
+            time.sleep(0.02 * (5 - metadata['chunk_index']))
+            with lock:
+                active.pop()
+            return f"chunk-{metadata['chunk_index']}"
+
+        with patch.object(processor, 'process_pdf_chunk', side_effect=fake_chunk):
+            result = processor.process_pdf(self.pdf_path)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.processed_pages, 10)
+        positions = [result.full_text.index(f"chunk-{i}") for i in range(5)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertGreater(max(peak), 1)
+
+    def test_chunk_retry_with_backoff(self):
+        """Test transient chunk failures are retried"""
+        processor = PDFProcessor(self.config)
+        calls = Mock(side_effect=[api_status_error(529), anthropic.APITimeoutError(request=API_REQUEST), "text"])
+
+        with patch.object(processor, 'process_pdf_chunk', calls):
+            text = processor.process_pdf_chunk_with_retry(b"", {'chunk_index': 0})
+
+        self.assertEqual(text, "text")
+        self.assertEqual(calls.call_count, 3)
+        self.assertEqual(processor.stats['chunk_retries'], 2)
+
+    def test_permanent_chunk_errors_not_retried(self):
+        """Test authentication, bad request and malformed chunk errors fail immediately"""
+        processor = PDFProcessor(self.config)
+
+        for error in (api_status_error(401), api_status_error(400), ValueError("malformed chunk")):
+            calls = Mock(side_effect=error)
+            with patch.object(processor, 'process_pdf_chunk', calls):
+                with self.assertRaises(type(error)):
+                    processor.process_pdf_chunk_with_retry(b"", {'chunk_index': 0})
+            self.assertEqual(calls.call_count, 1)
+        self.assertEqual(processor.stats['chunk_retries'], 0)
+        self.assertTrue(PDFProcessor.is_transient_error(api_status_error(429)))
+
+    def test_failed_chunk_recorded(self):
+        """Test chunks failing every retry are marked unsuccessful"""
+        processor = PDFProcessor(self.config)
+
+        def fake_chunk(chunk_bytes, metadata):
+            if metadata['chunk_index'] == 2:
+                raise RuntimeError("bad chunk")
+            return f"chunk-{metadata['chunk_index']}"
+
+        with patch.object(processor, 'process_pdf_chunk', side_effect=fake_chunk):
+            result = processor.process_pdf(self.pdf_path)
+
+        self.assertEqual(result.processed_pages, 8)
+        failed = [c for c in result.chunks_metadata if not c['success']]
+        self.assertEqual([c['chunk_index'] for c in failed], [2])
+        self.assertIn("bad chunk", failed[0]['error'])
+
+    def test_partial_run_resumes_failed_chunks(self):
+        """Test a rerun only processes chunks that failed previously"""
+        processor = PDFProcessor(self.config)
+
+        def flaky_chunk(chunk_bytes, metadata):
+            if metadata['chunk_index'] == 3:
+                raise RuntimeError("interrupted")
+            return f"chunk-{metadata['chunk_index']}"
+
+        with patch.object(processor, 'process_pdf_chunk', side_effect=flaky_chunk):
+            processor.process_pdf(self.pdf_path)
+
+        calls = Mock(side_effect=lambda chunk_bytes, metadata: f"chunk-{metadata['chunk_index']}")
+        with patch.object(processor, 'process_pdf_chunk', calls):
+            result = processor.process_pdf(self.pdf_path)
+
+        self.assertEqual(calls.call_count, 1)
+        self.assertEqual(result.processed_pages, 10)
+        self.assertTrue(all(c['success'] for c in result.chunks_metadata))
+        cache_path = processor.get_cache_path(self.pdf_path, processor.get_pdf_hash(self.pdf_path))
+        self.assertTrue(cache_path.exists())
+
+    def test_force_reprocess_failed_chunks_only(self):
+        """Test failed_chunks_only reuses cached chunks under force_reprocess"""
+        processor = PDFProcessor(self.config)
+        first = Mock(side_effect=lambda chunk_bytes, metadata: f"chunk-{metadata['chunk_index']}")
+        with patch.object(processor, 'process_pdf_chunk', first):
+            processor.process_pdf(self.pdf_path)
+
+        partial = Mock(return_value="again")
+        with patch.object(processor, 'process_pdf_chunk', partial):
+            processor.process_pdf(self.pdf_path, force_reprocess=True, failed_chunks_only=True)
+        self.assertEqual(partial.call_count, 0)
+
+        full = Mock(return_value="again")
+        with patch.object(processor, 'process_pdf_chunk', full):
+            processor.process_pdf(self.pdf_path, force_reprocess=True)
+        self.assertEqual(full.call_count, 5)
+
+    def test_chunk_cache_key_includes_prompt_version(self):
+        """Test changing the prompt version invalidates cached chunks"""
+        processor = PDFProcessor(self.config)
+        metadata = {'start_page': 1, 'end_page': 2}
+        processor.save_chunk_to_cache("abc123", metadata, "old text")
+
+        self.assertEqual(processor.load_chunk_from_cache("abc123", metadata), "old text")
+        with patch.object(PDFProcessor, 'PROMPT_VERSION', "2"):
+            self.assertIsNone(processor.load_chunk_from_cache("abc123", metadata))
+
+    def test_streaming_hash_matches_whole_file_hash(self):
+        """Test block-wise hashing matches hashing the whole file"""
+        processor = PDFProcessor(self.config)
+        expected = hashlib.sha256(self.pdf_path.read_bytes()).hexdigest()
+
+        with patch.object(PDFProcessor, 'HASH_BLOCK_SIZE', 64):
+            self.assertEqual(processor.get_pdf_hash(self.pdf_path), expected)
+
+    def test_chunks_consumed_lazily(self):
+        """Test process_chunks keeps a bounded number of chunks in flight"""
+        processor = PDFProcessor(self.config)
+        produced = []
+        release = threading.Event()
+
+        def chunk_source():
+            for index in range(50):
+                produced.append(index)
+                yield b"", {'chunk_index': index, 'start_page': index + 1, 'end_page': index + 1}
+
+        def blocking_chunk(chunk_bytes, metadata):
+            release.wait(timeout=5)
+            return "text"
+
+        with patch.object(processor, 'process_pdf_chunk', side_effect=blocking_chunk):
+            results = processor.process_chunks(chunk_source())
+            threading.Timer(0.1, release.set).start()
+            first = next(results)
+            self.assertLessEqual(len(produced), processor.max_concurrent_chunks * 2 + 1)
+            remaining = list(results)
+
+        self.assertEqual(first[0]['chunk_index'], 0)
+        self.assertEqual(len(remaining), 49)
+
+    def test_assess_page_text(self):
+        """Test text-layer scoring of density, garbage and math glyphs"""
+        processor = PDFProcessor(self.config)
+        prose = "The cell membrane regulates transport of molecules. " * 10
+
+        self.assertTrue(processor.assess_page_text(prose)['use_local'])
+        self.assertFalse(processor.assess_page_text("Figure 3.1")['use_local'])
+        self.assertFalse(processor.assess_page_text(prose + "\ufffd" * 100)['use_local'])
+        self.assertFalse(processor.assess_page_text(prose + "∫∑√∂" * 20)['use_local'])
+
+    def test_fast_path_disabled_sends_all_pages(self):
+        """Test disabling the fast path skips triage"""
+        self.config['local_text_fast_path'] = False
+        processor = PDFProcessor(self.config)
+
+        self.assertIsNone(processor.triage_pages(self.pdf_path))
+
+    @unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+    def test_unreadable_text_layer_falls_back_to_api(self):
+        """Test a PDF PyMuPDF cannot read is sent to the API instead of failing"""
+        processor = PDFProcessor(self.config)
+        calls = Mock(side_effect=lambda chunk_bytes, metadata: f"api-{metadata['start_page']}")
+
+        with patch('fitz.open', side_effect=RuntimeError("cannot open broken document")):
+            self.assertIsNone(processor.triage_pages(self.pdf_path))
+            with patch.object(processor, 'process_pdf_chunk', calls):
+                result = processor.process_pdf(self.pdf_path)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.processed_pages, 10)
+        self.assertEqual(calls.call_count, 5)
+
+    @unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+    def test_text_layer_pages_processed_locally(self):
+        """Test only pages without a usable text layer reach the API"""
+        prose = "Energy is conserved in every closed system we observe. " * 8
+        write_text_pdf(self.pdf_path, [prose, prose, None, prose, None])
+        processor = PDFProcessor(self.config)
+        calls = Mock(side_effect=lambda chunk_bytes, metadata: f"api-{metadata['start_page']}")
+
+        with patch.object(processor, 'process_pdf_chunk', calls):
+            result = processor.process_pdf(self.pdf_path)
+
+        self.assertEqual(calls.call_count, 2)
+        self.assertEqual(result.processed_pages, 5)
+        self.assertEqual([c['source'] for c in result.chunks_metadata], ['local', 'api', 'local', 'api'])
+        self.assertLess(result.full_text.index("Energy"), result.full_text.index("api-3"))
+        self.assertLess(result.full_text.index("api-3"), result.full_text.index("api-5"))
+        self.assertEqual(processor.stats['local_pages'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
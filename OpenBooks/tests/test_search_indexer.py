@@ -7,14 +7,53 @@ from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import os
 import sqlite3
+import math
 from pathlib import Path
 import shutil
 
-from core.search_indexer import SearchIndexer, SearchResult, IndexStats
+from core.search_indexer import SearchIndexer, SearchResult, IndexStats, BulkIndexStats, compute_source_fingerprint
 from core.config import OpenBooksConfig
 from core.text_extractor import ExtractedContent
 
 
+def make_content(content_hash="fts123", title="Physics Textbook", chapters=None):
+    """Create extracted content for indexing"""
+    if chapters is None:
+        chapters = [
+            {
+                "number": "1",
+                "title": "Force and Motion",
+                "content": "Newton's second law relates net force to acceleration.",
+                "page_start": 1
+            },
+            {
+                "number": "2",
+                "title": "Heat",
+                "content": "Thermodynamics describes heat engines and entropy.",
+                "page_start": 20
+            }
+        ]
+    return ExtractedContent(
+        source_path="/books/physics.pdf",
+        format_type="pdf",
+        title=title,
+        authors=["Author"],
+        chapters=chapters,
+        raw_text="",
+        mathematical_notation=[
+            {
+                "content": "F = ma",
+                "type": "equation",
+                "context": "Newton's second law"
+            }
+        ],
+        images=[],
+        metadata={},
+        extraction_stats={},
+        content_hash=content_hash
+    )
+
+
 class TestSearchResult(unittest.TestCase):
     """Test cases for SearchResult dataclass"""
 
@@ -490,5 +529,375 @@ class TestSearchIndexer(unittest.TestCase):
             self.assertEqual(stored_content, "E = mc²")
 
 
+
+class TestDocumentFrequency(unittest.TestCase):
+    """Test cases for incremental document frequency maintenance"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = OpenBooksConfig()
+        self.config.search_index_dir = os.path.join(self.temp_dir, 'search_index')
+        self.indexer = SearchIndexer(self.config, engine='terms')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _doc_count(self, term):
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            row = conn.execute("SELECT doc_count FROM document_frequency WHERE term = ?", (term,)).fetchone()
+            return row[0] if row else 0
+
+    def test_document_frequency_on_insert(self):
+        """Test frequencies count books, not chapters"""
+        self.indexer.index_content(make_content("book1"))
+        self.indexer.index_content(make_content("book2"))
+
+        self.assertEqual(self._doc_count("thermodynamics"), 2)
+
+    def test_reindex_does_not_double_count(self):
+        """Test re-indexing a book replaces its rows"""
+        self.indexer.index_content(make_content("book1"))
+        self.indexer.index_content(make_content("book1"))
+
+        self.assertEqual(self._doc_count("entropy"), 1)
+        self.assertEqual(self.indexer.get_index_stats().total_chapters, 2)
+
+    def test_remove_book_decrements_frequency(self):
+        """Test removing a book updates frequencies"""
+        self.indexer.index_content(make_content("book1"))
+        self.indexer.index_content(make_content("book2"))
+
+        self.assertTrue(self.indexer.remove_book("book1"))
+
+        self.assertEqual(self._doc_count("entropy"), 1)
+        self.assertTrue(self.indexer.remove_book("book2"))
+        self.assertEqual(self._doc_count("entropy"), 0)
+        self.assertEqual(self.indexer.get_index_stats().total_books, 0)
+
+    def test_query_time_idf_favours_rare_terms(self):
+        """Test IDF is applied from current frequencies at query time"""
+        common = [{"number": "1", "title": "Waves", "content": "waves waves optics", "page_start": 1}]
+        rare = [{"number": "1", "title": "Waves", "content": "waves waves plasma", "page_start": 1}]
+        self.indexer.index_content(make_content("common1", chapters=common))
+        self.indexer.index_content(make_content("common2", chapters=common))
+        self.indexer.index_content(make_content("rare", chapters=rare))
+
+        plasma = self.indexer.search("plasma", search_type="text")
+        optics = self.indexer.search("optics", search_type="text")
+
+        self.assertEqual(len(plasma), 1)
+        self.assertGreater(plasma[0].relevance_score, optics[0].relevance_score)
+
+    def test_upgrade_converts_legacy_tf_idf(self):
+        """Test opening an index built before document_frequency rewrites tf_idf to plain TF"""
+        self.indexer.index_content(make_content("book1"))
+        self.indexer.index_content(make_content("book2", chapters=[
+            {"number": "1", "title": "Heat", "content": "Entropy entropy and plasma heat.", "page_start": 1}
+        ]))
+        query = "SELECT term, book_id, chapter_id, tf_idf FROM terms ORDER BY term, book_id, chapter_id"
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            expected = conn.execute(query).fetchall()
+            # Legacy layout: no frequency table, tf_idf = frequency * log(N / df)
+            conn.create_function("log", 1, math.log)
+            conn.execute('''
+                UPDATE terms SET tf_idf = frequency * log(2.0 / (
+                    SELECT COUNT(DISTINCT book_id) FROM terms AS t WHERE t.term = terms.term))
+            ''')
+            conn.execute("DROP TABLE document_frequency")
+
+        upgraded = SearchIndexer(self.config, engine='terms')
+
+        with sqlite3.connect(upgraded.db_path) as conn:
+            actual = conn.execute(query).fetchall()
+        self.assertEqual([row[:3] for row in actual], [row[:3] for row in expected])
+        for actual_row, expected_row in zip(actual, expected):
+            self.assertAlmostEqual(actual_row[3], expected_row[3])
+        self.assertEqual(self._doc_count("entropy"), 2)
+
+
+class TestBulkIndex(unittest.TestCase):
+    """Test cases for bulk indexing mode"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = OpenBooksConfig()
+        self.config.search_index_dir = os.path.join(self.temp_dir, 'search_index')
+        self.indexer = SearchIndexer(self.config, engine='terms')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_bulk_index_matches_single_indexing(self):
+        """Test bulk and per-book indexing produce the same rows"""
+        contents = (make_content(f"book{i}", title=f"Book {i}") for i in range(5))
+
+        stats = self.indexer.bulk_index(contents, batch_size=2)
+
+        self.assertIsInstance(stats, BulkIndexStats)
+        self.assertEqual(stats.books_indexed, 5)
+        self.assertEqual(stats.chapters, 10)
+        self.assertEqual(stats.formulas, 5)
+        self.assertGreater(stats.rows_per_second, 0)
+
+        single_config = OpenBooksConfig()
+        single_config.search_index_dir = os.path.join(self.temp_dir, 'single_index')
+        single = SearchIndexer(single_config, engine='terms')
+        for i in range(5):
+            single.index_content(make_content(f"book{i}", title=f"Book {i}"))
+
+        query = "SELECT term, doc_count FROM document_frequency ORDER BY term"
+        with sqlite3.connect(self.indexer.db_path) as bulk_conn, sqlite3.connect(single.db_path) as single_conn:
+            self.assertEqual(bulk_conn.execute(query).fetchall(), single_conn.execute(query).fetchall())
+            self.assertEqual(bulk_conn.execute("SELECT COUNT(*) FROM terms").fetchone(),
+                             single_conn.execute("SELECT COUNT(*) FROM terms").fetchone())
+
+    def test_bulk_index_recreates_secondary_indexes(self):
+        """Test secondary indexes exist after a bulk load"""
+        self.indexer.bulk_index([make_content("book1")])
+
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        self.assertTrue(set(SearchIndexer.SECONDARY_INDEXES).issubset(names))
+
+    def test_bulk_index_failure_restores_secondary_indexes(self):
+        """Test a load that fails part-way still leaves the secondary indexes in place"""
+        def failing_contents():
+            yield make_content("book1")
+            raise RuntimeError("extraction failed")
+
+        with self.assertRaises(RuntimeError):
+            self.indexer.bulk_index(failing_contents(), batch_size=1)
+
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        self.assertTrue(set(SearchIndexer.SECONDARY_INDEXES).issubset(names))
+        self.assertEqual(self.indexer.get_index_stats().total_books, 1)
+
+    def test_bulk_index_failed_book_leaves_no_rows(self):
+        """Test a book failing part-way keeps its indexed copy and adds no partial rows"""
+        self.indexer.index_content(make_content("book1"))
+
+        class FailingFormulas(list):
+            def __iter__(self):
+                yield {"content": "E = mc^2", "type": "equation", "context": "Energy"}
+                raise ValueError("malformed formula")
+
+        broken = make_content("book1", title="Broken Rewrite", chapters=[
+            {"number": "1", "title": "Plasma", "content": "Plasma physics studies ionized gas.", "page_start": 1}
+        ])
+        broken.mathematical_notation = FailingFormulas()
+
+        stats = self.indexer.bulk_index([broken, make_content("book2")])
+
+        self.assertEqual(stats.books_failed, 1)
+        self.assertEqual(stats.books_indexed, 1)
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            self.assertEqual(conn.execute("SELECT title FROM books WHERE id = 'book1'").fetchone(),
+                             ("Physics Textbook",))
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM terms WHERE term = 'plasma'").fetchone()[0], 0)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM formulas").fetchone()[0], 2)
+            mismatched = conn.execute('''
+                SELECT COUNT(*) FROM document_frequency d
+                WHERE d.doc_count != (SELECT COUNT(DISTINCT book_id) FROM terms t WHERE t.term = d.term)
+            ''').fetchone()[0]
+        self.assertEqual(mismatched, 0)
+        self.assertEqual(self.indexer.get_index_stats().total_books, 2)
+
+    def test_bulk_index_replaces_existing_books(self):
+        """Test bulk loading into a populated index replaces books"""
+        self.indexer.index_content(make_content("book1"))
+
+        stats = self.indexer.bulk_index([make_content("book1"), make_content("book1"), make_content("book2")])
+
+        self.assertEqual(stats.books_indexed, 2)
+        self.assertEqual(stats.books_skipped, 1)
+        index_stats = self.indexer.get_index_stats()
+        self.assertEqual(index_stats.total_books, 2)
+        self.assertEqual(index_stats.total_chapters, 4)
+        self.assertEqual(len(self.indexer.search("entropy", search_type="text")), 2)
+
+
+class TestIncrementalSources(unittest.TestCase):
+    """Test cases for source fingerprints used by incremental re-indexing"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = OpenBooksConfig()
+        self.config.search_index_dir = os.path.join(self.temp_dir, 'search_index')
+        self.indexer = SearchIndexer(self.config, engine='terms')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _sourced_content(self, content_hash, source_path, fingerprint, chapters=None):
+        content = make_content(content_hash, chapters=chapters)
+        content.source_path = source_path
+        content.metadata = {'source_fingerprint': fingerprint}
+        return content
+
+    def test_sources_recorded(self):
+        """Test fingerprints are stored with the indexed book"""
+        self.indexer.bulk_index([self._sourced_content("book1", "/books/repo1", "git:abc")])
+
+        sources = self.indexer.get_indexed_sources()
+        self.assertEqual(sources["/books/repo1"]["book_id"], "book1")
+        self.assertEqual(sources["/books/repo1"]["fingerprint"], "git:abc")
+
+    def test_changed_source_replaces_previous_book(self):
+        """Test a source whose content changed drops its old book"""
+        self.indexer.index_content(self._sourced_content("book1", "/books/repo1", "git:abc"))
+
+        changed = [{"number": "1", "title": "Optics", "content": "Lenses refract light.", "page_start": 1}]
+        stats = self.indexer.bulk_index([self._sourced_content("book2", "/books/repo1", "git:def", changed)],
+                                        skip_existing=True)
+
+        self.assertEqual(stats.books_indexed, 1)
+        self.assertEqual(self.indexer.get_index_stats().total_books, 1)
+        self.assertEqual(self.indexer.search("entropy", search_type="text"), [])
+        self.assertEqual(len(self.indexer.search("lenses", search_type="text")), 1)
+
+    def test_skip_existing_refreshes_fingerprint_only(self):
+        """Test unchanged content is not rewritten"""
+        self.indexer.bulk_index([self._sourced_content("book1", "/books/repo1", "git:abc")])
+
+        stats = self.indexer.bulk_index([self._sourced_content("book1", "/books/repo1", "git:def")],
+                                        skip_existing=True)
+
+        self.assertEqual(stats.books_indexed, 0)
+        self.assertEqual(stats.books_skipped, 1)
+        self.assertEqual(self.indexer.get_indexed_sources()["/books/repo1"]["fingerprint"], "git:def")
+
+    def test_remove_source(self):
+        """Test removing a source deletes its book"""
+        self.indexer.bulk_index([self._sourced_content("book1", "/books/repo1", "git:abc")])
+
+        self.assertTrue(self.indexer.remove_source("/books/repo1"))
+
+        self.assertEqual(self.indexer.get_indexed_sources(), {})
+        self.assertEqual(self.indexer.get_index_stats().total_books, 0)
+
+    def test_compute_source_fingerprint_tracks_mtime(self):
+        """Test directory fingerprints change when files change"""
+        source_dir = Path(self.temp_dir) / "repo"
+        source_dir.mkdir()
+        (source_dir / "module.cnxml").write_text("<document/>")
+        before = compute_source_fingerprint(str(source_dir))
+
+        self.assertEqual(before, compute_source_fingerprint(str(source_dir)))
+
+        (source_dir / "extra.cnxml").write_text("<document/>")
+        self.assertNotEqual(before, compute_source_fingerprint(str(source_dir)))
+
+
+@unittest.skipUnless(SearchIndexer.fts5_available(), "SQLite FTS5 not available")
+class TestSearchIndexerFTS5(unittest.TestCase):
+    """Test cases for the FTS5 search engine"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = OpenBooksConfig()
+        self.config.search_index_dir = os.path.join(self.temp_dir, 'search_index')
+        self.indexer = SearchIndexer(self.config, engine='fts5')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_fts_tables_created(self):
+        """Test FTS5 tables exist when the engine is selected"""
+        self.assertEqual(self.indexer.engine, 'fts5')
+        with sqlite3.connect(self.indexer.db_path) as conn:
+            cursor = conn.cursor()
+            for table in ('chapters_fts', 'formulas_fts'):
+                cursor.execute("SELECT name FROM sqlite_master WHERE name = ?", (table,))
+                self.assertIsNotNone(cursor.fetchone())
+
+    def test_invalid_engine(self):
+        """Test unknown engines are rejected"""
+        with self.assertRaises(ValueError):
+            SearchIndexer(self.config, engine='lucene')
+
+    def test_search_text_bm25_with_snippet(self):
+        """Test FTS5 text search returns highlighted snippets"""
+        self.indexer.index_content(make_content())
+
+        results = self.indexer.search("acceleration", search_type="text")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].chapter_title, "Force and Motion")
+        self.assertGreater(results[0].relevance_score, 0)
+        self.assertIn("**acceleration**", results[0].content_snippet)
+
+    def test_phrase_and_prefix_queries(self):
+        """Test phrase and prefix query syntax"""
+        self.indexer.index_content(make_content())
+
+        phrase_results = self.indexer.search('"second law"', search_type="text")
+        self.assertEqual([r.chapter_number for r in phrase_results], ["1"])
+
+        self.assertEqual(self.indexer.search('"law second"', search_type="text"), [])
+
+        prefix_results = self.indexer.search("thermo*", search_type="text")
+        self.assertEqual([r.chapter_number for r in prefix_results], ["2"])
+
+    def test_search_formula_context(self):
+        """Test formula contexts are searchable"""
+        self.indexer.index_content(make_content())
+
+        results = self.indexer.search("newton", search_type="formula")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].match_type, "formula")
+        self.assertIn("F = ma", results[0].content_snippet)
+
+    def test_build_fts_query_escapes_operators(self):
+        """Test user input cannot inject FTS5 syntax"""
+        self.assertEqual(self.indexer._build_fts_query('force NEAR(motion'), '"force" "near" "motion"')
+        self.assertEqual(self.indexer._build_fts_query('the'), '')
+        self.assertEqual(self.indexer._build_fts_query('"Second Law" therm*'), '"second law" "therm"*')
+
+    def test_migrate_to_fts5(self):
+        """Test migrating an existing terms index to FTS5"""
+        legacy_config = OpenBooksConfig()
+        legacy_config.search_index_dir = os.path.join(self.temp_dir, 'legacy_index')
+        legacy = SearchIndexer(legacy_config, engine='terms')
+        legacy.index_content(make_content())
+
+        self.assertTrue(legacy.migrate_to_fts5())
+        self.assertEqual(legacy.engine, 'fts5')
+
+        results = legacy.search("entropy", search_type="text")
+        self.assertEqual([r.chapter_number for r in results], ["2"])
+
+
+    def test_remove_book_clears_fts_rows(self):
+        """Test removed books no longer match FTS queries"""
+        self.indexer.index_content(make_content("book1"))
+        self.indexer.index_content(make_content("book2"))
+
+        self.indexer.remove_book("book1")
+
+        results = self.indexer.search("entropy", search_type="text")
+        self.assertEqual([r.book_id for r in results], ["book2"])
+
+    def test_bulk_index_populates_fts(self):
+        """Test bulk loads are searchable through FTS5"""
+        self.indexer.bulk_index(make_content(f"book{i}") for i in range(3))
+
+        results = self.indexer.search('"heat engines"', search_type="text")
+        self.assertEqual(len(results), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file